@@ -0,0 +1,13 @@
+import pytest
+
+from wage_app import shared_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    # a private cache directory and an in-process backend for each test
+    root = tmp_path / "cache"
+    monkeypatch.setenv("WAGE_CACHE_DIR", str(root))
+    monkeypatch.setenv("WAGE_CACHE_BACKEND", "process")
+    monkeypatch.setattr(shared_cache, "_backend", None)
+    return root
@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+from wage_app.anomalies import SUPPRESSED, compute_flags
+
+
+def test_hourly_only_rows_are_not_suppressed():
+    panel = pd.DataFrame({
+        "year": [2020, 2020, 2020, 2020],
+        "STATE": ["TX", "TX", "TX", "TX"],
+        "OCC_CODE": ["27-2042", "15-1252", "11-1011", "35-2014"],
+        # hourly-only, annual and hourly, neither mean published, employment withheld
+        "TOT_EMP": [1200.0, 50000.0, 800.0, np.nan],
+        "A_MEAN": [np.nan, 120000.0, np.nan, 30000.0],
+        "H_MEAN": [41.5, 57.7, np.nan, 14.4],
+    })
+    suppressed = (compute_flags(panel) & SUPPRESSED) != 0
+    assert suppressed.tolist() == [False, False, True, True]
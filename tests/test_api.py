@@ -0,0 +1,106 @@
+import http.client
+import json
+import queue
+import threading
+
+import pandas as pd
+import pytest
+
+from wage_app import api, loaders, shared_cache
+
+OCCUPATIONS = {"15-1252": "Software Developers", "29-1141": "Registered Nurses"}
+
+
+class Service(api.QueryService):
+    ROUTES = {**api.QueryService.ROUTES, "/boom": "boom"}
+
+    def boom(self, params):
+        raise RuntimeError("handler exploded")
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    root = tmp_path_factory.mktemp("api")
+    (root / "cleaned_data").mkdir()
+    for year in (2023, 2024):
+        rows = [
+            {"STATE": state, "OCC_CODE": code, "OCC_TITLE": title, "TOT_EMP": 1000 + year % 10,
+             "A_MEAN": 60000.0, "H_MEAN": 28.85}
+            for state in ("Texas", "Ohio") for code, title in OCCUPATIONS.items()
+        ]
+        pd.DataFrame(rows).to_csv(root / "cleaned_data" / f"data_{year}.csv", index=False)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(root)
+        mp.setenv("WAGE_CACHE_BACKEND", "process")
+        mp.setattr(shared_cache, "_backend", None)
+        ready = queue.Queue()
+        # the server thread runs until the test process exits
+        thread = threading.Thread(
+            target=api.serve, args=(Service(),), kwargs=dict(port=0, workers=2, ready=ready.put), daemon=True
+        )
+        thread.start()
+        port = ready.get(timeout=60).sockets[0].getsockname()[1]
+        yield port
+
+
+def request(port, target, method="GET"):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        conn.request(method, target)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        conn.close()
+
+
+def test_health(server):
+    status, body = request(server, "/health")
+    assert status == 200
+    assert body["status"] == "ok"
+    assert body["rows"] == 8
+    assert body["years"] == [2023, 2024]
+
+
+def test_search(server):
+    status, body = request(server, "/search?q=nurses%20in%20ohio")
+    assert status == 200
+    assert body["occupations"]["data"]["OCC_CODE"][0] == "29-1141"
+    assert body["states"] == ["Ohio"]
+    # served again from the response cache
+    assert request(server, "/search?q=nurses%20in%20ohio") == (status, body)
+
+
+def test_bad_request(server):
+    status, body = request(server, "/aggregate?agg=mode")
+    assert status == 400
+    assert "agg must be one of" in body["error"]
+
+
+def test_unknown_endpoint(server):
+    status, body = request(server, "/nope")
+    assert status == 404
+    assert "/health" in body["endpoints"]
+
+
+def test_only_get(server):
+    status, body = request(server, "/health", method="POST")
+    assert status == 405
+
+
+def test_failing_handler(server):
+    status, body = request(server, "/boom")
+    assert status == 500
+    assert body["error"] == "RuntimeError: handler exploded"
+    # the connection pool and the server survive
+    assert request(server, "/health")[0] == 200
+
+
+def test_failing_version_check(monkeypatch):
+    def missing(*args, **kwargs):
+        raise OSError("cleaned_data is gone")
+
+    monkeypatch.setattr(loaders, "data_version", missing)
+    status, body = api.QueryService().dispatch("/health")
+    assert status == 500
+    assert json.loads(body)["error"] == "OSError: cleaned_data is gone"
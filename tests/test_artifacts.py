@@ -0,0 +1,74 @@
+import os
+import threading
+
+from wage_app import artifacts
+from wage_app.artifacts import ArtifactStore, artifact_key, partition_hash
+
+PAYLOAD = b"x" * 1000  # pickles to a little over 1 KB
+
+
+def build_counter(calls):
+    def build():
+        calls.append(1)
+        return PAYLOAD, {"metrics": {"RMSE": 1.0}}
+    return build
+
+
+def test_unchanged_hash_skips_the_fit(tmp_path, cache_dir):
+    year = tmp_path / "data_2020.csv"
+    year.write_text("STATE,A_MEAN\nTexas,1\n")
+    store = ArtifactStore(tmp_path / "artifacts", 10 ** 6)
+    calls = []
+    key = artifact_key("rf", {"n_estimators": 10}, [partition_hash(year)], artifacts.code_hash(build_counter))
+    record, built = store.fit(key, build_counter(calls))
+    assert built and record["metrics"] == {"RMSE": 1.0}
+
+    # rewriting the same bytes (new mtime) keeps the key, so the stored fit is reused
+    year.write_text("STATE,A_MEAN\nTexas,1\n")
+    os.utime(year, (1, 1))
+    same = artifact_key("rf", {"n_estimators": 10}, [partition_hash(year)], artifacts.code_hash(build_counter))
+    assert same == key
+    assert store.fit(same, build_counter(calls)) == (record, False)
+    assert store.load_model(key) == PAYLOAD
+    assert len(calls) == 1
+
+    year.write_text("STATE,A_MEAN\nTexas,2\n")
+    changed = artifact_key("rf", {"n_estimators": 10}, [partition_hash(year)], artifacts.code_hash(build_counter))
+    assert changed != key
+    assert store.fit(changed, build_counter(calls))[1]
+    assert len(calls) == 2
+
+
+def test_least_recently_used_artifacts_are_evicted(tmp_path, cache_dir):
+    store = ArtifactStore(tmp_path / "artifacts", 2600)  # room for two artifacts
+    calls = []
+    store.fit("a", build_counter(calls))
+    store.fit("b", build_counter(calls))
+    for key, used in (("a", 1000), ("b", 2000)):
+        for path in store._paths(key):
+            os.utime(path, (used, used))
+    assert store.record("a") is not None  # a read makes "a" the most recently used
+
+    store.fit("c", build_counter(calls))
+    assert [key for _, _, key in store.entries()] == ["a", "c"]
+    assert store.record("b") is None
+    assert store.size() <= store.budget_bytes
+
+    # an evicted key is fitted again on the next request
+    assert store.fit("b", build_counter(calls))[1]
+    assert len(calls) == 4
+
+
+def test_concurrent_writers_stay_within_budget(tmp_path, cache_dir):
+    store = ArtifactStore(tmp_path / "artifacts", 5000)
+    calls = []
+    threads = [threading.Thread(target=store.fit, args=(f"k{i}", build_counter(calls))) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 16
+    assert store.size() <= store.budget_bytes
+    # every remaining artifact is complete: no model without its record or the other way round
+    names = {path.name for path in store.root.iterdir()}
+    assert all(f"{key}.json" in names and f"{key}.pkl" in names for _, _, key in store.entries())
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from wage_app.engine import Query, corr
+
+TITLES = ["Chefs", "Nurses", "Pilots", "Software Developers", "Teachers"]
+
+
+def year_frame(year, states, seed):
+    rng = np.random.default_rng(seed)
+    n = 200
+    frame = pd.DataFrame({
+        "year": year,
+        "STATE": rng.choice(states + [None], n),
+        "OCC_TITLE": rng.choice(TITLES, n),
+        "TOT_EMP": rng.integers(10, 5000, n).astype(float),
+        "A_MEAN": rng.normal(60000, 15000, n).round(),
+    })
+    frame.loc[rng.random(n) < 0.1, "A_MEAN"] = np.nan
+    # like the optimized cleaned years, text columns are categoricals and every year has its own categories
+    frame["STATE"] = frame["STATE"].astype("category")
+    frame["OCC_TITLE"] = frame["OCC_TITLE"].astype("category")
+    return frame
+
+
+@pytest.fixture(scope="module")
+def sources():
+    return year_frame(2023, ["Ohio", "Texas"], 0), year_frame(2024, ["Alaska", "Ohio", "Utah"], 1)
+
+
+def plan(sources):
+    return (
+        Query(*sources)
+        .fill_null("STATE", "Unknown")
+        .where("OCC_TITLE", "in", ["Chefs", "Nurses", "Pilots"])
+        .where("A_MEAN", "notnull")
+        .group_by("STATE", "OCC_TITLE")
+        .agg(rows=("size",), TOT_EMP=("TOT_EMP", "sum"), A_MEAN=("A_MEAN", "mean"), paid=("A_MEAN", "count"))
+        .sort("TOT_EMP")
+        .head(8)
+    )
+
+
+def normalized(frame):
+    # engines differ only in dtypes (categorical vs string keys, int widths)
+    out = frame.astype({"STATE": str, "OCC_TITLE": str, "rows": "int64", "paid": "int64", "TOT_EMP": float})
+    return out.reset_index(drop=True)
+
+
+@pytest.mark.parametrize("engine", ["arrow", "polars"])
+def test_engines_match_pandas(sources, engine):
+    if engine == "polars":
+        pytest.importorskip("polars")
+    expected = normalized(plan(sources).collect("pandas"))
+    assert len(expected) == 8
+    assert "Unknown" in set(normalized(plan(sources).head(None).collect("pandas"))["STATE"])
+    assert_frame_equal(normalized(plan(sources).collect(engine)), expected)
+
+
+@pytest.mark.parametrize("engine", ["arrow", "polars"])
+def test_single_source_without_fill(sources, engine):
+    if engine == "polars":
+        pytest.importorskip("polars")
+    query = Query(sources[1]).group_by("STATE").agg(rows=("size",)).sort("rows", descending=False)
+    expected = query.collect("pandas").astype({"STATE": str, "rows": "int64"})
+    result = query.collect(engine).astype({"STATE": str, "rows": "int64"})
+    # missing states are dropped, as pandas' groupby does
+    assert set(result["STATE"]) == {"Alaska", "Ohio", "Utah"}
+    assert_frame_equal(result, expected)
+
+
+def test_corr_matches_pandas_with_missing_values():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=300)
+    frame = pd.DataFrame({
+        "a": x,
+        "b": 2 * x + rng.normal(size=300),
+        "c": rng.normal(size=300),
+        "constant": 1.0,
+        "empty": np.nan,
+        "label": "text",
+    })
+    for col, share in (("a", 0.1), ("b", 0.3), ("c", 0.5)):
+        frame.loc[rng.random(300) < share, col] = np.nan
+    expected = frame.select_dtypes(include=[np.number]).corr()
+    assert_frame_equal(corr(frame, "arrow"), expected, atol=1e-10)
+    assert_frame_equal(corr(frame, "pandas"), expected)
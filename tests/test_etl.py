@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+import pytest
+
+from wage_app import etl
+
+
+@pytest.fixture
+def raw(tmp_path):
+    # two years of stand-in workbooks; plan() only fingerprints their bytes
+    for folder, year in (("oesm19st", 2019), ("oesm20st", 2020)):
+        (tmp_path / "data" / folder).mkdir(parents=True)
+        (tmp_path / "data" / folder / f"state_M{year}_dl.xlsx").write_bytes(f"workbook {year}".encode())
+    return tmp_path
+
+
+def cleaned(raw):
+    # a manifest and outputs as left by a finished run
+    out = raw / "cleaned_data"
+    out.mkdir(exist_ok=True)
+    sources = etl.discover_sources(raw / "data")
+    manifest = {"years": {}}
+    for year, paths in sources.items():
+        fingerprint, entries = etl.fingerprint_sources(paths)
+        manifest["years"][year] = {"fingerprint": fingerprint, "sources": entries}
+        (out / f"data_{year}.csv").write_text("OCC_TITLE\nChefs\n")
+    return sources, manifest, out
+
+
+def test_plan_unchanged_sources(raw):
+    sources, manifest, out = cleaned(raw)
+    stale, _ = etl.plan(sources, manifest, out)
+    assert stale == {}
+    assert set(etl.plan(sources, manifest, out, force=True)[0]) == {"2019", "2020"}
+
+
+def test_plan_touched_source(raw):
+    sources, manifest, out = cleaned(raw)
+    workbook = sources["2020"][0]
+    # a new mtime with the same bytes is re-hashed but still up to date
+    os.utime(workbook, (1, 1))
+    assert etl.plan(sources, manifest, out)[0] == {}
+    workbook.write_bytes(b"workbook 2020, revised")
+    assert list(etl.plan(sources, manifest, out)[0]) == ["2020"]
+
+
+def test_plan_missing_output(raw):
+    sources, manifest, out = cleaned(raw)
+    (out / "data_2019.csv").unlink()
+    assert list(etl.plan(sources, manifest, out)[0]) == ["2019"]
+    # with --parquet a year without its parquet copy is stale as well
+    assert set(etl.plan(sources, manifest, out, parquet=True)[0]) == {"2019", "2020"}
+
+
+def test_run_keeps_going_after_a_bad_workbook(raw):
+    good = pd.DataFrame({
+        "AREA_TITLE": ["Texas", "Texas"], "OCC_CODE": ["00-0000", "35-1011"],
+        "OCC_TITLE": ["All Occupations", "Chefs and Head Cooks"], "TOT_EMP": ["12,000", "**"], "A_MEAN": [56000, 61000],
+    })
+    good.to_excel(raw / "data" / "oesm19st" / "state_M2019_dl.xlsx", index=False)
+    logged = []
+    written, failed = etl.run(raw / "data", raw / "cleaned_data", jobs=1, log=logged.append)
+    assert (written, failed) == (["2019"], ["2020"])
+    assert any(line.startswith("  2020: failed") for line in logged)
+
+    df = pd.read_csv(raw / "cleaned_data" / "data_2019.csv")
+    assert df["OCC_TITLE"].tolist() == ["Chefs and Head Cooks"] and df["TOT_EMP"].isna().all()
+    manifest = etl.load_manifest(raw / "cleaned_data")
+    assert list(manifest["years"]) == ["2019"]
+    assert (raw / "cleaned_data" / etl.COMBINED_NAME).exists()
+    assert not [p for p in (raw / "cleaned_data").iterdir() if p.suffix == ".tmp"]
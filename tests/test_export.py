@@ -0,0 +1,101 @@
+import gc
+import gzip
+import io
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from wage_app.export import SpooledExport, spool_export, stream_export
+from wage_app.query import PanelStore
+
+
+@pytest.fixture
+def store():
+    rows = []
+    for year in (2022, 2023, 2024):
+        for state in ("Texas", "Ohio", "Alaska"):
+            for i, code in enumerate(("15-1252", "29-1141")):
+                mean = np.nan if (state == "Alaska" and year == 2023) else 50000.0 + 1000 * i + year
+                rows.append({"year": year, "STATE": state, "OCC_CODE": code, "TOT_EMP": 100 + i, "A_MEAN": mean})
+    panel = pd.DataFrame(rows)
+    panel["STATE"] = panel["STATE"].astype("category")
+    return PanelStore(panel, "test")
+
+
+def expected(store, rows, columns):
+    frame = store.select(rows, columns).reset_index(drop=True)
+    # categories are written out as plain strings
+    return frame.assign(**{c: frame[c].astype(str) for c in frame.columns if frame[c].dtype == "category"})
+
+
+def test_csv_round_trip(store):
+    rows = store.rows(years=[2023, 2024], states=["Alaska", "Texas"])
+    columns = ["year", "STATE", "OCC_CODE", "A_MEAN"]
+    # small chunks so the gzip stream spans several frames and writes the header once
+    data = b"".join(stream_export(store, rows, columns, "csv", chunk_rows=3))
+    back = pd.read_csv(io.BytesIO(gzip.decompress(data)))
+    assert_frame_equal(back, expected(store, rows, columns), check_dtype=False)
+
+
+def test_parquet_round_trip(store):
+    rows = store.rows(occ_codes=["29-1141"])
+    data = b"".join(stream_export(store, rows, None, "parquet", chunk_rows=2))
+    back = pd.read_parquet(io.BytesIO(data))
+    assert_frame_equal(back, expected(store, rows, None), check_dtype=False)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_spool_export_writes_the_whole_stream(store, fmt):
+    rows = store.rows(states=["Ohio"])
+    path, size = spool_export(store, rows, fmt=fmt)
+    try:
+        assert os.path.getsize(path) == size
+        with open(path, "rb") as f:
+            assert f.read() == b"".join(stream_export(store, rows, fmt=fmt))
+    finally:
+        os.remove(path)
+
+
+def test_unknown_format(store):
+    with pytest.raises(ValueError, match="format must be one of"):
+        stream_export(store, store.rows(), fmt="xlsx")
+
+
+def test_spooled_file_removed_with_its_owner(tmp_path):
+    path = tmp_path / "export.csv.gz"
+    path.write_bytes(b"data")
+    spooled = SpooledExport(str(path), 4, "export.csv.gz", "application/gzip", ())
+    del spooled
+    gc.collect()
+    assert not path.exists()
+
+    path.write_bytes(b"data")
+    spooled = SpooledExport(str(path), 4, "export.csv.gz", "application/gzip", ())
+    spooled.discard()
+    assert not path.exists()
+    spooled.discard()  # a second discard (or the later finalizer) is a no-op
+
+
+def test_tab_refuses_exports_over_the_download_limit(tmp_path, monkeypatch, cache_dir):
+    from streamlit.testing.v1 import AppTest
+
+    (tmp_path / "cleaned_data").mkdir()
+    frame = pd.DataFrame({"STATE": ["Texas", "Ohio"], "OCC_CODE": ["15-1252"] * 2, "OCC_TITLE": ["Software Developers"] * 2,
+                          "TOT_EMP": [100, 200], "A_MEAN": [90000.0, 80000.0]})
+    frame.to_csv(tmp_path / "cleaned_data" / "data_2024.csv", index=False)
+    spool_dir = tmp_path / "spool"
+    spool_dir.mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tempfile, "tempdir", str(spool_dir))
+
+    script = "from wage_app.tabs import export\nexport.MAX_DOWNLOAD_BYTES = 10\nexport.render()\n"
+    at = AppTest.from_string(script, default_timeout=60).run()
+    at.button[0].click().run()
+    assert not at.exception
+    assert "the download button can hold" in at.warning[0].value
+    assert "export_file" not in at.session_state
+    assert list(spool_dir.iterdir()) == []
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import plotly.graph_objects as go
+
+from wage_app import figure_cache
+
+
+def test_cached_figure_builds_once_per_version(cache_dir, monkeypatch):
+    monkeypatch.setattr(figure_cache, "FIGURE_BUILDERS", {})
+    monkeypatch.setattr(figure_cache, "_data_versions", {})
+    monkeypatch.setattr(figure_cache, "_figures", {})
+    calls, data = [], {"version": "a"}
+
+    @figure_cache.register_figure("test.bars", data_version=lambda: data["version"])
+    def bars():
+        calls.append(data["version"])
+        return go.Figure(go.Bar(x=["a", "b"], y=[1, len(calls)]))
+
+    first = figure_cache.cached_figure("test.bars")
+    assert figure_cache.cached_figure("test.bars") is first
+    assert calls == ["a"]
+
+    # a new process still finds the spec in the shared cache without building it
+    monkeypatch.setattr(figure_cache, "_figures", {})
+    assert figure_cache.cached_figure("test.bars").data[0].y == (1, 1)
+    assert calls == ["a"]
+
+    data["version"] = "b"
+    assert figure_cache.cached_figure("test.bars").data[0].y == (1, 2)
+    assert calls == ["a", "b"]
+
+
+def test_conclusion_tab_imports_no_plotting_libraries():
+    # every chart comes from the cache, so the tab module itself must stay light
+    code = "import sys, wage_app.tabs.conclusion; print(any(m in sys.modules for m in ('pandas', 'plotly.express')))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent.parent)
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from wage_app.forecast import backtest, build_forecasts, forecast_matrix
+
+YEARS = list(range(2010, 2020))
+
+
+def panel(series):
+    # series: {(state, code): {year: A_MEAN}}
+    rows = [
+        {"STATE": state, "OCC_CODE": code, "OCC_TITLE": code, "year": year, "A_MEAN": value}
+        for (state, code), values in series.items() for year, value in values.items()
+    ]
+    return pd.DataFrame(rows)
+
+
+def growing(years, start=60000.0, rate=0.04):
+    return {year: start * (1 + rate) ** (year - years[0]) * (1.01 if year % 2 else 0.99) for year in years}
+
+
+def forecast_for(frame, state, code):
+    return frame.set_index(["STATE", "OCC_CODE"]).loc[(state, code)]
+
+
+def test_trailing_gap_is_not_counted_twice():
+    full = growing(YEARS)
+    gapped = {year: value for year, value in full.items() if year <= 2017}
+    frame = build_forecasts(panel({("TX", "A"): full, ("TX", "B"): gapped}))
+    row = forecast_for(frame, "TX", "B")
+    assert row["forecast_year"] == 2020 and row["last_year"] == 2017
+
+    # the same history forecast three years ahead from 2017 directly
+    own = np.array([[gapped[y] for y in range(2010, 2018)]])
+    expected = forecast_matrix(own, list(range(2010, 2018)), horizon=3)
+    assert np.isclose(row["forecast"], expected["forecast"][0])
+    assert np.isclose(row["upper_95"], expected["upper_95"][0])
+    # with a damped trend a three-year-ahead forecast stays close to the trend line
+    assert row["forecast"] < full[2017] * 1.04 ** 3 * 1.02
+
+
+def test_missing_year_columns_follow_year_labels():
+    full = growing(YEARS)
+    # no cleaned file for 2014 at all vs. one series skipping 2014 in an otherwise complete panel
+    without_year = {year: value for year, value in full.items() if year != 2014}
+    skipped = forecast_for(build_forecasts(panel({("TX", "A"): without_year, ("TX", "B"): full})), "TX", "A")
+    missing = forecast_for(build_forecasts(panel({("TX", "A"): without_year})), "TX", "A")
+    assert np.isclose(skipped["forecast"], missing["forecast"])
+    assert np.isclose(skipped["lower_80"], missing["lower_80"])
+
+
+def test_empty_panel():
+    # e.g. a checkout with only LFS pointers, offline
+    assert build_forecasts(pd.DataFrame()).empty
+    assert backtest(pd.DataFrame()) is None
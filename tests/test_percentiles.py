@@ -0,0 +1,45 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from wage_app.percentiles import combine_percentiles, fill_percentiles
+
+LOW = [10.0, 20.0, 30.0, 40.0, 50.0]
+HIGH = [110.0, 120.0, 130.0, 140.0, 150.0]
+
+
+def test_single_cell_returns_its_own_percentiles():
+    result = combine_percentiles(np.array([LOW]), [250.0], [0])
+    assert_allclose(result, [LOW])
+
+
+def test_two_disjoint_cells():
+    # with equal employment the lower half of the mixture is the low cell, the upper half the high one
+    out = [0.05, 0.125, 0.25, 0.45, 0.55, 0.75, 0.95]
+    result = combine_percentiles(np.array([LOW, HIGH]), [100.0, 100.0], [0, 0], out_quantiles=out)
+    assert_allclose(result, [[10.0, 20.0, 30.0, 50.0, 110.0, 130.0, 150.0]])
+
+
+def test_weighted_by_employment():
+    # 3:1 employment puts 75% of the mass in the low cell
+    result = combine_percentiles(np.array([LOW, HIGH]), [300.0, 100.0], [0, 0], out_quantiles=[0.375, 0.875])
+    assert_allclose(result, [[30.0, 130.0]])
+    # splitting a cell into two identical ones changes nothing
+    split = combine_percentiles(np.array([LOW, LOW]), [30.0, 70.0], [0, 0])
+    assert_allclose(split, [LOW])
+
+
+def test_missing_percentiles_are_filled_from_neighbours():
+    pcts = np.array([[10.0, np.nan, 30.0, 40.0, np.nan], [np.nan, np.nan, 30.0, np.nan, np.nan]])
+    filled = fill_percentiles(pcts)
+    assert_allclose(filled[0], [10.0, 17.5, 30.0, 40.0, 46.0])
+    assert_allclose(filled[1], pcts[1])
+    # a cell with a single published percentile cannot be placed and is left out of its group
+    result = combine_percentiles(pcts, [100.0, 900.0], [0, 0])
+    assert_allclose(result, filled[:1])
+
+
+def test_zero_employment_group_is_nan():
+    result = combine_percentiles(np.array([LOW, HIGH, LOW]), [0.0, np.nan, 50.0], [0, 0, 2], n_groups=3)
+    assert np.isnan(result[:2]).all()
+    assert_allclose(result[2], LOW)
+    assert np.isnan(combine_percentiles(np.array([LOW]), [0.0], [0])).all()
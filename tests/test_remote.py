@@ -0,0 +1,150 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from wage_app import remote
+from wage_app.loadtest import StubGitHub
+
+CSV = b"STATE,OCC_CODE,A_MEAN\nTexas,15-1252,120000\nOhio,15-1252,98000\n"
+
+
+def pointer(data):
+    return f"version https://git-lfs.github.com/spec/v1\noid sha256:{hashlib.sha256(data).hexdigest()}\nsize {len(data)}\n".encode()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    # a checkout with one LFS-tracked year: the pointer in the tree, the object under .git/lfs
+    root = tmp_path / "repo"
+    (root / "cleaned_data").mkdir(parents=True)
+    (root / "cleaned_data" / "data_2020.csv").write_bytes(pointer(CSV))
+    oid = hashlib.sha256(CSV).hexdigest()
+    objects = root / ".git" / "lfs" / "objects" / oid[:2] / oid[2:4]
+    objects.mkdir(parents=True)
+    (objects / oid).write_bytes(CSV)
+    return root
+
+
+def test_parse_lfs_pointer():
+    oid = hashlib.sha256(CSV).hexdigest()
+    assert remote.parse_lfs_pointer(pointer(CSV)) == (oid, len(CSV))
+    assert remote.parse_lfs_pointer(CSV) is None
+    assert remote.parse_lfs_pointer(b"version https://git-lfs.github.com/spec/v1\noid sha256:abc\nsize 3\n") is None
+
+
+def test_lfs_pointer_resolves_through_media(repo, cache_dir):
+    with StubGitHub(repo) as stub:
+        path = remote.fetch_file("cleaned_data/data_2020.csv", sha="blob")
+        assert path.read_bytes() == CSV
+        assert path.parent == cache_dir / "lfs"
+        # a local pointer resolves to the same cached object without downloading it again
+        requests = stub.requests
+        assert remote.resolve_pointer(repo / "cleaned_data" / "data_2020.csv") == path
+        assert stub.requests == requests
+
+
+def test_lfs_object_must_match_its_pointer(repo, cache_dir):
+    (repo / "cleaned_data" / "data_2021.csv").write_bytes(pointer(b"something else\n"))
+    oid = hashlib.sha256(b"something else\n").hexdigest()
+    objects = repo / ".git" / "lfs" / "objects" / oid[:2] / oid[2:4]
+    objects.mkdir(parents=True)
+    (objects / oid).write_bytes(b"tampered object\n")
+    with StubGitHub(repo):
+        with pytest.raises(ValueError, match="does not match"):
+            remote.fetch_file("cleaned_data/data_2021.csv")
+    assert not list((cache_dir / "lfs").iterdir())
+
+
+def test_range_requests_are_coalesced(tmp_path, cache_dir):
+    data = bytes(range(256)) * 1024
+    (tmp_path / "blob.bin").write_bytes(data)
+    with StubGitHub(tmp_path) as stub:
+        source = remote.HttpRangeFile(f"{stub.url}/raw/blob.bin", len(data), readahead=1024)
+        # three ranges within COALESCE_GAP of each other and one far away: two requests
+        source.prefetch([(1000, 2000), (2100, 3000), (4000, 5000), (200_000, 201_000)])
+        assert source.requests == 2
+        assert source.bytes_fetched == (5000 - 1000) + 1000
+        source.seek(2500)
+        assert source.read(1000) == data[2500:3500]
+        source.seek(200_500)
+        assert source.read(100) == data[200_500:200_600]
+        assert source.requests == 2
+
+
+class _IgnoresRange(BaseHTTPRequestHandler):
+    body = b""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+
+def test_server_ignoring_range_keeps_the_whole_body(cache_dir):
+    data = np.arange(50_000, dtype=np.int32).tobytes()
+    handler = type("Handler", (_IgnoresRange,), {"body": data})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        source = remote.HttpRangeFile(f"http://127.0.0.1:{server.server_port}/blob", len(data), readahead=1024)
+        source.seek(4000)
+        assert source.read(100) == data[4000:4100]
+        source.seek(150_000)
+        assert source.read(10) == data[150_000:150_010]
+        assert source.requests == 1
+        assert source.bytes_fetched == len(data)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_read_parquet_prunes_columns_and_row_groups(tmp_path, cache_dir):
+    states = ["Alabama", "Ohio", "Texas", "Utah"]
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "STATE": np.repeat(states, 5000),
+        "OCC_CODE": [f"{i % 800:02d}-0000" for i in range(20_000)],
+        "A_MEAN": rng.uniform(30_000, 150_000, 20_000),
+        "H_MEAN": rng.uniform(15, 75, 20_000),
+        "TOT_EMP": rng.integers(10, 10_000, 20_000),
+    })
+    folder = tmp_path / "cleaned_data" / "parquet"
+    folder.mkdir(parents=True)
+    path = folder / "data_2020.parquet"
+    # one state per row group, as the ETL writes them sorted by STATE
+    pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), path, row_group_size=5000)
+
+    with StubGitHub(tmp_path) as stub:
+        url = f"{stub.url}/raw/cleaned_data/parquet/data_2020.parquet"
+        df, stats = remote.read_parquet(url, path.stat().st_size, columns=["STATE", "A_MEAN"], states=["Texas"])
+    expected = frame.loc[frame["STATE"] == "Texas", ["STATE", "A_MEAN"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert stats["row_groups"] == "1 of 4"
+    assert stats["bytes_fetched"] < stats["file_size"] / 2
+
+
+def test_listing_ttl(repo, cache_dir, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(remote, "_listings", {})
+    monkeypatch.setattr(remote, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    with StubGitHub(repo) as stub:
+        assert set(remote.listing("cleaned_data")) == {"data_2020.csv"}
+        (repo / "cleaned_data" / "data_2021.csv").write_bytes(CSV)
+        clock[0] += remote.LISTING_TTL - 1
+        assert set(remote.listing("cleaned_data")) == {"data_2020.csv"}
+        assert stub.requests == 1
+        clock[0] += 2
+        assert set(remote.listing("cleaned_data")) == {"data_2020.csv", "data_2021.csv"}
+        assert stub.requests == 2
+        assert remote.listing("missing") == {}
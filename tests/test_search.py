@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from wage_app.search import SearchIndex, normalize
+
+OCCUPATIONS = {
+    "15-1252": "Software Developers",
+    "15-1253": "Software Quality Assurance Analysts and Testers",
+    "29-1141": "Registered Nurses",
+    "35-2014": "Cooks, Restaurant",
+    "13-2011": "Accountants and Auditors",
+}
+
+
+@pytest.fixture(scope="module")
+def index():
+    rows = []
+    for year in (2019, 2020):
+        for state in ("Texas", "Ohio", "Tennessee"):
+            for code, title in OCCUPATIONS.items():
+                if state == "Ohio" and code == "35-2014":
+                    continue
+                # 15-1252 was retitled in 2020
+                if code == "15-1252" and year == 2019:
+                    title = "Software Developers, Applications"
+                rows.append({"year": year, "STATE": state, "OCC_CODE": code, "OCC_TITLE": title, "TOT_EMP": 100.0})
+    # shuffled so the index has to sort the panel itself
+    return SearchIndex(pd.DataFrame(rows).sample(frac=1, random_state=0))
+
+
+def codes(matches):
+    return [code for code, _, _ in matches]
+
+
+def test_occupation_in_state(index):
+    occupations, states = index.parse("software developers in texas")
+    assert codes(occupations)[0] == "15-1252"
+    assert occupations[0][1] == "Software Developers"
+    assert states == ["Texas"]
+
+
+def test_state_only_query(index):
+    occupations, states = index.parse("Ohio")
+    assert occupations == [] and states == ["Ohio"]
+    assert codes(index.occupations_in("Ohio")) == ["13-2011", "29-1141", "15-1252", "15-1253"]
+
+
+def test_typos_use_the_trigram_index(index):
+    occupations, states = index.parse("sofware develpers in tennesee")
+    assert codes(occupations) == ["15-1252"]
+    assert states == ["Tennessee"]
+    # " in " followed by something that is no state stays part of the occupation query
+    assert index.parse("nurses in nowhere")[1] == []
+
+
+def test_empty_query(index):
+    assert index.parse("") == ([], [])
+    assert index.parse("   ") == ([], [])
+
+
+def test_prefix_ranking(index):
+    # prefix hits come before fuzzy ones, shorter titles first; codes and old titles match too
+    assert codes(index.search_occupations("soft")) == ["15-1252", "15-1253"]
+    assert codes(index.search_occupations("15-12")) == ["15-1252", "15-1253"]
+    assert codes(index.search_occupations("applications"))[:1] == ["15-1252"]
+    fuzzy = index.search_occupations("acountants")
+    assert codes(fuzzy) == ["13-2011"] and fuzzy[0][2] < 1
+
+
+def test_rows_are_slices_by_code_and_state(index):
+    rows = index.rows("15-1252", "Texas")
+    assert rows["year"].tolist() == [2019, 2020]
+    assert len(index.rows("15-1252")) == 6
+    assert index.rows("35-2014", "Ohio").empty
+    assert normalize("Cooks, Restaurant") == "cooks restaurant"
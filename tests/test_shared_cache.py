@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from wage_app.shared_cache import HostCacheBackend
+
+
+def test_host_frame_round_trip(tmp_path):
+    backend = HostCacheBackend(tmp_path)
+    df = pd.DataFrame({
+        "A_MEAN": [52000.5, np.nan, 61000.0],
+        "TOT_EMP": np.array([120, 30, 4500], dtype="int32"),
+        "STATE": pd.Categorical(["Texas", "Ohio", "Texas"]),
+        "OCC_TITLE": ["Chefs", None, "Nurses"],
+        "ANNUAL": pd.array([True, None, False], dtype=pd.ArrowDtype(pa.bool_())),
+    })
+    backend.put_frame("year", df)
+    out = backend.get_frame("year")
+    pd.testing.assert_frame_equal(out, df)
+    assert isinstance(out["STATE"].dtype, pd.CategoricalDtype)
+    assert isinstance(out["ANNUAL"].dtype, pd.ArrowDtype)
+    assert np.isnan(out["A_MEAN"].iloc[1])
+    assert backend.get_frame("missing") is None
+
+
+def test_frames_arrow_cannot_hold_are_pickled(tmp_path):
+    backend = HostCacheBackend(tmp_path)
+    df = pd.DataFrame({"mixed": [1, "a", b"raw"]})
+    backend.put_frame("mixed", df)
+    assert not list(backend.frames_dir.glob("*.arrow"))
+    pd.testing.assert_frame_equal(backend.get_frame("mixed"), df)
+
+
+def test_objects_are_shared_between_instances(tmp_path):
+    HostCacheBackend(tmp_path).put_object("listing", {"data_2020.csv": {"sha": "abc"}})
+    assert HostCacheBackend(tmp_path).get_object("listing") == {"data_2020.csv": {"sha": "abc"}}
+    assert HostCacheBackend(tmp_path).obj("listing", lambda: 1 / 0) == {"data_2020.csv": {"sha": "abc"}}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    backend = HostCacheBackend(tmp_path, budget_bytes=10 ** 9)
+    frame = pd.DataFrame({"x": np.arange(20_000, dtype="float64")})  # ~160 KB each
+    for key in ("old", "read", "new"):
+        backend.put_frame(key, frame)
+    backend.put_object("blob", b"x" * 100_000)
+    # last used: "old" long ago, "read" just now, the blob in between
+    os.utime(backend._frame_path("old"), (1000, 1000))
+    os.utime(backend._frame_path("read"), (3000, 3000))
+    os.utime(backend._frame_path("new"), (4000, 4000))
+    with backend._db() as db:
+        db.execute("UPDATE kv SET used = 2000 WHERE key = 'blob'")
+    assert backend.get_frame("read") is not None
+
+    def names():
+        return [name for _, _, _, name in backend.entries()]
+
+    backend.budget_bytes = backend.size() - 1
+    backend.evict()
+    assert names() == ["blob", backend._frame_path("new").name, backend._frame_path("read").name]
+    backend.budget_bytes = backend.size() - 1
+    backend.evict()
+    assert names() == [backend._frame_path("new").name, backend._frame_path("read").name]
+    assert backend.get_frame("old") is None and backend.get_object("blob") is None
+
+
+def test_put_never_evicts_the_entry_it_wrote(tmp_path):
+    backend = HostCacheBackend(tmp_path, budget_bytes=1)
+    df = backend.frame("big", lambda: pd.DataFrame({"x": np.arange(1000.0)}))
+    assert len(df) == 1000
+
+
+HOLD_LOCK = """
+import sys, time
+from wage_app.shared_cache import HostCacheBackend
+backend = HostCacheBackend(sys.argv[1])
+with backend.lock("year"):
+    start = time.time()
+    time.sleep(0.5)
+    print(start, time.time())
+"""
+
+
+def test_lock_is_held_across_processes(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    workers = [
+        subprocess.Popen([sys.executable, "-c", HOLD_LOCK, str(tmp_path)], cwd=root, stdout=subprocess.PIPE, text=True)
+        for _ in range(3)
+    ]
+    spans = sorted(tuple(map(float, w.communicate(timeout=60)[0].split())) for w in workers)
+    assert all(w.returncode == 0 for w in workers)
+    assert all(prev_end <= start for (_, prev_end), (start, _) in zip(spans, spans[1:]))
+    assert spans[-1][0] - spans[0][0] >= 2 * 0.5 - 0.05
@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+from wage_app.soc_rollup import ALL_STATES, RollupCube, build_rollup, level_code, soc_levels
+
+# (code, title, GROUP, Texas TOT_EMP); summary rows must not be counted again
+ROWS = [
+    ("15-0000", "Computer and Mathematical Occupations", "major", 999.0),
+    ("15-1200", "Computer Occupations", "minor", 999.0),
+    ("15-1250", "Software and Web Developers, Programmers, and Testers", "broad", 999.0),
+    ("15-1252", "Software Developers", "detailed", 100.0),
+    ("15-1253", "Software Quality Assurance Analysts and Testers", "detailed", 30.0),
+    ("15-1211", "Computer Systems Analysts", "detailed", 20.0),
+    ("15-2031", "Operations Research Analysts", "detailed", 5.0),
+    # 29-1000 is one of the minor groups with a single-digit code
+    ("29-1000", "Healthcare Diagnosing or Treating Practitioners", "minor", 999.0),
+    ("29-1141", "Registered Nurses", "detailed", 200.0),
+    ("29-1171", "Nurse Practitioners", "detailed", 10.0),
+]
+
+
+@pytest.fixture(scope="module")
+def cube():
+    rows = []
+    for state, scale in (("Texas", 1.0), ("Ohio", 2.0)):
+        for code, title, group, emp in ROWS:
+            rows.append({
+                "year": 2020, "STATE": state, "OCC_CODE": code, "OCC_TITLE": title, "GROUP": group,
+                "TOT_EMP": emp * scale, "A_MEAN": 50000.0,
+            })
+    return RollupCube(build_rollup(pd.DataFrame(rows)))
+
+
+def level_rows(cube, level, state="Texas"):
+    rows = cube.level(level, 2020, state)
+    return dict(zip(rows["OCC_CODE"], zip(rows["parent"], rows["TOT_EMP"])))
+
+
+def test_level_code():
+    codes = ["15-1252", "29-1141"]
+    assert level_code(codes, "major").tolist() == ["15-0000", "29-0000"]
+    assert level_code(codes, "minor").tolist() == ["15-1200", "29-1100"]
+    assert level_code(codes, "minor", {"29-1000"}).tolist() == ["15-1200", "29-1000"]
+    assert level_code(codes, "broad").tolist() == ["15-1250", "29-1140"]
+
+
+def test_soc_levels_from_code_pattern():
+    panel = pd.DataFrame({"OCC_CODE": ["15-0000", "15-1200", "29-1000", "15-1250", "15-1252", "00-0000x"]})
+    assert soc_levels(panel).tolist()[:5] == ["major", "minor", "minor", "broad", "detailed"]
+    assert pd.isna(soc_levels(panel).iloc[5])
+
+
+def test_rollup_levels(cube):
+    assert level_rows(cube, "major") == {"15-0000": (pd.NA, 155.0), "29-0000": (pd.NA, 210.0)}
+    assert level_rows(cube, "minor") == {
+        "15-1200": ("15-0000", 150.0),
+        "15-2000": ("15-0000", 5.0),
+        "29-1000": ("29-0000", 210.0),
+    }
+    assert level_rows(cube, "broad") == {
+        "15-1210": ("15-1200", 20.0),
+        "15-1250": ("15-1200", 130.0),
+        "15-2030": ("15-2000", 5.0),
+        "29-1140": ("29-1000", 200.0),
+        "29-1170": ("29-1000", 10.0),
+    }
+    assert level_rows(cube, "detailed") == {
+        "15-1211": ("15-1210", 20.0),
+        "15-1252": ("15-1250", 100.0),
+        "15-1253": ("15-1250", 30.0),
+        "15-2031": ("15-2030", 5.0),
+        "29-1141": ("29-1140", 200.0),
+        "29-1171": ("29-1170", 10.0),
+    }
+
+
+def test_drill_down_and_all_states(cube):
+    assert cube.children("15-1200", "minor", 2020)["OCC_CODE"].tolist() == ["15-1210", "15-1250"]
+    minors = cube.children("15-0000", "major", 2020, "Texas")
+    assert minors["OCC_CODE"].tolist() == ["15-1200", "15-2000"]
+    assert cube.children("15-1250", "broad", 2020, "Ohio")["TOT_EMP"].tolist() == [200.0, 60.0]
+    assert level_rows(cube, "major", ALL_STATES)["29-0000"][1] == 630.0
+    titles = cube.level("minor", 2020, "Texas").set_index("OCC_CODE")["OCC_TITLE"]
+    assert titles["29-1000"] == "Healthcare Diagnosing or Treating Practitioners"
@@ -0,0 +1 @@
+"""Support code for the Streamlit app in app.py."""
@@ -0,0 +1,138 @@
+"""Row-level data quality flags for the stacked year panel, stored as one uint8 bitmask.
+
+Every check is a vectorized pass over the whole panel; robust statistics (median and MAD within
+each year) decide what counts as unusual, so a few extreme rows cannot hide each other:
+
+- YOY_JUMP: A_MEAN moved far more than usual since the previous year for the same state and
+  occupation (robust z of the log change)
+- EMP_PRECISION / MEAN_PRECISION: EMP_PRSE / MEAN_PRSE is an outlier for that year
+- PCT_ORDER: the published wage percentiles are not non-decreasing
+- SUPPRESSED: employment, or both the annual and the hourly mean wage, were not released ("*",
+  "**"); hourly-only occupations have no A_MEAN by design and are not flagged
+- TOP_CODED: upper wage percentiles were withheld above the published cap ("#")
+
+Filter with (df["FLAGS"] & mask) == 0.
+"""
+import numpy as np
+import pandas as pd
+
+YOY_JUMP = 1
+EMP_PRECISION = 2
+MEAN_PRECISION = 4
+PCT_ORDER = 8
+SUPPRESSED = 16
+TOP_CODED = 32
+
+FLAG_NAMES = {
+    YOY_JUMP: "Year-over-year wage jump",
+    EMP_PRECISION: "Imprecise employment estimate",
+    MEAN_PRECISION: "Imprecise mean wage estimate",
+    PCT_ORDER: "Percentiles out of order",
+    SUPPRESSED: "Suppressed estimate",
+    TOP_CODED: "Top-coded wages",
+}
+ROBUST_Z = 5.0
+MIN_YOY_CHANGE = np.log(1.25)
+PERCENTILE_GROUPS = (
+    ("A_PCT10", "A_PCT25", "A_MEDIAN", "A_PCT75", "A_PCT90"),
+    ("H_PCT10", "H_PCT25", "H_MEDIAN", "H_PCT75", "H_PCT90"),
+)
+
+
+def _numeric(panel, col):
+    if col not in panel.columns:
+        return np.full(len(panel), np.nan)
+    return pd.to_numeric(panel[col], errors="coerce").to_numpy(dtype=float)
+
+
+def robust_z(values, groups):
+    # (x - median) / (1.4826 * MAD) within each group; NaN where undefined
+    series = pd.Series(values)
+    by = series.groupby(np.asarray(groups))
+    median = by.transform("median")
+    mad = (series - median).abs().groupby(np.asarray(groups)).transform("median") * 1.4826
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return ((series - median) / mad.where(mad > 0)).to_numpy()
+
+
+def yoy_jumps(panel):
+    # log change of A_MEAN against the previous year of the same (STATE, OCC_CODE)
+    years = panel["year"].to_numpy()
+    wage = _numeric(panel, "A_MEAN")
+    keys = pd.MultiIndex.from_arrays([panel["STATE"].astype(str), panel["OCC_CODE"].astype(str)]).factorize()[0]
+    order = np.lexsort((years, keys))
+    k, y, w = keys[order], years[order], wage[order]
+    follows = (k[1:] == k[:-1]) & (y[1:] == y[:-1] + 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        step = np.log(w[1:] / w[:-1])
+    sorted_change = np.full(len(panel), np.nan)
+    sorted_change[1:] = np.where(follows, step, np.nan)
+    change = np.empty(len(panel))
+    change[order] = sorted_change
+    z = robust_z(change, years)
+    return (np.abs(z) > ROBUST_Z) & (np.abs(change) > MIN_YOY_CHANGE)
+
+
+def precision_outliers(panel, col):
+    prse = _numeric(panel, col)
+    z = robust_z(np.log1p(prse), panel["year"].to_numpy())
+    return z > ROBUST_Z
+
+
+def percentile_disorder(panel):
+    bad = np.zeros(len(panel), dtype=bool)
+    for cols in PERCENTILE_GROUPS:
+        if not all(c in panel.columns for c in cols):
+            continue
+        values = np.column_stack([_numeric(panel, c) for c in cols])
+        running = np.fmax.accumulate(values, axis=1)
+        bad |= (values[:, 1:] < running[:, :-1]).any(axis=1)
+    return bad
+
+
+def suppressed(panel):
+    no_mean = np.isnan(_numeric(panel, "A_MEAN")) & np.isnan(_numeric(panel, "H_MEAN"))
+    return np.isnan(_numeric(panel, "TOT_EMP")) | no_mean
+
+
+def top_coded(panel):
+    median = _numeric(panel, "A_MEDIAN")
+    return ~np.isnan(median) & (np.isnan(_numeric(panel, "A_PCT75")) | np.isnan(_numeric(panel, "A_PCT90")))
+
+
+def compute_flags(panel):
+    flags = np.zeros(len(panel), dtype=np.uint8)
+    if panel.empty:
+        return flags
+    if {"year", "STATE", "OCC_CODE"}.issubset(panel.columns):
+        flags |= yoy_jumps(panel).astype(np.uint8) * YOY_JUMP
+    if "year" in panel.columns:
+        flags |= precision_outliers(panel, "EMP_PRSE").astype(np.uint8) * EMP_PRECISION
+        flags |= precision_outliers(panel, "MEAN_PRSE").astype(np.uint8) * MEAN_PRECISION
+    flags |= percentile_disorder(panel).astype(np.uint8) * PCT_ORDER
+    flags |= suppressed(panel).astype(np.uint8) * SUPPRESSED
+    flags |= top_coded(panel).astype(np.uint8) * TOP_CODED
+    return flags
+
+
+def add_flags(panel):
+    return panel.assign(FLAGS=compute_flags(panel))
+
+
+def mask_for(names):
+    mask = 0
+    for bit, name in FLAG_NAMES.items():
+        if name in names:
+            mask |= bit
+    return mask
+
+
+def describe(flags):
+    return ", ".join(name for bit, name in FLAG_NAMES.items() if int(flags) & bit)
+
+
+def flag_counts(flags):
+    flags = np.asarray(flags)
+    return pd.DataFrame(
+        [{"Flag": name, "Rows": int(np.count_nonzero(flags & bit))} for bit, name in FLAG_NAMES.items()]
+    )
@@ -0,0 +1,365 @@
+"""Read-only HTTP/JSON query API over the cleaned wage data.
+
+Runs next to app.py (from the same working directory) and uses the same loaders, so with the
+host cache backend both attach to the same resident frames. The server is a small asyncio HTTP/1.1 loop (keep-alive, optional
+gzip); query work runs on a thread pool and identical requests for the same data version are
+answered from a small response cache. Responses are columnar: {"columns", "rows", "data"}.
+
+    python -m wage_app.api [--host 127.0.0.1] [--port 8600]
+
+Endpoints (all GET; list parameters are comma-separated):
+
+    /health
+    /search?q=software%20developers%20in%20texas
+    /slice?year=2024&state=Texas&occ_code=15-1252&columns=A_MEAN,TOT_EMP&exclude_flags=SUPPRESSED
+    /aggregate?by=STATE&value=TOT_EMP&agg=sum&year=2024&top=10
+    /aggregate?level=major&year=2024&state=All%20states
+    /predict?state=Texas&occ_code=15-1252
+    /export?year=2020,2021&state=Texas&format=parquet   (streamed; csv is gzip-compressed)
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+from streamlit import logger as streamlit_logger
+
+from wage_app import loaders
+from wage_app.export import FORMATS, export_filename, stream_export
+from wage_app.query import columnar, flag_mask
+
+DEFAULT_PORT = 8600
+# how often the cleaned files are re-checked for a new data version
+RELOAD_SECONDS = 30
+MAX_LIMIT = 50_000
+GROUP_COLUMNS = ("year", "STATE", "OCC_CODE", "OCC_TITLE")
+AGGREGATES = ("sum", "mean", "median", "min", "max", "count", "weighted_mean")
+_LOGGER = streamlit_logger.get_logger(__name__)
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _list(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _int(params, name, default, low=0, high=None):
+    try:
+        value = int(params.get(name, default))
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer")
+    return max(low, min(value, high)) if high is not None else max(low, value)
+
+
+class QueryService:
+    def __init__(self, cache_entries=256):
+        self._version = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._responses = OrderedDict()
+        self._cache_entries = cache_entries
+
+    def version(self):
+        now = time.monotonic()
+        if self._version is None or now - self._checked > RELOAD_SECONDS:
+            with self._lock:
+                self._version = loaders.data_version()
+                self._checked = now
+        return self._version
+
+    def store(self):
+        return loaders.panel_store(self.version())
+
+    def _filters(self, params):
+        return dict(
+            years=_list(params, "year"),
+            states=_list(params, "state"),
+            occ_codes=_list(params, "occ_code"),
+            exclude_flags=flag_mask(params.get("exclude_flags")),
+        )
+
+    # --- endpoints -----------------------------------------------------------------------
+
+    def health(self, params):
+        store = self.store()
+        return {"status": "ok", "data_version": store.version, "rows": len(store.panel), "years": store.years}
+
+    def search(self, params):
+        query = params.get("q", "")
+        limit = _int(params, "limit", 10, 1, 100)
+        occupations, states = loaders.search_index(self.version()).parse(query, limit=limit)
+        return {
+            "occupations": {
+                "columns": ["OCC_CODE", "OCC_TITLE", "score"],
+                "rows": len(occupations),
+                "data": {
+                    "OCC_CODE": [o[0] for o in occupations],
+                    "OCC_TITLE": [o[1] for o in occupations],
+                    "score": [o[2] for o in occupations],
+                },
+            },
+            "states": states,
+        }
+
+    def slice(self, params):
+        store = self.store()
+        rows = store.rows(**self._filters(params))
+        offset = _int(params, "offset", 0)
+        limit = _int(params, "limit", 1000, 1, MAX_LIMIT)
+        page = store.select(rows[offset:offset + limit], _list(params, "columns"))
+        return {**columnar(page), "total": int(len(rows)), "offset": offset}
+
+    def aggregate(self, params):
+        if params.get("level"):
+            return self._rollup(params)
+        store = self.store()
+        by = _list(params, "by") or ["STATE"]
+        if any(col not in GROUP_COLUMNS for col in by):
+            raise BadRequest(f"by must be among {', '.join(GROUP_COLUMNS)}")
+        value = params.get("value", "TOT_EMP")
+        agg = params.get("agg", "sum")
+        if agg not in AGGREGATES:
+            raise BadRequest(f"agg must be one of {', '.join(AGGREGATES)}")
+        if value not in store.columns:
+            raise BadRequest(f"unknown column: {value}")
+        top = _int(params, "top", 10, 1, MAX_LIMIT)
+
+        frame = store.select(store.rows(**self._filters(params)), by + [value, "TOT_EMP"])
+        frame = frame.loc[:, ~frame.columns.duplicated()]
+        if agg == "weighted_mean":
+            weighted = frame.assign(_wx=frame[value] * frame["TOT_EMP"], _w=frame["TOT_EMP"].where(frame[value].notna()))
+            sums = weighted.groupby(by, observed=True, sort=False)[["_wx", "_w"]].sum()
+            result = (sums["_wx"] / sums["_w"]).rename(value)
+        else:
+            result = frame.groupby(by, observed=True, sort=False)[value].agg(agg)
+        ascending = params.get("order", "desc") == "asc"
+        result = result.sort_values(ascending=ascending).head(top).reset_index()
+        return {**columnar(result), "agg": agg}
+
+    def _rollup(self, params):
+        from wage_app.soc_rollup import ALL_STATES, LEVELS
+
+        level = params["level"]
+        if level not in LEVELS:
+            raise BadRequest(f"level must be one of {', '.join(LEVELS)}")
+        cube = loaders.rollup_cube(self.version())
+        years = _list(params, "year") or cube.years[-1:]
+        state = params.get("state", ALL_STATES)
+        frame = pd.concat([cube.level(level, int(year), state) for year in years], ignore_index=True)
+        return columnar(frame.assign(level=frame["level"].astype(str)))
+
+    def predict(self, params):
+        frame, check = loaders.forecasts(self.version())
+        if frame.empty:
+            return {**columnar(frame), "total": 0, "backtest": check}
+        mask = np.ones(len(frame), dtype=bool)
+        for name, col in (("state", "STATE"), ("occ_code", "OCC_CODE")):
+            values = _list(params, name)
+            if values:
+                mask &= frame[col].isin(values).to_numpy()
+        limit = _int(params, "limit", 1000, 1, MAX_LIMIT)
+        matches = frame[mask]
+        return {**columnar(matches.head(limit)), "total": int(mask.sum()), "backtest": check}
+
+    def export(self, target):
+        # returns (headers, byte iterator); validation errors surface before anything is sent
+        params = {k: v[-1] for k, v in parse_qs(urlsplit(target).query).items()}
+        fmt = params.get("format", "csv")
+        if fmt not in FORMATS:
+            raise BadRequest(f"format must be one of {', '.join(FORMATS)}")
+        filters = self._filters(params)
+        store = self.store()
+        rows = store.rows(**filters)
+        headers = {
+            "Content-Type": FORMATS[fmt][0],
+            "Content-Disposition": f'attachment; filename="{export_filename(fmt, filters["years"])}"',
+            "X-Total-Rows": str(len(rows)),
+        }
+        return headers, stream_export(store, rows, _list(params, "columns"), fmt)
+
+    ROUTES = {"/health": "health", "/search": "search", "/slice": "slice", "/aggregate": "aggregate", "/predict": "predict"}
+
+    def dispatch(self, target):
+        # returns (status, encoded JSON body); cached per data version and request target
+        url = urlsplit(target)
+        handler = self.ROUTES.get(url.path.rstrip("/") or "/")
+        if handler is None:
+            return HTTPStatus.NOT_FOUND, _encode({"error": f"unknown endpoint {url.path}", "endpoints": sorted(self.ROUTES)})
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            # the data version check reads the cleaned files and can fail like any handler
+            key = (self.version(), target)
+            with self._lock:
+                cached = self._responses.get(key)
+                if cached is not None:
+                    self._responses.move_to_end(key)
+                    return HTTPStatus.OK, cached
+            body = _encode(getattr(self, handler)(params))
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, _encode({"error": str(e)})
+        except Exception as e:
+            # e.g. pandas failing on an unexpected column: the client still gets an answer
+            _LOGGER.exception("%s failed", target)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, _encode({"error": f"{type(e).__name__}: {e}"})
+        if handler != "health":
+            with self._lock:
+                self._responses[key] = body
+                while len(self._responses) > self._cache_entries:
+                    self._responses.popitem(last=False)
+        return HTTPStatus.OK, body
+
+
+def _encode(payload):
+    return json.dumps(payload, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"cannot serialize {type(value).__name__}")
+
+
+async def _read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise BadRequest("malformed request line")
+    headers = {}
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = header.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise BadRequest("invalid Content-Length") from None
+    if length < 0:
+        raise BadRequest("invalid Content-Length")
+    if length:
+        await reader.readexactly(length)
+    return parts[0], parts[1], parts[2], headers
+
+
+def _response(status, body, headers, keep_alive):
+    extra = ""
+    if len(body) > 1024 and "gzip" in headers.get("accept-encoding", ""):
+        body = gzip.compress(body, compresslevel=5)
+        extra = "Content-Encoding: gzip\r\n"
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"{extra}"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def _send_stream(writer, loop, pool, service, target, chunked):
+    try:
+        headers, stream = await loop.run_in_executor(pool, service.export, target)
+    except ValueError as e:
+        writer.write(_response(HTTPStatus.BAD_REQUEST, _encode({"error": str(e)}), {}, chunked))
+        return
+    except Exception as e:
+        _LOGGER.exception("%s failed", target)
+        writer.write(_response(HTTPStatus.INTERNAL_SERVER_ERROR, _encode({"error": f"{type(e).__name__}: {e}"}), {}, chunked))
+        return
+    framing = "Transfer-Encoding: chunked\r\nConnection: keep-alive" if chunked else "Connection: close"
+    head = "HTTP/1.1 200 OK\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + framing + "\r\n\r\n"
+    writer.write(head.encode("latin-1"))
+    while True:
+        # each chunk is encoded on the pool; drain() applies back-pressure from slow clients
+        data = await loop.run_in_executor(pool, next, stream, None)
+        if data is None:
+            break
+        if data:
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data) if chunked else data)
+            await writer.drain()
+    if chunked:
+        writer.write(b"0\r\n\r\n")
+
+
+def serve(service, host="127.0.0.1", port=DEFAULT_PORT, workers=8, ready=None):
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wage-api")
+
+    async def handle(reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except BadRequest as e:
+                    writer.write(_response(HTTPStatus.BAD_REQUEST, _encode({"error": str(e)}), {}, False))
+                    break
+                if request is None:
+                    break
+                method, target, version, headers = request
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                if method != "GET":
+                    status, body = HTTPStatus.METHOD_NOT_ALLOWED, _encode({"error": "read-only API: use GET"})
+                elif urlsplit(target).path.rstrip("/") == "/export":
+                    # HTTP/1.0 clients get the raw stream and a closed connection instead of chunks
+                    await _send_stream(writer, loop, pool, service, target, keep_alive)
+                    await writer.drain()
+                    if not keep_alive:
+                        break
+                    continue
+                else:
+                    status, body = await loop.run_in_executor(pool, service.dispatch, target)
+                writer.write(_response(status, body, headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        # load the data before accepting connections so the first request is not a cold start
+        await asyncio.get_running_loop().run_in_executor(pool, service.store)
+        server = await asyncio.start_server(handle, host, port, backlog=512)
+        if ready is not None:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the cleaned wage data as a read-only JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=8, help="threads running queries")
+    args = parser.parse_args(argv)
+    # the shared loaders are streamlit-cached; outside a streamlit session they warn on every call
+    streamlit_logger.set_log_level("error")
+    service = QueryService()
+    print(f"Serving wage data on http://{args.host}:{args.port}/health")
+    serve(service, args.host, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    main()
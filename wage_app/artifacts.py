@@ -0,0 +1,184 @@
+"""Content-addressed store for fitted models and their metrics.
+
+An artifact's key is a sha256 over everything that decides the fit:
+
+- the content hash of every input partition (one per cleaned year file)
+- the source of the feature and fit code
+- the model name and its parameter set
+
+An unchanged key means an unchanged result, so the fit is skipped. Re-cleaning a year into
+identical bytes keeps every key, while editing the feature code or one parameter set only
+misses the fits it affects.
+
+Each artifact is two files under WAGE_CACHE_DIR/artifacts/: <key>.json (metrics and provenance,
+small enough for the Models tab to read on every rerun) and <key>.pkl (the fitted model). The
+JSON is written last, so a key is present only once both files are complete. Reads touch the
+files, so their mtime is the LRU clock. After every write, the least recently used artifacts are
+removed until the store fits its budget (WAGE_ARTIFACT_BUDGET_MB, default 2048).
+"""
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from wage_app import shared_cache
+
+DEFAULT_BUDGET_MB = 2048
+
+
+def partition_hash(path):
+    # sha256 of a year file, computed once per (path, size, mtime) and kept in the host cache
+    def digest():
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        return h.hexdigest()
+
+    return shared_cache.get_backend().obj(f"sha256:{shared_cache.file_key('file', path)}", digest)
+
+
+def code_hash(*functions):
+    h = hashlib.sha256()
+    for fn in functions:
+        h.update(inspect.getsource(fn).encode("utf-8"))
+    return h.hexdigest()
+
+
+def artifact_key(model, params, partitions, code):
+    spec = {"model": model, "params": params, "partitions": partitions, "code": code}
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path, data):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class ArtifactStore:
+    def __init__(self, root, budget_bytes):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.budget_bytes = budget_bytes
+
+    def _paths(self, key):
+        return self.root / f"{key}.json", self.root / f"{key}.pkl"
+
+    def _touch(self, *paths):
+        now = time.time()
+        for path in paths:
+            try:
+                os.utime(path, (now, now))
+            except FileNotFoundError:
+                pass
+
+    def record(self, key):
+        # metrics and provenance, or None when the key was never fitted (or has been evicted)
+        meta, blob = self._paths(key)
+        try:
+            record = json.loads(meta.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        self._touch(meta, blob)
+        return record
+
+    def load_model(self, key):
+        meta, blob = self._paths(key)
+        try:
+            with open(blob, "rb") as f:
+                model = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        self._touch(meta, blob)
+        return model
+
+    def _write_lock(self):
+        # host-wide: workers writing and evicting in the same store take turns, so an eviction
+        # never counts or removes an artifact another worker is halfway through writing
+        return shared_cache.get_backend().lock(f"artifact:evict:{self.root.resolve()}")
+
+    def put(self, key, model, record):
+        meta, blob = self._paths(key)
+        data = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._write_lock():
+            _atomic_write(blob, data)
+            record = dict(record, key=key, model_bytes=blob.stat().st_size)
+            _atomic_write(meta, json.dumps(record, sort_keys=True, default=str).encode("utf-8"))
+            self._evict(keep=key)
+        return record
+
+    def fit(self, key, build):
+        # stored record for `key`, or build() -> (model, record) once per host even with several workers
+        record = self.record(key)
+        if record is not None:
+            return record, False
+        with shared_cache.get_backend().lock(f"artifact:{key}"):
+            record = self.record(key)
+            if record is not None:
+                return record, False
+            model, record = build()
+            return self.put(key, model, record), True
+
+    def entries(self):
+        # [(last_used, bytes, key)] oldest first
+        sizes, used = {}, {}
+        for path in self.root.iterdir():
+            if path.suffix not in (".json", ".pkl") or path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            sizes[path.stem] = sizes.get(path.stem, 0) + stat.st_size
+            used[path.stem] = max(used.get(path.stem, 0), stat.st_mtime)
+        return sorted((used[k], sizes[k], k) for k in sizes)
+
+    def size(self):
+        return sum(n for _, n, _ in self.entries())
+
+    def evict(self, keep=None):
+        with self._write_lock():
+            self._evict(keep)
+
+    def _evict(self, keep):
+        entries = self.entries()
+        total = sum(n for _, n, _ in entries)
+        for _, n, key in entries:
+            if total <= self.budget_bytes:
+                break
+            if key == keep:
+                continue
+            # the JSON goes first so a half-removed artifact reads as missing
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+            total -= n
+
+    def clear(self):
+        for path in self.root.glob("*"):
+            if path.suffix in (".json", ".pkl", ".tmp"):
+                path.unlink(missing_ok=True)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            root = Path(os.environ.get("WAGE_CACHE_DIR", shared_cache.DEFAULT_CACHE_DIR)) / "artifacts"
+            budget = float(os.environ.get("WAGE_ARTIFACT_BUDGET_MB", DEFAULT_BUDGET_MB))
+            _store = ArtifactStore(root, int(budget * 1024 ** 2))
+        return _store
@@ -0,0 +1,59 @@
+"""Project documents (the proposal PDF) with locally rendered, cached page previews.
+
+The packaged copy under files/ is used when present; otherwise the GitHub copy is fetched once
+through the shared cache. Pages are rendered to PNG with pypdfium2 when it is installed and the
+images are kept in the shared cache keyed by the PDF's content hash, so after the first visit
+on a host the tab only reads ready thumbnails. Without pypdfium2 the tab falls back to the
+Google Docs viewer iframe, as it does when pypdfium2 cannot read the file.
+"""
+import hashlib
+import importlib.util
+import io
+from pathlib import Path
+
+from wage_app import shared_cache
+from wage_app.loaders import BRANCH, OWNER, REPO, fetch_url_bytes
+
+PROPOSAL_PDF = Path("files/Milestone 0_ Project Proposal Group 7.pdf")
+PROPOSAL_PDF_URL = f"https://raw.githubusercontent.com/{OWNER}/{REPO}/{BRANCH}/files/Milestone%200_%20Project%20Proposal%20Group%207.pdf"
+THUMBNAIL_SCALE = 0.5
+PAGE_SCALE = 1.5
+
+
+def renderer_available():
+    return importlib.util.find_spec("pypdfium2") is not None
+
+
+def document_bytes(local_path=PROPOSAL_PDF, url=PROPOSAL_PDF_URL):
+    # returns (bytes, source label)
+    local_path = Path(local_path)
+    if local_path.exists():
+        return local_path.read_bytes(), "local copy"
+    return fetch_url_bytes(url, timeout=10), "GitHub"
+
+
+def digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def render_pages(data, scale, pages=None):
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(data)
+    try:
+        images = []
+        for index in range(len(pdf)) if pages is None else pages:
+            image = pdf[index].render(scale=scale).to_pil()
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG", optimize=True)
+            images.append(buffer.getvalue())
+        return images
+    finally:
+        pdf.close()
+
+
+def page_images(data, scale=THUMBNAIL_SCALE, pages=None):
+    # PNG bytes per page, rendered once per document version and scale on each host
+    wanted = "all" if pages is None else ",".join(map(str, pages))
+    key = f"pdf-pages:{digest(data)}:{scale}:{wanted}"
+    return shared_cache.get_backend().obj(key, lambda: render_pages(data, scale, pages))
@@ -0,0 +1,261 @@
+"""Pluggable execution engines for the Data Exploration aggregations.
+
+A query is written once as a small lazy plan: source frames, filters, group keys, named
+aggregations, sort and limit. Nothing runs until collect(), which hands the plan to an engine:
+
+- "polars": a LazyFrame over only the referenced columns; filters and the projection are pushed
+  down by Polars' optimizer and the group-by runs on every core (used when polars is installed)
+- "arrow": only the referenced columns are converted to Arrow, filters are applied as compute
+  masks before pyarrow's multi-threaded hash group-by
+- "pandas": the single-threaded fallback
+
+Several sources (e.g. one frame per year) are stacked by the engine, so multi-year queries are
+one columnar scan. Pick an engine with WAGE_ENGINE=polars|arrow|pandas; the default is the first
+one that is installed. Group keys drop missing values unless fill_null() gives them a label,
+matching pandas, and ties are broken by the group keys so every engine returns the same rows.
+"""
+import importlib.util
+import os
+
+import numpy as np
+import pandas as pd
+
+ENGINES = ("polars", "arrow", "pandas")
+AGGREGATIONS = ("size", "sum", "mean", "count")
+
+
+def available_engines():
+    found = {"polars": "polars", "arrow": "pyarrow", "pandas": "pandas"}
+    return [name for name in ENGINES if importlib.util.find_spec(found[name]) is not None]
+
+
+def default_engine():
+    wanted = os.environ.get("WAGE_ENGINE")
+    engines = available_engines()
+    if wanted:
+        if wanted not in ENGINES:
+            raise ValueError(f"Unknown WAGE_ENGINE: {wanted!r} (expected one of {', '.join(ENGINES)})")
+        if wanted in engines:
+            return wanted
+    return engines[0]
+
+
+class Query:
+    """Lazy aggregation plan; every builder method returns a new Query."""
+
+    def __init__(self, *sources):
+        self.sources = sources
+        self.filters = ()   # (column, op, value) with op "in" or "notnull"
+        self.fills = ()     # (column, value) for missing group keys
+        self.keys = ()
+        self.aggs = ()      # (output, column, fn)
+        self.order = None   # (column, descending)
+        self.limit = None
+
+    def _with(self, **changes):
+        q = Query(*self.sources)
+        q.__dict__.update({k: v for k, v in self.__dict__.items() if k != "sources"})
+        q.__dict__.update(changes)
+        return q
+
+    def where(self, column, op, value=None):
+        if op not in ("in", "notnull"):
+            raise ValueError(f"unsupported filter: {op}")
+        value = tuple(value) if op == "in" else None
+        return self._with(filters=self.filters + ((column, op, value),))
+
+    def fill_null(self, column, value):
+        return self._with(fills=self.fills + ((column, value),))
+
+    def group_by(self, *keys):
+        return self._with(keys=tuple(keys))
+
+    def agg(self, **named):
+        # name=("size",) or name=(column, "sum" | "mean" | "count")
+        aggs = []
+        for out, spec in named.items():
+            column, fn = (None, spec[0]) if len(spec) == 1 else spec
+            if fn not in AGGREGATIONS:
+                raise ValueError(f"unsupported aggregation: {fn}")
+            aggs.append((out, column, fn))
+        return self._with(aggs=self.aggs + tuple(aggs))
+
+    def sort(self, column, descending=True):
+        return self._with(order=(column, descending))
+
+    def head(self, n):
+        return self._with(limit=n)
+
+    def columns(self):
+        # projection: only these columns are read from the sources
+        cols = list(self.keys) + [c for c, _, _ in self.filters] + [c for _, c, _ in self.aggs if c]
+        return list(dict.fromkeys(cols))
+
+    def collect(self, engine=None):
+        engine = engine or default_engine()
+        if not self.keys:
+            raise ValueError("query has no group keys")
+        frame = {"polars": _run_polars, "arrow": _run_arrow, "pandas": _run_pandas}[engine](self)
+        return frame.reset_index(drop=True)
+
+
+def _sort_columns(query):
+    if query.order is None:
+        return list(query.keys), [True] * len(query.keys)
+    column, descending = query.order
+    return [column] + list(query.keys), [not descending] + [True] * len(query.keys)
+
+
+def _run_pandas(query):
+    cols = query.columns()
+    df = pd.concat([s[cols] for s in query.sources], ignore_index=True) if len(query.sources) > 1 else query.sources[0][cols]
+    for column, value in query.fills:
+        df = df.assign(**{column: df[column].astype(object).where(df[column].notna(), value)})
+    for column, op, value in query.filters:
+        df = df[df[column].isin(value)] if op == "in" else df[df[column].notna()]
+    grouped = df.groupby(list(query.keys), observed=True, sort=False)
+    parts = {}
+    for out, column, fn in query.aggs:
+        parts[out] = grouped.size() if fn == "size" else getattr(grouped[column], fn)()
+    result = pd.DataFrame(parts).reset_index()
+    by, ascending = _sort_columns(query)
+    result = result.sort_values(by, ascending=ascending, kind="mergesort")
+    return result.head(query.limit) if query.limit else result
+
+
+def _arrow_table(query):
+    import pyarrow as pa
+
+    cols = query.columns()
+    tables = [pa.Table.from_pandas(s[cols], preserve_index=False) for s in query.sources]
+    return pa.concat_tables(tables, promote_options="permissive") if len(tables) > 1 else tables[0]
+
+
+def _encode(table, column):
+    # string keys hash much faster as dictionary indices; categoricals arrive encoded already
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    field = table.schema.field(column)
+    if pa.types.is_dictionary(field.type):
+        return table
+    return table.set_column(table.schema.get_field_index(column), column, pc.dictionary_encode(table.column(column)))
+
+
+def _decode(table, column):
+    import pyarrow as pa
+
+    field = table.schema.field(column)
+    if not pa.types.is_dictionary(field.type):
+        return table
+    return table.set_column(table.schema.get_field_index(column), column, table.column(column).cast(field.type.value_type))
+
+
+def _run_arrow(query):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    table = _arrow_table(query)
+    for column, value in query.fills:
+        idx = table.schema.get_field_index(column)
+        filled = pc.fill_null(table.column(column).cast(pa.string()), value)
+        table = table.set_column(idx, column, filled)
+    mask = None
+    for column, op, value in query.filters:
+        if op == "in":
+            table = _decode(table, column)
+            values = pa.array(list(value), type=table.schema.field(column).type)
+            cond = pc.is_in(table.column(column), value_set=values)
+        else:
+            cond = pc.is_valid(table.column(column))
+        mask = cond if mask is None else pc.and_(mask, cond)
+    for column in query.keys:
+        cond = pc.is_valid(table.column(column))
+        mask = cond if mask is None else pc.and_(mask, cond)
+    if mask is not None:
+        table = table.filter(mask)
+
+    specs, names = [], {}
+    for out, column, fn in query.aggs:
+        if fn == "size":
+            spec = ([], "count_all")
+        elif fn == "sum":
+            spec = (column, "sum", pc.ScalarAggregateOptions(min_count=0))
+        else:
+            spec = (column, fn)
+        if spec not in specs:
+            specs.append(spec)
+        # aggregate() names its outputs "<column>_<fn>" ("count_all" for size)
+        names[out] = "count_all" if fn == "size" else f"{column}_{fn}"
+    for column in query.keys:
+        table = _encode(table, column)
+    grouped = table.group_by(list(query.keys), use_threads=True).aggregate(specs)
+    grouped = pa.table(
+        {k: grouped.column(k) for k in query.keys} | {out: grouped.column(name) for out, name in names.items()}
+    )
+    for column in query.keys:
+        grouped = _decode(grouped, column)
+    by, ascending = _sort_columns(query)
+    grouped = grouped.sort_by([(c, "ascending" if a else "descending") for c, a in zip(by, ascending)])
+    if query.limit:
+        grouped = grouped.slice(0, query.limit)
+    return grouped.to_pandas()
+
+
+def _run_polars(query):
+    import polars as pl
+
+    cols = query.columns()
+    frames = [pl.from_pandas(s[cols]).lazy() for s in query.sources]
+    if len(frames) > 1:
+        # each year has its own categories; stacking local categoricals means remapping them (or a
+        # string cache mismatch on some polars versions), so they are stacked as strings
+        frames = [f.with_columns(pl.col(pl.Categorical).cast(pl.Utf8)) for f in frames]
+    lazy = pl.concat(frames, how="diagonal_relaxed")
+    for column, value in query.fills:
+        lazy = lazy.with_columns(pl.col(column).cast(pl.Utf8).fill_null(value))
+    for column, op, value in query.filters:
+        lazy = lazy.filter(pl.col(column).is_in(list(value)) if op == "in" else pl.col(column).is_not_null())
+    lazy = lazy.filter(pl.all_horizontal([pl.col(k).is_not_null() for k in query.keys]))
+    exprs = []
+    for out, column, fn in query.aggs:
+        if fn == "size":
+            exprs.append(pl.len().alias(out))
+        else:
+            exprs.append(getattr(pl.col(column), fn)().alias(out))
+    lazy = lazy.group_by(list(query.keys)).agg(exprs)
+    by, ascending = _sort_columns(query)
+    lazy = lazy.sort(by, descending=[not a for a in ascending])
+    if query.limit:
+        lazy = lazy.head(query.limit)
+    return lazy.collect().to_pandas()
+
+
+def corr(frame, engine=None):
+    """Pearson correlation of the numeric columns using pairwise-complete rows, like DataFrame.corr().
+
+    The columnar engines compute every pair at once from a few matrix products (multi-threaded
+    BLAS) instead of pandas' pair-by-pair loop.
+    """
+    engine = engine or default_engine()
+    num = frame.select_dtypes(include=[np.number])
+    if engine == "pandas" or num.shape[1] == 0:
+        return num.corr()
+    x = num.to_numpy(dtype=float, na_value=np.nan)
+    present = ~np.isnan(x)
+    # centring first keeps the sums of squares well conditioned (all-missing columns stay NaN quietly)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(present, x, 0.0).sum(axis=0) / present.sum(axis=0)
+        x = np.where(present, x - means, 0.0)
+    m = present.astype(float)
+    n = m.T @ m
+    sx = x.T @ m            # sx[i, j]: sum of column i over rows where j is present too
+    sxx = (x * x).T @ m
+    sxy = x.T @ x
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = n * sxy - sx * sx.T
+        var = (n * sxx - sx ** 2) * (n * sxx - sx ** 2).T
+        r = cov / np.sqrt(var)
+    r[n < 2] = np.nan
+    np.fill_diagonal(r, np.where(np.diag(n * sxx - sx ** 2) > 0, 1.0, np.nan))
+    return pd.DataFrame(np.clip(r, -1, 1), index=num.columns, columns=num.columns)
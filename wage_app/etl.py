@@ -0,0 +1,317 @@
+"""Incremental raw-to-cleaned ETL for the BLS OEWS state workbooks.
+
+Turns data/oesm<NN>st/state_*.xls* into cleaned_data/data_<year>.csv with the same column
+mapping as notebooks/Data_cleaning.ipynb, but only for the years whose raw workbooks changed:
+
+- every source workbook is fingerprinted (sha256; skipped when size and mtime are unchanged)
+  and the fingerprints are kept in cleaned_data/etl_manifest.json
+- changed years are parsed in parallel worker processes
+- columns are harmonized across years: aliases are mapped to one name, the ANNUAL/HOURLY flags
+  become booleans, GROUP values are normalized, and suppressed "*"/"#" markers become NaN
+- the combined all-years file carries a FLAGS bitmask from wage_app.anomalies
+- with --parquet each year is also written to cleaned_data/parquet/data_<year>.parquet, sorted by
+  STATE in small row groups, for the range-read GitHub source in wage_app.remote
+- outputs (and the manifest) are written to a temp file and atomically renamed into place
+
+Run with
+
+    python -m wage_app.etl [--jobs N] [--force] [--years 2023 2024] [--parquet]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+from wage_app.anomalies import add_flags
+
+# bump when the cleaning rules change so every year is rebuilt once
+ETL_VERSION = 1
+
+RAW_DIR = Path("data")
+CLEANED_DIR = Path("cleaned_data")
+MANIFEST_NAME = "etl_manifest.json"
+COMBINED_NAME = "combined_data_by_year.csv"
+PARQUET_DIR_NAME = "parquet"
+# small enough that a STATE filter skips most of a year, large enough to keep the footer small
+PARQUET_ROW_GROUP = 4096
+
+COLUMN_ALIAS = {
+    "AREA": ["AREA"],
+    "ST": ["ST", "PRIM_STATE"],
+    "STATE": ["STATE", "AREA_TITLE", "area_title"],
+    "OCC_CODE": ["OCC_CODE", "occ_code"],
+    "OCC_TITLE": ["OCC_TITLE", "occ_title"],
+    "GROUP": ["GROUP", "OCC_GROUP", "o_group", "O_GROUP"],
+    "TOT_EMP": ["TOT_EMP", "tot_emp"],
+    "EMP_PRSE": ["EMP_PRSE", "emp_prse"],
+    "MEAN_PRSE": ["MEAN_PRSE", "mean_prse"],
+    "H_MEAN": ["H_MEAN", "h_mean"],
+    "H_PCT10": ["H_PCT10", "h_pct10"],
+    "H_PCT25": ["H_PCT25", "h_pct25"],
+    "H_MEDIAN": ["H_MEDIAN", "h_median"],
+    "H_PCT75": ["H_PCT75", "h_pct75"],
+    "H_PCT90": ["H_PCT90", "h_pct90"],
+    "A_MEAN": ["A_MEAN", "a_mean"],
+    "A_PCT10": ["A_PCT10", "a_pct10"],
+    "A_PCT25": ["A_PCT25", "a_pct25"],
+    "A_MEDIAN": ["A_MEDIAN", "a_median"],
+    "A_PCT75": ["A_PCT75", "a_pct75"],
+    "A_PCT90": ["A_PCT90", "a_pct90"],
+    "ANNUAL": ["ANNUAL", "annual"],
+    "HOURLY": ["HOURLY", "hourly"],
+}
+ALIAS_TO_KEY = {alias.strip().lower(): key for key, aliases in COLUMN_ALIAS.items() for alias in aliases}
+
+FLOAT_FIELDS = [
+    "TOT_EMP", "EMP_PRSE", "MEAN_PRSE",
+    "H_MEAN", "H_PCT10", "H_PCT25", "H_MEDIAN", "H_PCT75", "H_PCT90",
+    "A_MEAN", "A_PCT10", "A_PCT25", "A_MEDIAN", "A_PCT75", "A_PCT90",
+]
+FLAG_FIELDS = ["ANNUAL", "HOURLY"]
+# OCC_GROUP spellings seen across releases
+GROUP_VALUES = {"major": "major", "minor": "minor", "broad": "broad", "detailed": "detailed", "detail": "detailed", "total": "total"}
+# "*" = estimate not released, "**" = employment not released, "#" = wage above the published cap
+SUPPRESSED_MARKERS = {"*", "**", "#", "~", ""}
+
+
+def year_from_folder(name):
+    m = re.search(r"oesm(\d+)st", name, re.IGNORECASE)
+    if not m:
+        return None
+    digits = m.group(1)
+    return str(int(digits) if len(digits) > 2 else 2000 + int(digits))
+
+
+def discover_sources(raw_dir=RAW_DIR):
+    sources = {}
+    for folder in sorted(p for p in Path(raw_dir).iterdir() if p.is_dir()):
+        year = year_from_folder(folder.name)
+        if year is None:
+            continue
+        files = sorted(
+            p for p in folder.iterdir()
+            if p.is_file() and p.name.lower().startswith("state_") and p.suffix.lower() in (".xls", ".xlsx")
+        )
+        if files:
+            sources[year] = files
+    return sources
+
+
+def _sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_sources(paths, previous=None):
+    # reuse the stored hash when size and mtime match, so unchanged workbooks are not re-read
+    known = {entry["path"]: entry for entry in (previous or {}).get("sources", [])}
+    entries = []
+    for path in paths:
+        stat = path.stat()
+        old = known.get(str(path))
+        if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+            sha = old["sha256"]
+        else:
+            sha = _sha256(path)
+        entries.append({"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha})
+    combined = hashlib.sha256(
+        "\n".join([f"etl:{ETL_VERSION}"] + [e["sha256"] for e in entries]).encode("utf-8")
+    ).hexdigest()
+    return combined, entries
+
+
+def harmonize(raw):
+    rename_map = {col: ALIAS_TO_KEY[str(col).strip().lower()] for col in raw.columns if str(col).strip().lower() in ALIAS_TO_KEY}
+    df = raw.rename(columns=rename_map)
+    df = df.loc[:, ~df.columns.duplicated()]
+    keep_cols = [k for k in COLUMN_ALIAS if k in df.columns]
+    if "OCC_TITLE" not in keep_cols:
+        raise ValueError("no OCC_TITLE column after renaming")
+    df = df[keep_cols].copy()
+
+    for col in FLOAT_FIELDS:
+        if col in df.columns:
+            text = df[col].astype(str).str.strip().str.replace(",", "", regex=False)
+            df[col] = pd.to_numeric(text.mask(text.isin(SUPPRESSED_MARKERS)), errors="coerce")
+
+    for col in FLAG_FIELDS:
+        if col in df.columns:
+            text = df[col].astype(str).str.strip().str.upper()
+            df[col] = text.map({"TRUE": True, "FALSE": False, "1": True, "0": False}).astype("boolean")
+
+    if "GROUP" in df.columns:
+        df["GROUP"] = df["GROUP"].astype(str).str.strip().str.lower().map(GROUP_VALUES)
+
+    for col in ("OCC_CODE", "OCC_TITLE", "STATE", "ST"):
+        if col in df.columns:
+            df[col] = df[col].astype("string").str.strip()
+
+    df = df[df["OCC_TITLE"] != "All Occupations"]
+    return df.reset_index(drop=True)
+
+
+def clean_year(year, paths):
+    # runs in a worker process
+    started = time.perf_counter()
+    parts = [harmonize(pd.read_excel(path)) for path in paths]
+    df = pd.concat(parts, ignore_index=True, sort=False) if len(parts) > 1 else parts[0]
+    return year, df, time.perf_counter() - started
+
+
+def atomic_write_csv(df, path):
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_csv(tmp, index=False)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def atomic_write_parquet(df, path):
+    # sorted by STATE so each row group's min/max statistics cover only a few states
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if "STATE" in df.columns:
+        df = df.sort_values("STATE", kind="mergesort")
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, tmp, row_group_size=PARQUET_ROW_GROUP, compression="zstd", write_statistics=True)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def atomic_write_json(data, path):
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_manifest(out_dir=CLEANED_DIR):
+    path = Path(out_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {"years": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def plan(sources, manifest, out_dir=CLEANED_DIR, force=False, parquet=False):
+    stale = {}
+    fingerprints = {}
+    for year, paths in sources.items():
+        previous = manifest["years"].get(year)
+        fingerprint, entries = fingerprint_sources(paths, previous)
+        fingerprints[year] = (fingerprint, entries)
+        output = Path(out_dir) / f"data_{year}.csv"
+        columnar = Path(out_dir) / PARQUET_DIR_NAME / f"data_{year}.parquet"
+        missing = not output.exists() or (parquet and not columnar.exists())
+        if force or not previous or previous.get("fingerprint") != fingerprint or missing:
+            stale[year] = paths
+    return stale, fingerprints
+
+
+def rebuild_combined(out_dir=CLEANED_DIR):
+    parts = []
+    for path in sorted(Path(out_dir).glob("data_*.csv")):
+        m = re.search(r"data_(\d{4})\.csv$", path.name)
+        if m:
+            parts.append(pd.read_csv(path, low_memory=False).assign(year=int(m.group(1))))
+    if parts:
+        combined = add_flags(pd.concat(parts, ignore_index=True, sort=False))
+        atomic_write_csv(combined, Path(out_dir) / COMBINED_NAME)
+    return len(parts)
+
+
+def run(raw_dir=RAW_DIR, out_dir=CLEANED_DIR, jobs=None, force=False, years=None, combined=True, parquet=False, log=print):
+    """Cleans the stale years; returns (years written, years that failed).
+
+    A year whose workbooks cannot be cleaned is logged and left as it was; the others still run.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sources = discover_sources(raw_dir)
+    if years:
+        sources = {y: p for y, p in sources.items() if y in set(map(str, years))}
+    manifest = load_manifest(out_dir)
+    stale, fingerprints = plan(sources, manifest, out_dir, force=force, parquet=parquet)
+
+    if not stale:
+        log(f"All {len(sources)} years up to date; nothing to clean.")
+        return [], []
+
+    log(f"Cleaning {len(stale)} of {len(sources)} years: {', '.join(sorted(stale))}")
+    written, failed = [], []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(clean_year, year, paths): year for year, paths in stale.items()}
+        for future in as_completed(futures):
+            try:
+                year, df, seconds = future.result()
+            except Exception as e:
+                failed.append(futures[future])
+                log(f"  {futures[future]}: failed ({type(e).__name__}: {e})")
+                continue
+            atomic_write_csv(df, out_dir / f"data_{year}.csv")
+            if parquet:
+                atomic_write_parquet(df, out_dir / PARQUET_DIR_NAME / f"data_{year}.parquet")
+            fingerprint, entries = fingerprints[year]
+            manifest["years"][year] = {
+                "fingerprint": fingerprint,
+                "sources": entries,
+                "rows": int(len(df)),
+                "columns": list(df.columns),
+                "etl_version": ETL_VERSION,
+            }
+            # the manifest is saved after every year so an interrupted run keeps finished work
+            atomic_write_json(manifest, out_dir / MANIFEST_NAME)
+            written.append(year)
+            log(f"  {year}: {len(df):,} rows in {seconds:.1f}s")
+
+    if combined:
+        n = rebuild_combined(out_dir)
+        log(f"Rebuilt {COMBINED_NAME} from {n} years.")
+    if failed:
+        log(f"Failed: {', '.join(sorted(failed))}")
+    return sorted(written), sorted(failed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clean changed BLS OEWS state workbooks into cleaned_data/.")
+    parser.add_argument("--raw", default=str(RAW_DIR), help="folder holding oesm<NN>st/ subfolders")
+    parser.add_argument("--out", default=str(CLEANED_DIR), help="folder for data_<year>.csv outputs")
+    parser.add_argument("--jobs", type=int, default=None, help="parallel worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="re-clean every year regardless of fingerprints")
+    parser.add_argument("--years", nargs="*", help="limit the run to these years")
+    parser.add_argument("--no-combined", action="store_true", help=f"skip rebuilding {COMBINED_NAME}")
+    parser.add_argument("--parquet", action="store_true", help=f"also write {PARQUET_DIR_NAME}/data_<year>.parquet for range reads")
+    args = parser.parse_args(argv)
+    _, failed = run(args.raw, args.out, jobs=args.jobs, force=args.force, years=args.years, combined=not args.no_combined, parquet=args.parquet)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+"""Filtered bulk exports of the stacked year panel, streamed in bounded chunks.
+
+Rows are selected through query.PanelStore and encoded a chunk at a time, so memory stays flat
+however many years are exported:
+
+- csv: gzip-compressed CSV, produced incrementally with a zlib stream
+- parquet: one row group per chunk through pyarrow's ParquetWriter (zstd-compressed)
+
+stream_export() yields bytes; the query API sends them with chunked transfer encoding, and the
+Export tab spools them to a temporary file for st.download_button. The download button itself
+holds the whole file in memory, so the tab caps its size; the API streams any size.
+"""
+import io
+import os
+import tempfile
+import weakref
+import zlib
+
+import pandas as pd
+
+CHUNK_ROWS = 50_000
+FORMATS = {
+    "csv": ("application/gzip", "csv.gz"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def _gzip_csv(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    header = True
+    for frame in chunks:
+        text = frame.to_csv(index=False, header=header)
+        header = False
+        data = compressor.compress(text.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class _Drain(io.RawIOBase):
+    # write-only sink that hands back whatever was written since the last drain()
+    def __init__(self):
+        self._parts = []
+        self._pos = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._parts.append(bytes(b))
+        self._pos += len(b)
+        return len(b)
+
+    def tell(self):
+        return self._pos
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+def parquet_schema(frame):
+    import pyarrow as pa
+
+    fields = []
+    for col in frame.columns:
+        dtype = frame[col].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            fields.append(pa.field(col, pa.bool_()))
+        elif pd.api.types.is_integer_dtype(dtype):
+            fields.append(pa.field(col, pa.int64()))
+        elif pd.api.types.is_float_dtype(dtype):
+            fields.append(pa.field(col, pa.float64()))
+        else:
+            # object / string / categorical columns go out as strings so every chunk agrees
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields)
+
+
+def _parquet(chunks, schema):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _Drain()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for frame in chunks:
+            for field in schema:
+                if pa.types.is_string(field.type):
+                    frame[field.name] = frame[field.name].astype("string")
+            writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+            data = sink.drain()
+            if data:
+                yield data
+    yield sink.drain()
+
+
+def stream_export(store, rows, columns=None, fmt="csv", chunk_rows=CHUNK_ROWS):
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    columns = [c for c in (columns or store.columns) if c in store.columns]
+    chunks = store.chunks(rows, columns, chunk_rows=chunk_rows)
+    if fmt == "csv":
+        return _gzip_csv(chunks)
+    return _parquet((frame.copy() for frame in chunks), parquet_schema(store.panel[columns].iloc[:0]))
+
+
+def export_filename(fmt, years=None):
+    years = sorted(int(y) for y in years) if years else []
+    span = f"{years[0]}_{years[-1]}" if years else "all_years"
+    return f"wage_export_{span}.{FORMATS[fmt][1]}"
+
+
+def spool_export(store, rows, columns=None, fmt="csv"):
+    # writes the stream to a temporary file and returns (path, size); only one chunk is in memory
+    suffix = "." + FORMATS[fmt][1]
+    with tempfile.NamedTemporaryFile(prefix="wage_export_", suffix=suffix, delete=False) as f:
+        for data in stream_export(store, rows, columns, fmt):
+            f.write(data)
+        return f.name, f.tell()
+
+
+def _unlink(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class SpooledExport:
+    # a spooled file owned by one session, with the filters it was made for; the file is removed
+    # by discard(), when the object is garbage-collected with its session state, or at exit
+    def __init__(self, path, size, name, mime, filters):
+        self.path, self.size, self.name, self.mime, self.filters = path, size, name, mime, filters
+        self._remove = weakref.finalize(self, _unlink, path)
+
+    def discard(self):
+        self._remove()
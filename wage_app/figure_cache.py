@@ -0,0 +1,121 @@
+"""Cached Plotly figure specs for tabs whose charts come from constant data.
+
+Figure builders register themselves with @register_figure(name). A figure is built and
+serialized to JSON once per version (the source of the builder's module, the plotly version and
+an optional data_version callable), stored in the shared cache so every worker on the host reuses
+it, and memoized per process as a ready Figure so a rerun only hands it to st.plotly_chart.
+
+Specs can be pre-built at deploy time into wage_app/figure_specs/ with
+
+    python -m wage_app.figure_cache
+"""
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import sys
+import threading
+from pathlib import Path
+
+import plotly
+import plotly.graph_objects as go
+import streamlit as st
+
+from wage_app import shared_cache
+
+PREBUILT_DIR = Path(__file__).resolve().parent / "figure_specs"
+# tab modules whose figures are pre-built at deploy time
+FIGURE_MODULES = ("wage_app.tabs.conclusion", "wage_app.tabs.models")
+
+FIGURE_BUILDERS = {}
+_data_versions = {}
+_figures = {}
+_lock = threading.Lock()
+
+
+def register_figure(name, data_version=None):
+    def decorator(builder):
+        FIGURE_BUILDERS[name] = builder
+        if data_version is not None:
+            _data_versions[name] = data_version
+        return builder
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _module_digest(module):
+    # the whole module is hashed so edits to shared styling helpers invalidate its figures too
+    return hashlib.sha256(inspect.getsource(module).encode("utf-8")).hexdigest()
+
+
+def figure_version(name):
+    builder = FIGURE_BUILDERS[name]
+    data_version = _data_versions[name]() if name in _data_versions else ""
+    payload = "\0".join([name, plotly.__version__, data_version, _module_digest(sys.modules[builder.__module__])])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _prebuilt_spec(name, version):
+    path = PREBUILT_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data["spec"] if data.get("version") == version else None
+
+
+def figure_spec(name):
+    version = figure_version(name)
+    spec = _prebuilt_spec(name, version)
+    if spec is None:
+        spec = shared_cache.get_backend().obj(
+            f"figure:{name}:{version}", lambda: FIGURE_BUILDERS[name]().to_json()
+        )
+    return version, spec
+
+
+def cached_figure(name):
+    version = figure_version(name)
+    key = (name, version)
+    fig = _figures.get(key)
+    if fig is None:
+        _, spec = figure_spec(name)
+        fig = go.Figure(json.loads(spec) if isinstance(spec, str) else spec)
+        with _lock:
+            _figures[key] = fig
+    return fig
+
+
+def show_figure(name, **kwargs):
+    # st.plotly_chart has no public way to take a serialized spec: whatever it gets is turned into
+    # a validated Figure and serialized again. A ready Figure is its cheapest input (about 1 ms a
+    # chart here, against about 10 ms for the parsed spec dict, which plotly validates trace by trace)
+    kwargs.setdefault("use_container_width", True)
+    st.plotly_chart(cached_figure(name), **kwargs)
+
+
+def prebuild(modules=FIGURE_MODULES, out_dir=PREBUILT_DIR):
+    for module in modules:
+        importlib.import_module(module)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, builder in sorted(FIGURE_BUILDERS.items()):
+        version = figure_version(name)
+        payload = {"version": version, "spec": json.loads(builder().to_json())}
+        path = out_dir / f"{name}.json"
+        path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    # builders register with the importable module, not with this __main__ copy
+    from wage_app import figure_cache
+
+    for path in figure_cache.prebuild():
+        print(f"wrote {path}")
@@ -0,0 +1,170 @@
+"""Next-year A_MEAN forecasts for every (STATE, OCC_CODE) series at once.
+
+Each series gets a damped-trend (Holt) exponential smoothing model on log wages. Instead of a
+Python loop over tens of thousands of series, all series sit in one (series x year) matrix and
+every candidate (alpha, beta, phi) on a small grid is run in parallel as an extra leading axis,
+so the only loop is over the ~20 years. Each series keeps the parameters with the lowest
+one-step-ahead error; that error also sizes the prediction intervals. Gaps in a series, and years
+missing from cleaned_data altogether, are carried through the model's own forecast.
+
+backtest() refits with the last year held out and compares against a last-value forecast.
+"""
+import numpy as np
+import pandas as pd
+
+# bump when the model changes so cached forecasts are rebuilt
+FORECAST_VERSION = 2
+ALPHAS = (0.2, 0.4, 0.6, 0.8, 1.0)
+BETAS = (0.0, 0.1, 0.3)
+PHIS = (0.8, 0.9, 0.98)  # kept below 1 so the trend always damps
+MIN_OBSERVATIONS = 4
+Z_80, Z_95 = 1.2816, 1.96
+
+
+def series_matrix(panel, value="A_MEAN"):
+    # one row per (STATE, OCC_CODE), one column per year; duplicate rows are averaged
+    data = panel.dropna(subset=["STATE", "OCC_CODE"])
+    values = pd.to_numeric(data[value], errors="coerce").to_numpy(dtype=float)
+    keys = pd.MultiIndex.from_arrays([data["STATE"].astype(str), data["OCC_CODE"].astype(str).str.strip()])
+    rows, index = keys.factorize()
+    cols, years = pd.factorize(data["year"].astype(int), sort=True)
+    ok = np.isfinite(values) & (values > 0)
+    total = np.zeros((len(index), len(years)))
+    count = np.zeros_like(total)
+    np.add.at(total, (rows[ok], cols[ok]), values[ok])
+    np.add.at(count, (rows[ok], cols[ok]), 1)
+    with np.errstate(invalid="ignore"):
+        matrix = total / count
+    index = index.set_names(["STATE", "OCC_CODE"])
+    return matrix, index, np.asarray(years)
+
+
+def _has_series(panel, value):
+    # an empty panel (e.g. only LFS pointers offline) has none of the key columns
+    return not panel.empty and {"STATE", "OCC_CODE", "year", value}.issubset(panel.columns)
+
+
+def _grid():
+    alpha, beta, phi = np.meshgrid(ALPHAS, BETAS, PHIS, indexing="ij")
+    return alpha.ravel()[:, None], beta.ravel()[:, None], phi.ravel()[:, None]
+
+
+def damped_trend(y):
+    """Fits every parameter combination to every row of y (log scale, NaN = missing).
+
+    Columns are consecutive years. Missing values are steps the level and damped trend advance
+    through unobserved, so the returned state is at the last column, trailing gaps included.
+
+    Returns per-series (level, trend, alpha, beta, phi, rmse, n_errors, steps_since_last_obs).
+    """
+    alpha, beta, phi = _grid()
+    n_combos, (n_series, n_years) = len(alpha), y.shape
+    level = np.full((n_combos, n_series), np.nan)
+    trend = np.zeros((n_combos, n_series))
+    sse = np.zeros((n_combos, n_series))
+    n_err = np.zeros(n_series)
+    since_obs = np.zeros(n_series)
+
+    for t in range(n_years):
+        obs = y[:, t]
+        seen = np.isfinite(obs)
+        started = np.isfinite(level[0])
+        pred = level + phi * trend
+        update = seen & started
+        err = np.where(update, obs - pred, 0.0)
+        sse += err ** 2
+        n_err += update
+        new_level = np.where(update, pred + alpha * err, pred)
+        new_trend = np.where(update, beta * (new_level - level) + (1 - beta) * phi * trend, phi * trend)
+        # series start at their first observation with a flat trend
+        first = seen & ~started
+        level = np.where(first, obs, new_level)
+        trend = np.where(first, 0.0, new_trend)
+        since_obs = np.where(seen, 0, since_obs + 1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rmse = np.sqrt(sse / n_err)
+    # series with too few errors fall back to the first combination's state and get no interval
+    best = np.argmin(np.where(np.isfinite(rmse), rmse, np.inf), axis=0)
+    cols = np.arange(n_series)
+    return (
+        level[best, cols], trend[best, cols],
+        alpha[best, 0], beta[best, 0], phi[best, 0],
+        rmse[best, cols], n_err, since_obs,
+    )
+
+
+def consecutive(matrix, years):
+    # spreads the year columns over every year from first to last; years without a file are all-NaN
+    years = np.asarray(years, dtype=int)
+    full = np.full((len(matrix), years[-1] - years[0] + 1), np.nan)
+    full[:, years - years[0]] = matrix
+    return full
+
+
+def forecast_matrix(matrix, years=None, horizon=1):
+    # `horizon` years past the last column; damped_trend already carried each series through its
+    # trailing gap, so only the horizon is added here
+    if years is not None:
+        matrix = consecutive(matrix, years)
+    log_y = np.log(matrix)
+    level, trend, alpha, beta, phi, rmse, n_err, since_obs = damped_trend(log_y)
+    # h-step damped trend: level + (phi + phi^2 + ... + phi^h) * trend
+    point = level + phi * (1 - phi ** horizon) / (1 - phi) * trend
+    # the interval still widens with every unobserved year since the last observation
+    sigma = rmse * np.sqrt(since_obs + horizon)
+    enough = (np.isfinite(matrix).sum(axis=1) >= MIN_OBSERVATIONS) & np.isfinite(point)
+    out = {
+        "forecast": np.exp(point),
+        "lower_80": np.exp(point - Z_80 * sigma),
+        "upper_80": np.exp(point + Z_80 * sigma),
+        "lower_95": np.exp(point - Z_95 * sigma),
+        "upper_95": np.exp(point + Z_95 * sigma),
+        "alpha": alpha, "beta": beta, "phi": phi,
+        "rmse_log": rmse,
+        "n_obs": np.isfinite(matrix).sum(axis=1),
+    }
+    return {k: np.where(enough, v, np.nan) if k != "n_obs" else v for k, v in out.items()}
+
+
+def build_forecasts(panel, value="A_MEAN"):
+    if not _has_series(panel, value):
+        return pd.DataFrame()
+    matrix, index, years = series_matrix(panel, value)
+    result = forecast_matrix(matrix, years)
+    has_obs = np.isfinite(matrix).any(axis=1)
+    last_col = np.where(has_obs, matrix.shape[1] - 1 - np.argmax(np.isfinite(matrix[:, ::-1]), axis=1), 0)
+    frame = index.to_frame(index=False)
+    frame["last_year"] = years[last_col]
+    frame["last_value"] = matrix[np.arange(len(matrix)), last_col]
+    frame["forecast_year"] = int(years.max()) + 1
+    for name, values in result.items():
+        frame[name] = values
+    frame["growth_pct"] = (frame["forecast"] / frame["last_value"] - 1) * 100
+
+    titles = panel.dropna(subset=["OCC_CODE"]).sort_values("year", kind="mergesort").drop_duplicates("OCC_CODE", keep="last")
+    frame.insert(2, "OCC_TITLE", frame["OCC_CODE"].map(dict(zip(titles["OCC_CODE"].astype(str).str.strip(), titles["OCC_TITLE"]))))
+    return frame.dropna(subset=["forecast"]).reset_index(drop=True)
+
+
+def backtest(panel, value="A_MEAN"):
+    # holds out the final year: model vs last-value forecast, median absolute % error
+    if not _has_series(panel, value):
+        return None
+    matrix, _, years = series_matrix(panel, value)
+    if matrix.shape[1] < MIN_OBSERVATIONS + 1:
+        return None
+    train, actual = matrix[:, :-1], matrix[:, -1]
+    fitted = forecast_matrix(train, years[:-1], horizon=int(years[-1] - years[-2]))
+    predicted, lower, upper = fitted["forecast"], fitted["lower_80"], fitted["upper_80"]
+    last = pd.DataFrame(train).ffill(axis=1).to_numpy()[:, -1]
+    ok = np.isfinite(actual) & np.isfinite(predicted) & np.isfinite(last)
+    if not ok.any():
+        return None
+    return {
+        "year": int(years[-1]),
+        "series": int(ok.sum()),
+        "model_mdape": float(np.median(np.abs(predicted[ok] / actual[ok] - 1)) * 100),
+        "naive_mdape": float(np.median(np.abs(last[ok] / actual[ok] - 1)) * 100),
+        "coverage_80": float(np.mean((actual[ok] >= lower[ok]) & (actual[ok] <= upper[ok])) * 100),
+    }
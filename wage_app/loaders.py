@@ -0,0 +1,341 @@
+"""Data loaders shared by the data tabs (cleaned_data years, GitHub assets)."""
+import hashlib
+import io
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import requests
+import streamlit as st
+
+from wage_app import memory, shared_cache
+
+OWNER = "Soorej30"
+REPO = "wage_analysis"
+BRANCH = "main"
+CLEANED_DIR = Path("cleaned_data")
+# bump when build_panel() adds or changes derived columns so cached panels are rebuilt
+PANEL_VERSION = 4
+
+
+def _read_csv_or_lfs(path):
+    from wage_app import remote
+
+    # a bare checkout only has Git LFS pointers; the object is fetched once and kept on disk
+    if remote.is_lfs_pointer(path):
+        path = remote.resolve_pointer(path)
+    return pd.read_csv(path)
+
+
+def _year_key(path):
+    return f"{shared_cache.file_key('csv', path)}:{memory.LAYOUT_VERSION}"
+
+
+def read_cleaned_csv(path):
+    # years are kept in the compact layout of wage_app.memory; the per-column report is stored beside them
+    backend = shared_cache.get_backend()
+    key = _year_key(path)
+
+    def build():
+        df, report = memory.optimize(_read_csv_or_lfs(path))
+        backend.put_object(f"memory:{key}", report)
+        return df
+
+    try:
+        return backend.frame(key, build)
+    except Exception as e:
+        return e
+
+
+def year_memory_report(path):
+    # bytes per column before / after optimize() for one cleaned year; like read_cleaned_csv,
+    # a year that cannot be read returns the exception for the caller to show
+    try:
+        return shared_cache.get_backend().obj(
+            f"memory:{_year_key(path)}", lambda: memory.optimize(_read_csv_or_lfs(path))[1]
+        )
+    except Exception as e:
+        return e
+
+
+class YearPrefetcher:
+    # Warms neighbouring cleaned_data years on a small thread pool while the current page renders.
+    # Only the latest window is kept: queued parses for years that fell out of it are cancelled
+    # and finished ones beyond max_ready are dropped, so scrubbing through years never piles up work.
+    def __init__(self, max_workers=2, max_ready=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="year-prefetch")
+        self._lock = threading.Lock()
+        self._futures = OrderedDict()
+        self._served = set()
+        self._max_ready = max_ready
+
+    def schedule(self, paths):
+        with self._lock:
+            # years already handed to load_csv_local are cached there and need no warming
+            wanted = [Path(p) for p in paths if Path(p) not in self._served]
+            for path in list(self._futures):
+                if path not in wanted and self._futures[path].cancel():
+                    del self._futures[path]
+            for path in wanted:
+                if path not in self._futures:
+                    self._futures[path] = self._executor.submit(read_cleaned_csv, path)
+                self._futures.move_to_end(path)
+            ready = [p for p, f in self._futures.items() if f.done() and p not in wanted]
+            for path in ready[: max(0, len(ready) - self._max_ready)]:
+                del self._futures[path]
+
+    def take(self, path):
+        # returns the prefetched result (waiting if the parse is already running) or None
+        with self._lock:
+            future = self._futures.pop(Path(path), None)
+            self._served.add(Path(path))
+        if future is None or future.cancelled():
+            return None
+        return future.result()
+
+    def clear(self):
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+            self._served.clear()
+
+
+@st.cache_resource(show_spinner=False)
+def year_prefetcher():
+    return YearPrefetcher()
+
+
+# cache_resource: the frame is shared (and, with the host backend, memory-mapped) instead of
+# being unpickled into a private copy on every call
+@st.cache_resource(show_spinner=False)
+def load_csv_local(path):
+    warmed = year_prefetcher().take(path)
+    if warmed is not None:
+        return warmed
+    return read_cleaned_csv(path)
+
+
+_http = threading.local()
+
+
+def http_session():
+    # one pooled keep-alive session per thread; repeated GitHub fetches reuse the connection
+    session = getattr(_http, "session", None)
+    if session is None:
+        session = _http.session = requests.Session()
+    return session
+
+
+def fetch_url_bytes(url, timeout=15):
+    # GitHub assets are downloaded once per host and then served from the shared cache
+    def download():
+        r = http_session().get(url, timeout=timeout)
+        r.raise_for_status()
+        return r.content
+
+    return shared_cache.get_backend().obj(f"http:{url}", download)
+
+
+@st.cache_resource(show_spinner=False)
+def load_excel_github(raw_url):
+    return shared_cache.get_backend().frame(
+        f"xls:{raw_url}", lambda: pd.read_excel(io.BytesIO(fetch_url_bytes(raw_url, timeout=20)))
+    )
+
+
+@st.cache_resource(show_spinner=False, ttl=600)
+def remote_years():
+    from wage_app import remote
+
+    return remote.remote_year_files()
+
+
+@st.cache_resource(show_spinner="Fetching from GitHub...")
+def load_remote_year(year, sha, columns=None, states=None):
+    """(frame, stats) for a GitHub year; `sha` is the git blob id, so new commits miss the cache.
+
+    The result also goes to the host cache, where stats is empty because nothing was fetched.
+    """
+    from wage_app import remote
+
+    stats = {}
+
+    def fetch():
+        df, info = remote.load_year(remote_years()[year], list(columns or []), list(states or []))
+        stats.update(info)
+        return df
+
+    key = f"remote-year:{sha}:{','.join(columns or [])}:{','.join(states or [])}"
+    return shared_cache.get_backend().frame(key, fetch), stats
+
+
+def neighbour_years(available_years, selected_year):
+    # previous year (used by the similarity section), the one before it and the next newer year
+    if selected_year not in available_years:
+        return []
+    idx = available_years.index(selected_year)
+    return [available_years[i] for i in (idx + 1, idx + 2, idx - 1) if 0 <= i < len(available_years)]
+
+
+def cleaned_year_files(cleaned_dir=CLEANED_DIR):
+    cleaned_dir = Path(cleaned_dir)
+    year_files = {}
+    if not cleaned_dir.exists():
+        return year_files
+    for p in sorted(cleaned_dir.iterdir()):
+        if p.is_file() and p.name.lower().startswith("data_") and p.suffix.lower() == ".csv":
+            m = re.search(r'data_(\d{4})', p.name, re.IGNORECASE)
+            if m:
+                year_files[m.group(1)] = p
+    return year_files
+
+
+def data_version(cleaned_dir=CLEANED_DIR):
+    # changes whenever any cleaned year file is rewritten; used to key derived indexes
+    keys = [shared_cache.file_key("csv", p) for _, p in sorted(cleaned_year_files(cleaned_dir).items())]
+    return hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()[:16]
+
+
+def build_panel(cleaned_dir=CLEANED_DIR):
+    from wage_app.anomalies import add_flags
+
+    parts = []
+    for year, path in sorted(cleaned_year_files(cleaned_dir).items()):
+        df = read_cleaned_csv(path)
+        if isinstance(df, pd.DataFrame) and not df.empty:
+            parts.append(df.assign(year=int(year)))
+    if not parts:
+        return pd.DataFrame()
+    # years disagree on categories and on which columns have gaps, so the stack is compacted again
+    panel, _ = memory.optimize(memory.concat(parts))
+    return add_flags(panel)
+
+
+def panel_memory_report(version):
+    # panel columns against the raw bytes of the same columns summed over the per-year reports,
+    # so the uncompacted panel never has to be built; derived columns (year, FLAGS) count as-is
+    panel = load_panel(version)
+    after = memory.column_bytes(panel)
+    rows = pd.DataFrame({
+        "column": list(panel.columns),
+        "dtype_after": [str(panel[c].dtype) for c in panel.columns],
+        "bytes_after": [int(after[c]) for c in panel.columns],
+    })
+    years = [year_memory_report(p) for _, p in sorted(cleaned_year_files().items())]
+    years = [report for report in years if isinstance(report, pd.DataFrame)]
+    raw = pd.concat(years, ignore_index=True) if years else pd.DataFrame(columns=["column", "dtype_before", "bytes_before"])
+    raw = raw.groupby("column").agg(dtype_before=("dtype_before", "first"), bytes_before=("bytes_before", "sum"))
+    rows = rows.join(raw, on="column")
+    rows["dtype_before"] = rows["dtype_before"].fillna(rows["dtype_after"])
+    rows["bytes_before"] = rows["bytes_before"].fillna(rows["bytes_after"]).astype("int64")
+    rows["saved_pct"] = (1 - rows["bytes_after"] / rows["bytes_before"].where(rows["bytes_before"] > 0)) * 100
+    return rows[["column", "dtype_before", "dtype_after", "bytes_before", "bytes_after", "saved_pct"]]
+
+
+@st.cache_resource(show_spinner="Loading all cleaned years...")
+def load_panel(version):
+    # every cleaned year stacked with `year` and `FLAGS` columns, built once per data version and host
+    return shared_cache.get_backend().frame(f"panel:{PANEL_VERSION}:{memory.LAYOUT_VERSION}:{version}", build_panel)
+
+
+def year_flags(version, year, n_rows):
+    # FLAGS for one cleaned year in file row order (build_panel keeps each file's order),
+    # or None when the panel does not line up with the file
+    panel = load_panel(version)
+    if "FLAGS" not in panel.columns:
+        return None
+    flags = panel["FLAGS"].to_numpy()[panel["year"].to_numpy() == int(year)]
+    return flags if len(flags) == n_rows else None
+
+
+@st.cache_resource(show_spinner=False)
+def panel_store(version):
+    from wage_app.query import PanelStore
+
+    return PanelStore(load_panel(version), version)
+
+
+@st.cache_resource(show_spinner="Indexing occupations and states...")
+def search_index(version):
+    from wage_app.search import SearchIndex
+
+    return SearchIndex(load_panel(version))
+
+
+@st.cache_resource(show_spinner="Rolling up the SOC hierarchy...")
+def rollup_cube(version):
+    from wage_app.soc_rollup import ROLLUP_VERSION, RollupCube, build_rollup
+
+    cube = shared_cache.get_backend().frame(
+        f"soc_rollup:{ROLLUP_VERSION}:{version}", lambda: build_rollup(load_panel(version))
+    )
+    return RollupCube(cube)
+
+
+@st.cache_resource(show_spinner="Fitting forecasts for every state and occupation...")
+def forecasts(version):
+    from wage_app.forecast import FORECAST_VERSION, backtest, build_forecasts
+
+    backend = shared_cache.get_backend()
+    key = f"forecast:{FORECAST_VERSION}:{version}"
+    frame = backend.frame(key, lambda: build_forecasts(load_panel(version)))
+    return frame, backend.obj(f"{key}:backtest", lambda: backtest(load_panel(version)))
+
+
+@st.cache_resource(show_spinner="Indexing pay spread across states...")
+def spread_index(version):
+    from wage_app.spread_index import SPREAD_VERSION, VALUE, SpreadIndex, year_ranks, year_summary
+
+    # one partition per cleaned year, keyed by that year's file: a new year builds only itself
+    backend = shared_cache.get_backend()
+    ranks, summaries = [], []
+    for year, path in sorted(cleaned_year_files().items()):
+        key = f"spread:{SPREAD_VERSION}:{shared_cache.file_key('csv', path)}"
+
+        def build(year=year, path=path):
+            df = read_cleaned_csv(path)
+            if isinstance(df, Exception):
+                raise df
+            if df.empty or not {"OCC_TITLE", VALUE}.issubset(df.columns):
+                df = pd.DataFrame()
+            return year_ranks(df, year)
+
+        try:
+            part = backend.frame(f"{key}:ranks", build)
+        except Exception:
+            # unreadable year (e.g. an LFS object offline): skipped without caching, so it is retried
+            continue
+        if part.empty:
+            continue
+        ranks.append(part)
+        summaries.append(backend.frame(f"{key}:summary", lambda part=part: year_summary(part)))
+    if not ranks:
+        return SpreadIndex(year_ranks(pd.DataFrame(), 0), pd.DataFrame(columns=["OCC_CODE", "year", "OCC_TITLE"]))
+    return SpreadIndex(pd.concat(ranks, ignore_index=True), pd.concat(summaries, ignore_index=True))
+
+
+@st.cache_resource(show_spinner=False)
+def model_runs(version):
+    # artifact keys of the Models tab grids for this data version (hashes every year file once per host)
+    from wage_app.training import plan
+
+    return plan()
+
+
+def clear_caches():
+    load_csv_local.clear()
+    load_panel.clear()
+    panel_store.clear()
+    search_index.clear()
+    rollup_cube.clear()
+    forecasts.clear()
+    spread_index.clear()
+    model_runs.clear()
+    load_excel_github.clear()
+    remote_years.clear()
+    load_remote_year.clear()
+    year_prefetcher().clear()
@@ -0,0 +1,493 @@
+"""Capacity test: concurrent headless dashboard sessions against one app process.
+
+Every virtual user is a streamlit.testing AppTest session. Like browser sessions on a real server,
+they share one process, its caches and the GIL. Each user opens the app and then plays a random
+mix of realistic actions, one rerun at a time:
+
+- "years": Data Exploration, switching between cleaned years
+- "github": Data Exploration on the GitHub source (listings, LFS objects, Parquet range reads)
+- "inspection": Inspection, comparing two years from the GitHub reports
+- "raw_files": Uncleaned Data, opening a raw workbook from GitHub (the download button's bytes)
+- "export": Export, preparing a filtered download
+- "search" / "states" / "groups": occupation search, state comparison and SOC drill-down
+
+GitHub is replaced by StubGitHub, a local server for the raw, LFS media and contents API
+endpoints. It serves the working tree, with an optional per-request delay standing in for
+network latency. The app is pointed at it through WAGE_GITHUB_RAW_URL, WAGE_GITHUB_MEDIA_URL and
+WAGE_GITHUB_API_URL.
+
+Concurrency is ramped through --levels. Each level reports p50 / p95 / p99 rerun latency,
+throughput, errors and resident memory per session. The saturation point is the first level
+where throughput grows by less than --min-gain over the previous level, or where p95 exceeds
+--slo-ms. The level before it is the instance's capacity, which the summary turns into an
+autoscaling rule. Run from the repository root:
+
+    python -m wage_app.loadtest --levels 1,2,4,8 --steps 8 --github-latency-ms 40
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+import numpy as np
+
+GITHUB_ENV = ("WAGE_GITHUB_RAW_URL", "WAGE_GITHUB_MEDIA_URL", "WAGE_GITHUB_API_URL")
+
+# relative frequency of each action in a session
+MIX = {"years": 4, "github": 2, "inspection": 2, "raw_files": 1, "export": 1, "search": 2, "states": 2, "groups": 1}
+
+
+class StubGitHub:
+    """Local stand-in for raw.githubusercontent.com, the LFS media host and the contents API.
+
+    /raw/<path> serves files as committed (LFS pointers stay pointers) with Range support,
+    /media/<path> serves the object behind a pointer (from .git/lfs or the app's LFS cache) and
+    /api/contents/<folder> lists a folder with git blob ids. Used as a context manager it sets
+    the WAGE_GITHUB_* variables and restores them on exit.
+    """
+
+    def __init__(self, root=".", latency_ms=0.0, host="127.0.0.1", port=0):
+        self.root = Path(root).resolve()
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._blob_ids = {}
+        self._saved_env = {}
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, name="stub-github", daemon=True).start()
+        for name, value in zip(GITHUB_ENV, (f"{self.url}/raw", f"{self.url}/media", f"{self.url}/api")):
+            self._saved_env[name] = os.environ.get(name)
+            os.environ[name] = value
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+        for name, value in self._saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    def _local(self, repo_path):
+        path = (self.root / repo_path).resolve()
+        return path if path.is_relative_to(self.root) else None
+
+    def _blob_id(self, path):
+        stat = path.stat()
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        if key not in self._blob_ids:
+            h = hashlib.sha1(f"blob {stat.st_size}\0".encode())
+            h.update(path.read_bytes())
+            self._blob_ids[key] = h.hexdigest()
+        return self._blob_ids[key]
+
+    def _lfs_object(self, path):
+        from wage_app import remote
+
+        parsed = remote.parse_lfs_pointer(path.read_bytes())
+        if parsed is None:
+            return path
+        oid = parsed[0]
+        for candidate in (self.root / ".git" / "lfs" / "objects" / oid[:2] / oid[2:4] / oid, remote.lfs_dir() / oid):
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def listing(self, folder):
+        path = self._local(folder)
+        if path is None or not path.is_dir():
+            return None
+        items = []
+        for child in sorted(path.iterdir()):
+            repo_path = f"{folder.strip('/')}/{child.name}"
+            if child.is_dir():
+                items.append({"name": child.name, "path": repo_path, "type": "dir", "size": 0, "sha": ""})
+            elif child.is_file():
+                items.append({"name": child.name, "path": repo_path, "type": "file", "size": child.stat().st_size, "sha": self._blob_id(child)})
+        return items
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, headers=()):
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+                with stub._lock:
+                    stub.requests += 1
+                    stub.bytes_sent += len(body)
+
+            def _file(self, path):
+                if path is None or not path.is_file():
+                    return self._send(HTTPStatus.NOT_FOUND, b"Not Found")
+                data = path.read_bytes()
+                m = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+                if m is None:
+                    return self._send(HTTPStatus.OK, data)
+                start = int(m.group(1))
+                end = min(int(m.group(2)) if m.group(2) else len(data) - 1, len(data) - 1)
+                self._send(HTTPStatus.PARTIAL_CONTENT, data[start:end + 1], [("Content-Range", f"bytes {start}-{end}/{len(data)}")])
+
+            def do_GET(self):
+                time.sleep(stub.latency)
+                path = unquote(self.path.split("?")[0])
+                if path.startswith("/raw/"):
+                    return self._file(stub._local(path[len("/raw/"):]))
+                if path.startswith("/media/"):
+                    local = stub._local(path[len("/media/"):])
+                    return self._file(stub._lfs_object(local) if local is not None and local.is_file() else None)
+                if path.startswith("/api/contents/"):
+                    items = stub.listing(path[len("/api/contents/"):])
+                    if items is None:
+                        return self._send(HTTPStatus.NOT_FOUND, b'{"message": "Not Found"}')
+                    return self._send(HTTPStatus.OK, json.dumps(items).encode("utf-8"), [("Content-Type", "application/json")])
+                self._send(HTTPStatus.NOT_FOUND, b"Not Found")
+
+            do_HEAD = do_GET
+
+        return Handler
+
+
+def rss_bytes():
+    # resident set size of this process
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # peak only, in KB on Linux
+
+
+class MemorySampler:
+    """Peak RSS seen while the block runs, sampled every `interval` seconds."""
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.peak = rss_bytes()
+        self._stop = threading.Event()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, rss_bytes())
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_bytes())
+
+
+# --- virtual user ------------------------------------------------------------------------
+
+
+def _by_label(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    return None
+
+
+class Session:
+    """One headless dashboard user; every rerun is timed and tagged with the action it belongs to."""
+
+    def __init__(self, app_path, rng, think_ms=0.0, timeout=120):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(str(app_path), default_timeout=timeout)
+        self.rng = rng
+        self.think = think_ms / 1000
+        self.samples = []   # (action, seconds, ok)
+
+    def rerun(self, action):
+        if self.think:
+            time.sleep(self.rng.expovariate(1 / self.think))
+        started = time.perf_counter()
+        try:
+            self.at.run()
+            ok = not self.at.exception
+        except Exception:
+            ok = False
+        self.samples.append((action, time.perf_counter() - started, ok))
+
+    def tab(self, name, action):
+        self.at.sidebar.radio[0].set_value(name)
+        self.rerun(action)
+
+    def pick(self, widget, action):
+        # another option of a select box (widget options are their displayed labels), then its rerun
+        if widget is None:
+            return
+        options = [o for i, o in enumerate(widget.options) if i != widget.index]
+        if options:
+            widget.set_value(self.rng.choice(options))
+            self.rerun(action)
+
+    def source(self, name):
+        widget = _by_label(self.at.selectbox, "Data source")
+        if widget is not None and widget.value != name:
+            widget.set_value(name)
+            self.rerun("github" if name == "GitHub" else "years")
+        return widget is not None
+
+    def years(self):
+        self.tab("Data Exploration", "years")
+        self.source("Local")
+        for _ in range(self.rng.randint(1, 3)):
+            widget = _by_label(self.at.selectbox, "Select year")
+            if widget is None:
+                return
+            self.pick(widget, "years")
+
+    def github(self):
+        self.tab("Data Exploration", "github")
+        if not self.source("GitHub"):
+            return
+        widget = _by_label(self.at.selectbox, "Select year")
+        if widget is not None:
+            self.pick(widget, "github")
+
+    def inspection(self):
+        self.tab("Inspection and reflection", "inspection")
+        widget = _by_label(self.at.sidebar.multiselect, "Select 1 or 2 years to inspect / compare")
+        if widget is not None and len(widget.options) > 1:
+            widget.set_value(self.rng.sample(list(widget.options), 2))
+            self.rerun("inspection")
+
+    def raw_files(self):
+        self.tab("Uncleaned Data overview", "raw_files")
+        widget = _by_label(self.at.selectbox, "Select year (GitHub)")
+        if widget is not None:
+            self.pick(widget, "raw_files")
+
+    def export(self):
+        self.tab("Export", "export")
+        years = _by_label(self.at.multiselect, "Years (empty = all)")
+        if years is not None and years.options:
+            years.set_value([self.rng.choice(list(years.options))])
+            self.rerun("export")
+        button = _by_label(self.at.button, "Prepare download")
+        if button is not None:
+            button.click()
+            self.rerun("export")
+
+    def search(self):
+        self.tab("Occupation Search", "search")
+        box = _by_label(self.at.text_input, "Search occupations")
+        if box is not None:
+            box.input(self.rng.choice(["nurse", "software developers in texas", "teacher", "electricians california"]))
+            self.rerun("search")
+
+    def states(self):
+        self.tab("State Comparison", "states")
+        widget = _by_label(self.at.selectbox, "Occupation")
+        if widget is not None:
+            self.pick(widget, "states")
+
+    def groups(self):
+        self.tab("Occupation Groups", "groups")
+        widget = _by_label(self.at.selectbox, "State")
+        if widget is not None:
+            self.pick(widget, "groups")
+
+    def play(self, steps, mix=MIX):
+        self.rerun("open")
+        actions, weights = zip(*mix.items())
+        for action in self.rng.choices(actions, weights, k=steps):
+            getattr(self, action)()
+        return self.samples
+
+
+# --- ramp --------------------------------------------------------------------------------
+
+
+def percentiles(seconds):
+    if not seconds:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None}
+    p50, p95, p99 = np.percentile(np.asarray(seconds) * 1000, [50, 95, 99])
+    return {"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+def run_level(app_path, users, steps, seed, think_ms=0.0, timeout=120):
+    """All `users` sessions play `steps` actions at the same time; returns the level's figures."""
+    baseline = rss_bytes()
+    results = [None] * users
+    errors = []
+
+    def user(i):
+        try:
+            results[i] = Session(app_path, random.Random(seed * 1000 + i), think_ms, timeout).play(steps)
+        except Exception as e:  # a session that cannot even start counts as one failed rerun
+            errors.append(repr(e))
+            results[i] = [("open", 0.0, False)]
+
+    threads = [threading.Thread(target=user, args=(i,), name=f"user-{i}") for i in range(users)]
+    started = time.perf_counter()
+    with MemorySampler() as memory:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    elapsed = time.perf_counter() - started
+
+    samples = [s for session in results for s in session]
+    ok = [seconds for _, seconds, good in samples if good]
+    by_action = {}
+    for action, seconds, good in samples:
+        if good:
+            by_action.setdefault(action, []).append(seconds)
+    return {
+        "users": users,
+        "reruns": len(samples),
+        "errors": sum(1 for *_, good in samples if not good),
+        "seconds": elapsed,
+        "throughput_rps": len(ok) / elapsed if elapsed else 0.0,
+        **percentiles(ok),
+        "rss_baseline_mb": baseline / 1024 ** 2,
+        "rss_peak_mb": memory.peak / 1024 ** 2,
+        "mb_per_session": max(memory.peak - baseline, 0) / users / 1024 ** 2,
+        "actions": {a: {"reruns": len(v), **percentiles(v)} for a, v in sorted(by_action.items())},
+        "session_errors": errors,
+    }
+
+
+def saturation(levels, slo_ms, min_gain):
+    """(capacity row, saturated row) where capacity is the last level before throughput flattens or p95 breaks the SLO."""
+    capacity = None
+    for row in levels:
+        over_slo = row["p95_ms"] is None or row["p95_ms"] > slo_ms or row["errors"] > 0
+        flat = capacity is not None and row["throughput_rps"] < capacity["throughput_rps"] * (1 + min_gain)
+        if over_slo or flat:
+            return capacity, row
+        capacity = row
+    return capacity, None
+
+
+def warm_up(app_path, seed, timeout):
+    # one unmeasured pass through every action so the ramp measures warm caches, like a long-running instance
+    session = Session(app_path, random.Random(seed), timeout=timeout)
+    session.rerun("open")
+    for action in MIX:
+        getattr(session, action)()
+    return sum(1 for *_, good in session.samples if not good)
+
+
+def _fmt(value, spec=".0f"):
+    return "-" if value is None else format(value, spec)
+
+
+def report(levels, capacity, saturated, slo_ms, stub):
+    print(f"{'users':>6}{'reruns':>8}{'errors':>8}{'rerun/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'peak RSS MB':>13}{'MB/session':>12}")
+    for row in levels:
+        print(
+            f"{row['users']:>6}{row['reruns']:>8}{row['errors']:>8}{row['throughput_rps']:>9.2f}"
+            f"{_fmt(row['p50_ms']):>9}{_fmt(row['p95_ms']):>9}{_fmt(row['p99_ms']):>9}"
+            f"{row['rss_peak_mb']:>13.0f}{row['mb_per_session']:>12.1f}"
+        )
+    last = levels[-1]
+    print()
+    print(f"Rerun latency by action at {last['users']} users (p50 / p95 / p99 ms)")
+    for action, row in last["actions"].items():
+        print(f"  {action:<12}{row['reruns']:>6} reruns  {_fmt(row['p50_ms'])} / {_fmt(row['p95_ms'])} / {_fmt(row['p99_ms'])}")
+    print(f"\nGitHub stub: {stub.requests} requests, {stub.bytes_sent / 1024 ** 2:.1f} MB served")
+    print()
+    if capacity is None:
+        print(f"Saturated at {saturated['users']} user(s): p95 {_fmt(saturated['p95_ms'])} ms against an SLO of {slo_ms:.0f} ms.")
+        return
+    per_session = max(row["mb_per_session"] for row in levels)
+    if saturated is None:
+        print(f"No saturation up to {capacity['users']} users; raise --levels to find the knee.")
+    else:
+        print(
+            f"Saturation at {saturated['users']} users: {saturated['throughput_rps']:.2f} rerun/s, "
+            f"p95 {_fmt(saturated['p95_ms'])} ms, {saturated['errors']} errors."
+        )
+    print(
+        f"Capacity model: one instance serves {capacity['users']} active session(s) at {capacity['throughput_rps']:.2f} rerun/s "
+        f"(p95 {_fmt(capacity['p95_ms'])} ms <= {slo_ms:.0f} ms). Memory is about "
+        f"{capacity['rss_baseline_mb']:.0f} MB shared plus {per_session:.1f} MB per active session, so "
+        f"{capacity['users']} session(s) need about {capacity['rss_baseline_mb'] + per_session * capacity['users']:.0f} MB. "
+        f"Autoscale: replicas = ceil(active sessions / {capacity['users']})."
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ramp concurrent headless sessions against the app and find its saturation point.")
+    parser.add_argument("--app", default="app.py", help="Streamlit script, run from the repository root")
+    parser.add_argument("--levels", default="1,2,4,8", help="comma-separated concurrent user counts")
+    parser.add_argument("--steps", type=int, default=8, help="actions per user at each level")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean think time between reruns (0 = back-to-back)")
+    parser.add_argument("--slo-ms", type=float, default=2000.0, help="p95 rerun latency that counts as saturated")
+    parser.add_argument("--min-gain", type=float, default=0.1, help="throughput gain below which a level counts as saturated")
+    parser.add_argument("--github-latency-ms", type=float, default=40.0, help="delay the GitHub stub adds to every request")
+    parser.add_argument("--github-root", default=".", help="tree the GitHub stub serves")
+    parser.add_argument("--cache-dir", help="WAGE_CACHE_DIR for the run (default: a fresh temporary directory)")
+    parser.add_argument("--cold", action="store_true", help="skip the warm-up pass")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds before a rerun counts as failed")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    # bare-mode and deprecation notices from every session would drown the report; streamlit
+    # resets its log level whenever the config is parsed, so the override re-applies after each parse
+    from streamlit import config, logger
+
+    config.on_config_parsed(lambda: logger.set_log_level("error"), force_connect=True)
+    # the shared cache reads WAGE_CACHE_DIR once, so it is set before the app is first run
+    os.environ["WAGE_CACHE_DIR"] = args.cache_dir or tempfile.mkdtemp(prefix="wage-loadtest-")
+    levels = [int(n) for n in args.levels.split(",") if n.strip()]
+    app_path = Path(args.app).resolve()
+
+    with StubGitHub(args.github_root, latency_ms=args.github_latency_ms) as stub:
+        print(f"GitHub stub at {stub.url} serving {stub.root}; cache in {os.environ['WAGE_CACHE_DIR']}")
+        if not args.cold:
+            started = time.perf_counter()
+            failed = warm_up(app_path, args.seed, args.timeout)
+            print(f"Warm-up pass: {time.perf_counter() - started:.1f} s, {failed} failed reruns")
+        rows = []
+        for users in levels:
+            rows.append(run_level(app_path, users, args.steps, args.seed, args.think_ms, args.timeout))
+            print(f"  {users} users: {rows[-1]['reruns']} reruns in {rows[-1]['seconds']:.1f} s")
+        print()
+        capacity, saturated = saturation(rows, args.slo_ms, args.min_gain)
+        report(rows, capacity, saturated, args.slo_ms, stub)
+
+    if args.json:
+        summary = {
+            "levels": rows,
+            "capacity_users": capacity["users"] if capacity else 0,
+            "saturation_users": saturated["users"] if saturated else None,
+            "slo_ms": args.slo_ms,
+        }
+        Path(args.json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Compact in-memory layout for cleaned year frames and the stacked panel.
+
+optimize() is applied by the loaders to every cleaned year as it is read, and concat() stacks
+optimized years into the panel without falling back to object columns:
+
+- float columns become float32 when every value survives the round trip exactly (annual wages
+  and employment are whole numbers; hourly wages with cents stay float64), and integer columns
+  get the smallest integer type that holds their range
+- string columns with few distinct values (STATE, OCC_CODE, OCC_TITLE, GROUP, ...) become
+  categoricals: one small integer code per row plus a single copy of each label
+- True/False columns with missing values (ANNUAL, HOURLY are mostly empty) become Arrow
+  booleans, i.e. a value bitmask plus a validity bitmask: 2 bits per row instead of an object
+  pointer per row
+
+All three layouts are native Arrow types, so they survive the shared cache's memory-mapped
+files unchanged. report() lists the bytes before and after for every column.
+"""
+import numpy as np
+import pandas as pd
+
+# bump when the layout rules change so cached year frames and panels are rebuilt
+LAYOUT_VERSION = 1
+MAX_CATEGORY_RATIO = 0.5  # categorize when distinct values are at most this share of the rows
+
+
+def column_bytes(frame):
+    return frame.memory_usage(index=False, deep=True)
+
+
+def _is_bool_like(series):
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return True
+    if series.dtype != object:
+        return False
+    values = series.dropna()
+    return len(values) > 0 and values.map(type).isin([bool, np.bool_]).all()
+
+
+def _float32_exact(series):
+    # True when converting to float32 changes no value (whole numbers below 2**24, halves, ...)
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = values[np.isfinite(values)]
+    return np.array_equal(finite.astype(np.float32).astype(np.float64), finite)
+
+
+def optimize_column(series):
+    dtype = series.dtype
+    if isinstance(dtype, (pd.CategoricalDtype, pd.ArrowDtype, pd.SparseDtype)):
+        return series
+    if _is_bool_like(series):
+        if series.isna().any() or dtype == object:
+            import pyarrow as pa
+
+            return series.astype(pd.ArrowDtype(pa.bool_()))
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        if pd.api.types.is_unsigned_integer_dtype(dtype):
+            return pd.to_numeric(series, downcast="unsigned")
+        return pd.to_numeric(series, downcast="integer")
+    if pd.api.types.is_float_dtype(dtype):
+        # floats stay floats (a year without gaps must still stack with years that have them)
+        return series.astype(np.float32) if dtype != np.float32 and _float32_exact(series) else series
+    if pd.api.types.is_string_dtype(dtype) or dtype == object:
+        if series.count() and series.nunique(dropna=True) <= MAX_CATEGORY_RATIO * len(series):
+            return series.astype("category")
+    return series
+
+
+def optimize(frame):
+    """(compact frame, per-column report) for one frame."""
+    before = column_bytes(frame)
+    out = pd.DataFrame({col: optimize_column(frame[col]) for col in frame.columns}, index=frame.index)
+    return out, report(frame, out, before)
+
+
+def report(before_frame, after_frame, before=None):
+    before = column_bytes(before_frame) if before is None else before
+    after = column_bytes(after_frame)
+    rows = pd.DataFrame({
+        "column": list(after_frame.columns),
+        "dtype_before": [str(before_frame[c].dtype) for c in after_frame.columns],
+        "dtype_after": [str(after_frame[c].dtype) for c in after_frame.columns],
+        "bytes_before": [int(before.get(c, 0)) for c in after_frame.columns],
+        "bytes_after": [int(after[c]) for c in after_frame.columns],
+    })
+    rows["saved_pct"] = (1 - rows["bytes_after"] / rows["bytes_before"].where(rows["bytes_before"] > 0)) * 100
+    return rows
+
+
+def concat(parts):
+    # pd.concat keeps categoricals only when every part has identical categories, so align them first
+    parts = [p for p in parts if not p.empty]
+    if not parts:
+        return pd.DataFrame()
+    columns = list(dict.fromkeys(c for p in parts for c in p.columns))
+    for col in columns:
+        dtypes = [p[col].dtype for p in parts if col in p.columns]
+        if all(isinstance(d, pd.CategoricalDtype) for d in dtypes):
+            categories = pd.Index(np.concatenate([np.asarray(d.categories, dtype=object) for d in dtypes])).unique()
+            parts = [p.assign(**{col: p[col].cat.set_categories(categories)}) if col in p.columns else p for p in parts]
+    return pd.concat(parts, ignore_index=True, sort=False)
+
+
+def totals(rows):
+    before, after = int(rows["bytes_before"].sum()), int(rows["bytes_after"].sum())
+    return {"bytes_before": before, "bytes_after": after, "saved_pct": (1 - after / before) * 100 if before else 0.0}
@@ -0,0 +1,132 @@
+"""Employment-weighted percentiles for combined (state, occupation) cells.
+
+OEWS publishes only the 10/25/50/75/90th wage percentiles and TOT_EMP per cell, and averaging
+percentiles across cells does not give the percentile of the combined workforce. Instead each
+cell is treated as a piecewise-linear wage CDF through its published percentiles (tails are
+extended linearly to the 0th and 100th percentile), weighted by its employment, and the
+percentiles of a group are read off the mixture of its cells' CDFs.
+
+The mixture of piecewise-linear CDFs is itself piecewise linear, so it is evaluated exactly with
+one sweep: every CDF segment becomes a start and an end event carrying a density change, all
+events of all groups are sorted together, and cumulative sums give the mixture CDF at every
+breakpoint. Any number of cells and groups is handled in one NumPy batch.
+"""
+import numpy as np
+
+QUANTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+PERCENTILE_SUFFIXES = ("PCT10", "PCT25", "MEDIAN", "PCT75", "PCT90")
+
+
+def percentile_columns(prefix="A_"):
+    return [f"{prefix}{suffix}" for suffix in PERCENTILE_SUFFIXES]
+
+
+def fill_percentiles(pcts, quantiles=QUANTILES):
+    # interpolates missing interior percentiles and extends missing edge ones (e.g. a top-coded
+    # PCT90) along the neighbouring segment; rows with fewer than two values are left as published
+    q = np.asarray(quantiles, dtype=float)
+    x = np.array(pcts, dtype=float)
+    n_cols = x.shape[1]
+    valid = ~np.isnan(x)
+    cols = np.arange(n_cols)
+    left = np.maximum.accumulate(np.where(valid, cols, -1), axis=1)
+    right = np.minimum.accumulate(np.where(valid, cols, n_cols)[:, ::-1], axis=1)[:, ::-1]
+    inside = ~valid & (left >= 0) & (right < n_cols)
+    rows, j = np.nonzero(inside)
+    a, b = left[rows, j], right[rows, j]
+    x[rows, j] = x[rows, a] + (q[j] - q[a]) / (q[b] - q[a]) * (x[rows, b] - x[rows, a])
+    for j in range(2, n_cols):
+        edge = np.isnan(x[:, j]) & ~np.isnan(x[:, j - 1]) & ~np.isnan(x[:, j - 2])
+        slope = (x[edge, j - 1] - x[edge, j - 2]) / (q[j - 1] - q[j - 2])
+        x[edge, j] = x[edge, j - 1] + slope * (q[j] - q[j - 1])
+    for j in range(n_cols - 3, -1, -1):
+        edge = np.isnan(x[:, j]) & ~np.isnan(x[:, j + 1]) & ~np.isnan(x[:, j + 2])
+        slope = (x[edge, j + 2] - x[edge, j + 1]) / (q[j + 2] - q[j + 1])
+        x[edge, j] = x[edge, j + 1] - slope * (q[j + 1] - q[j])
+    # published percentiles occasionally cross; force a non-decreasing CDF (fmax would also copy a
+    # lone value over the NaNs after it)
+    return np.where(np.isnan(x), np.nan, np.fmax.accumulate(x, axis=1))
+
+
+def cell_knots(pcts, quantiles=QUANTILES):
+    # x positions of each cell's CDF knots at probabilities (0, *quantiles, 1)
+    x = fill_percentiles(pcts, quantiles)
+    q = np.asarray(quantiles, dtype=float)
+    low_span = (q[0] - 0.0) / (q[1] - q[0])
+    high_span = (1.0 - q[-1]) / (q[-1] - q[-2])
+    lower = np.maximum(x[:, 0] - (x[:, 1] - x[:, 0]) * low_span, 0.0)
+    upper = x[:, -1] + (x[:, -1] - x[:, -2]) * high_span
+    knots = np.column_stack([lower, x, upper])
+    probs = np.concatenate([[0.0], q, [1.0]])
+    return knots, probs
+
+
+def combine_percentiles(pcts, weights, groups, quantiles=QUANTILES, n_groups=None, out_quantiles=None):
+    """Percentiles of the employment-weighted mixture of cell distributions, per group.
+
+    pcts is an (n_cells, len(quantiles)) array, weights and groups are length n_cells (groups are
+    integer ids). Returns an (n_groups, len(out_quantiles)) array; empty groups are NaN.
+    """
+    out_quantiles = np.asarray(quantiles if out_quantiles is None else out_quantiles, dtype=float)
+    groups = np.asarray(groups, dtype=np.int64)
+    if n_groups is None:
+        n_groups = int(groups.max()) + 1 if len(groups) else 0
+    result = np.full((n_groups, len(out_quantiles)), np.nan)
+
+    knots, probs = cell_knots(pcts, quantiles)
+    weights = np.asarray(weights, dtype=float)
+    ok = np.isfinite(weights) & (weights > 0) & np.isfinite(knots).all(axis=1)
+    if not ok.any():
+        return result
+    knots, weights, groups = knots[ok], weights[ok], groups[ok]
+
+    # two events per CDF segment: density switches on at its start and off at its end;
+    # zero-width segments (tied percentiles) become a point mass at the start instead
+    start, end = knots[:, :-1], knots[:, 1:]
+    mass = weights[:, None] * np.diff(probs)[None, :]
+    width = end - start
+    flat = width <= 0
+    density = np.where(flat, 0.0, mass / np.where(flat, 1.0, width))
+    n_seg = start.shape[1]
+    ev_x = np.concatenate([start.ravel(), end.ravel()])
+    ev_dens = np.concatenate([density.ravel(), -density.ravel()])
+    ev_mass = np.concatenate([np.where(flat, mass, 0.0).ravel(), np.zeros(start.size)])
+    ev_group = np.concatenate([np.repeat(groups, n_seg), np.repeat(groups, n_seg)])
+
+    # sort by (group, x) with one float argsort: x is scaled into [0, 1) and added to the group
+    # id, which is several times faster than lexsort and exact to well under a cent
+    lo, span = ev_x.min(), max(float(np.ptp(ev_x)), 1.0)
+    order = np.argsort(ev_group + (ev_x - lo) / (span * (1 + 1e-6)))
+    x, dens, pmass, g = ev_x[order], ev_dens[order], ev_mass[order], ev_group[order]
+    first = np.ones(len(g), dtype=bool)
+    first[1:] = g[1:] != g[:-1]
+    starts = np.flatnonzero(first)
+    lengths = np.diff(np.append(starts, len(g)))
+
+    def group_cumsum(values):
+        total = np.cumsum(values)
+        return total - np.repeat(total[starts] - values[starts], lengths)
+
+    dens_after = group_cumsum(dens)
+    dens_before = np.where(first, 0.0, np.roll(dens_after, 1))
+    dx = np.where(first, 0.0, x - np.roll(x, 1))
+    cdf = group_cumsum(dens_before * dx + pmass)
+    totals = cdf[np.append(starts[1:], len(g)) - 1]
+
+    # CDFs are non-decreasing within a group, so (group rank + scaled CDF) is sortable globally
+    rank = np.cumsum(first) - 1
+    key = 2.0 * rank + np.clip(cdf / np.repeat(totals, lengths), 0.0, 1.0)
+    group_ids = g[starts]
+    stops = np.append(starts[1:], len(g)) - 1
+    for j, q in enumerate(out_quantiles):
+        k = np.searchsorted(key, 2.0 * np.arange(len(starts)) + q, side="left")
+        k = np.clip(k, starts, stops)
+        target = q * totals
+        prev = np.maximum(k - 1, 0)
+        before_mass = cdf[k] - pmass[k]
+        slope = dens_before[k]
+        on_slope = (target <= before_mass) & (slope > 0) & (k > starts)
+        interpolated = x[prev] + (target - cdf[prev]) / np.where(slope > 0, slope, 1.0)
+        result[group_ids, j] = np.where(on_slope, interpolated, x[k])
+    return result
+
@@ -0,0 +1,150 @@
+"""Startup and rerun timings for the app.
+
+app.py imports each tab module on demand through timed_import() and records how long every
+rerun took; sidebar_report() publishes those numbers in the sidebar. Run
+
+    python -m wage_app.perf
+
+to measure cold import time of every tab in a fresh interpreter (and which heavy libraries each
+one pulls in on top of streamlit itself), plus headless rerun times when streamlit.testing is
+available.
+"""
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+HEAVY_MODULES = ("pandas", "numpy", "plotly", "requests", "pyarrow")
+
+_lock = threading.Lock()
+_import_seconds = {}
+_rerun_seconds = defaultdict(lambda: deque(maxlen=50))
+_first_rerun = {}
+
+
+def timed_import(name):
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    with _lock:
+        _import_seconds[name] = time.perf_counter() - started
+    return module
+
+
+def record_rerun(tab, seconds):
+    with _lock:
+        _first_rerun.setdefault("seconds", seconds)
+        _first_rerun.setdefault("tab", tab)
+        _rerun_seconds[tab].append(seconds)
+
+
+def heavy_modules_loaded():
+    return {name: name in sys.modules for name in HEAVY_MODULES}
+
+
+def rerun_summary():
+    with _lock:
+        rows = []
+        for tab, samples in _rerun_seconds.items():
+            rows.append(
+                {
+                    "Tab": tab,
+                    "Reruns": len(samples),
+                    "Last (ms)": round(samples[-1] * 1000, 1),
+                    "Median (ms)": round(statistics.median(samples) * 1000, 1),
+                }
+            )
+        return rows
+
+
+def sidebar_report():
+    import streamlit as st
+
+    with st.sidebar.expander("Performance"):
+        if _first_rerun:
+            st.write(f"First rerun in this process ({_first_rerun['tab']}): {_first_rerun['seconds'] * 1000:.0f} ms")
+        if _import_seconds:
+            st.write("Tab module import time (ms)")
+            st.table([{"Module": k, "ms": round(v * 1000, 1)} for k, v in sorted(_import_seconds.items())])
+        rows = rerun_summary()
+        if rows:
+            st.write("Rerun time")
+            st.table(rows)
+        loaded = [name for name, present in heavy_modules_loaded().items() if present]
+        st.caption("Heavy libraries loaded: " + (", ".join(loaded) if loaded else "none"))
+
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import streamlit
+base = time.perf_counter()
+preloaded = [m for m in {heavy!r} if m in sys.modules]
+import importlib
+importlib.import_module({module!r})
+done = time.perf_counter()
+print(json.dumps({{
+    "streamlit_ms": (base - started) * 1000,
+    "module_ms": (done - base) * 1000,
+    "heavy": [m for m in {heavy!r} if m in sys.modules and m not in preloaded],
+}}))
+"""
+
+
+def measure_cold_imports(tab_modules, root):
+    results = []
+    for tab, module in tab_modules.items():
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=root, capture_output=True, text=True, check=True,
+        )
+        results.append({"tab": tab, "module": module, **json.loads(proc.stdout.strip().splitlines()[-1])})
+    return results
+
+
+def measure_reruns(tab_names, app_path, repeats=3):
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return []
+    results = []
+    for tab in tab_names:
+        at = AppTest.from_file(str(app_path), default_timeout=120)
+        at.run()
+        samples = []
+        for _ in range(repeats):
+            at.sidebar.radio[0].set_value(tab)
+            started = time.perf_counter()
+            at.run()
+            samples.append((time.perf_counter() - started) * 1000)
+        results.append({"tab": tab, "median_rerun_ms": statistics.median(samples), "exceptions": len(at.exception)})
+    return results
+
+
+def main():
+    root = Path(__file__).resolve().parent.parent
+    sys.path.insert(0, str(root))
+    from wage_app.tabs import TAB_MODULES
+
+    print("Cold import (fresh interpreter per tab)")
+    print(f"{'Tab':<28}{'streamlit ms':>14}{'tab ms':>10}  heavy libraries")
+    for row in measure_cold_imports(TAB_MODULES, root):
+        print(f"{row['tab']:<28}{row['streamlit_ms']:>14.0f}{row['module_ms']:>10.0f}  {', '.join(row['heavy']) or '-'}")
+
+    reruns = measure_reruns(list(TAB_MODULES), root / "app.py")
+    if reruns:
+        print()
+        print("Headless rerun time (streamlit.testing AppTest)")
+        for row in reruns:
+            print(f"{row['tab']:<28}{row['median_rerun_ms']:>10.0f} ms  exceptions={row['exceptions']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Resident, filterable view of the stacked year panel for the query API and bulk exports.
+
+build_panel() concatenates the cleaned years in order, so every year is one contiguous row range;
+STATE and OCC_CODE are factorized once into integer codes. A filter is then a few range slices
+plus integer comparisons (np.isin on small code sets) rather than string matching over every row.
+"""
+import numpy as np
+import pandas as pd
+
+from wage_app import anomalies
+
+
+class PanelStore:
+    def __init__(self, panel, version=None):
+        self.version = version
+        self.panel = panel
+        self.columns = list(panel.columns)
+        self._year_spans = {}
+        if panel.empty:
+            self.states = self.occ_codes = pd.Index([])
+            self._state_ids = self._occ_ids = np.zeros(0, dtype=np.int64)
+            return
+        years = panel["year"].to_numpy()
+        change = np.flatnonzero(np.append(True, years[1:] != years[:-1]))
+        stops = np.append(change[1:], len(years))
+        for a, b in zip(change.tolist(), stops.tolist()):
+            self._year_spans.setdefault(int(years[a]), []).append((a, b))
+        self._state_ids, self.states = pd.factorize(panel["STATE"].astype("string"))
+        self._occ_ids, self.occ_codes = pd.factorize(panel["OCC_CODE"].astype("string").str.strip())
+        self._flags = panel["FLAGS"].to_numpy() if "FLAGS" in panel.columns else None
+
+    @property
+    def years(self):
+        return sorted(self._year_spans)
+
+    def _ids(self, index, values):
+        wanted = index.get_indexer(pd.Index(list(values), dtype="string"))
+        return wanted[wanted >= 0]
+
+    def rows(self, years=None, states=None, occ_codes=None, exclude_flags=0):
+        # positional row indices matching every given filter (None = no filter)
+        if years is None:
+            spans = [span for year in self.years for span in self._year_spans[year]]
+        else:
+            spans = [span for year in sorted({int(y) for y in years}) for span in self._year_spans.get(year, [])]
+        if not spans:
+            return np.zeros(0, dtype=np.int64)
+        idx = np.concatenate([np.arange(a, b) for a, b in spans])
+        if states is not None:
+            idx = idx[np.isin(self._state_ids[idx], self._ids(self.states, states))]
+        if occ_codes is not None:
+            idx = idx[np.isin(self._occ_ids[idx], self._ids(self.occ_codes, occ_codes))]
+        if exclude_flags and self._flags is not None:
+            idx = idx[(self._flags[idx] & int(exclude_flags)) == 0]
+        return idx
+
+    def select(self, rows, columns=None):
+        cols = [c for c in (columns or self.columns) if c in self.columns]
+        return self.panel.iloc[rows][cols]
+
+    def chunks(self, rows, columns=None, chunk_rows=50_000):
+        # yields the selection in bounded pieces so exports never hold the full result
+        for start in range(0, len(rows), chunk_rows):
+            yield self.select(rows[start:start + chunk_rows], columns)
+
+
+def columnar(frame):
+    # {"columns": [...], "data": {col: [...]}} with NaN as null
+    data = {}
+    for col in frame.columns:
+        series = frame[col]
+        if pd.api.types.is_float_dtype(series.dtype):
+            values = series.to_numpy(dtype=float)
+            data[col] = np.where(np.isnan(values), None, values).tolist()
+        elif (pd.api.types.is_integer_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype)) and not series.hasnans:
+            data[col] = series.tolist()
+        else:
+            data[col] = series.astype(object).where(series.notna(), None).tolist()
+    return {"columns": list(frame.columns), "rows": len(frame), "data": data}
+
+
+def flag_mask(value):
+    # accepts an int bitmask or comma-separated flag constants, e.g. "SUPPRESSED,TOP_CODED"
+    if value in (None, ""):
+        return 0
+    if str(value).isdigit():
+        return int(value)
+    mask = 0
+    for part in str(value).split(","):
+        bit = getattr(anomalies, part.strip().upper(), None)
+        if bit not in anomalies.FLAG_NAMES:
+            raise ValueError(f"unknown flag: {part.strip()}")
+        mask |= bit
+    return mask
@@ -0,0 +1,344 @@
+"""GitHub copy of cleaned_data for deploys that have no local data.
+
+The cleaned CSVs are committed as Git LFS pointers, so a bare checkout (and the raw GitHub URL)
+only holds a ~130 byte stub per year. Two remote layouts are read:
+
+- LFS CSVs: the pointer's sha256 oid names the object; it is downloaded once from the LFS media
+  URL into <cache dir>/lfs/<oid>, checked against the oid and renamed into place, so every worker
+  on the host reuses the same file
+- Parquet (written by `python -m wage_app.etl --parquet` to cleaned_data/parquet/): years are
+  opened through HttpRangeFile, so pyarrow fetches the footer and then only the column chunks of
+  the requested columns and row groups with HTTP Range requests
+
+Folder listings come from the GitHub contents API. WAGE_GITHUB_RAW_URL, WAGE_GITHUB_MEDIA_URL
+and WAGE_GITHUB_API_URL point everything at a local stand-in server.
+"""
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from wage_app import shared_cache
+from wage_app.loaders import BRANCH, OWNER, REPO, http_session
+
+REMOTE_CLEANED_DIR = "cleaned_data"
+REMOTE_PARQUET_DIR = "cleaned_data/parquet"
+LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/v1"
+READAHEAD = 1 << 16  # also covers the Parquet footer in one request
+COALESCE_GAP = 1 << 15  # nearby column chunks are fetched together when the gap is smaller
+PREFETCH_WORKERS = 8
+LISTING_TTL = 600  # seconds a folder listing is trusted before asking GitHub again
+
+
+def raw_base():
+    return os.environ.get("WAGE_GITHUB_RAW_URL", f"https://raw.githubusercontent.com/{OWNER}/{REPO}/{BRANCH}").rstrip("/")
+
+
+def media_base():
+    return os.environ.get("WAGE_GITHUB_MEDIA_URL", f"https://media.githubusercontent.com/media/{OWNER}/{REPO}/{BRANCH}").rstrip("/")
+
+
+def api_base():
+    return os.environ.get("WAGE_GITHUB_API_URL", f"https://api.github.com/repos/{OWNER}/{REPO}").rstrip("/")
+
+
+def raw_url(path):
+    return f"{raw_base()}/{path}"
+
+
+def media_url(path):
+    return f"{media_base()}/{path}"
+
+
+def parse_lfs_pointer(data):
+    # (oid, size) for a Git LFS pointer file, None for anything else
+    if not data.startswith(LFS_POINTER_PREFIX) or len(data) > 1024:
+        return None
+    text = data.decode("utf-8", "replace")
+    oid = re.search(r"^oid sha256:([0-9a-f]{64})$", text, re.MULTILINE)
+    size = re.search(r"^size (\d+)$", text, re.MULTILINE)
+    if not oid or not size:
+        return None
+    return oid.group(1), int(size.group(1))
+
+
+def is_lfs_pointer(path):
+    path = Path(path)
+    if not path.is_file() or path.stat().st_size > 1024:
+        return False
+    return parse_lfs_pointer(path.read_bytes()) is not None
+
+
+def lfs_dir():
+    return Path(os.environ.get("WAGE_CACHE_DIR", shared_cache.DEFAULT_CACHE_DIR)) / "lfs"
+
+
+def download_object(url, oid, size, timeout=60):
+    # streams the object to a temp file, verifies it and renames it to lfs/<oid>
+    target = lfs_dir() / oid
+    if target.exists() and target.stat().st_size == size:
+        return target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{oid}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, http_session().get(url, stream=True, timeout=timeout) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(1 << 20):
+                digest.update(chunk)
+                f.write(chunk)
+        if digest.hexdigest() != oid:
+            raise ValueError(f"LFS object from {url} does not match its pointer (oid {oid[:12]})")
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return target
+
+
+def resolve_pointer(path, repo_path=None):
+    # local LFS pointer file -> path of the cached object (downloaded on first use)
+    oid, size = parse_lfs_pointer(Path(path).read_bytes())
+    repo_path = repo_path or f"{REMOTE_CLEANED_DIR}/{Path(path).name}"
+    return download_object(media_url(repo_path), oid, size)
+
+
+def fetch_file(repo_path, sha=None, timeout=20):
+    """Local path for a repo file, resolving LFS pointers; `sha` (the git blob id) keys the cache."""
+    def pointer():
+        r = http_session().get(raw_url(repo_path), timeout=timeout)
+        r.raise_for_status()
+        return r.content
+
+    key = f"remote-file:{raw_url(repo_path)}:{sha}"
+    data = shared_cache.get_backend().obj(key, pointer) if sha else pointer()
+    parsed = parse_lfs_pointer(data)
+    if parsed is not None:
+        return download_object(media_url(repo_path), *parsed)
+    # plain (non-LFS) files are stored by content hash as well
+    oid = hashlib.sha256(data).hexdigest()
+    target = lfs_dir() / oid
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    return target
+
+
+_listings = {}
+_listings_lock = threading.Lock()
+
+
+def listing(folder, timeout=10):
+    # {name: {"sha", "size", "path"}} for the files in a repo folder; {} when it does not exist
+    now = time.monotonic()
+    with _listings_lock:
+        cached = _listings.get(folder)
+        if cached and now - cached[0] < LISTING_TTL:
+            return cached[1]
+    r = http_session().get(f"{api_base()}/contents/{folder}", params={"ref": BRANCH}, timeout=timeout)
+    if r.status_code == 404:
+        files = {}
+    else:
+        r.raise_for_status()
+        files = {
+            item["name"]: {"sha": item["sha"], "size": item["size"], "path": item["path"]}
+            for item in r.json() if item.get("type") == "file"
+        }
+    with _listings_lock:
+        _listings[folder] = (now, files)
+    return files
+
+
+def remote_year_files():
+    """{year: {"csv": entry, "parquet": entry}} for the cleaned years published on GitHub."""
+    years = {}
+    for folder, kind in ((REMOTE_CLEANED_DIR, "csv"), (REMOTE_PARQUET_DIR, "parquet")):
+        for name, entry in listing(folder).items():
+            m = re.fullmatch(rf"data_(\d{{4}})\.{kind}", name, re.IGNORECASE)
+            if m:
+                years.setdefault(m.group(1), {})[kind] = entry
+    return years
+
+
+class HttpRangeFile(io.RawIOBase):
+    """Read-only, seekable file over HTTP where every read is a Range request.
+
+    Each request fetches at least `readahead` bytes and fetched spans are kept for the life of
+    the object; `bytes_fetched` and `requests` count the traffic. A server that ignores Range
+    gets the whole body kept as one span.
+    """
+
+    def __init__(self, url, size=None, readahead=READAHEAD, timeout=20):
+        self.url = url
+        self.readahead = readahead
+        self.timeout = timeout
+        self.bytes_fetched = 0
+        self.requests = 0
+        self._spans = []  # (start, bytes)
+        self._lock = threading.Lock()
+        self._pos = 0
+        self._size = size if size is not None else self._probe_size()
+
+    def _probe_size(self):
+        r = http_session().head(self.url, allow_redirects=True, timeout=self.timeout)
+        r.raise_for_status()
+        self.requests += 1
+        return int(r.headers["Content-Length"])
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def size(self):
+        return self._size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def _cached(self, start, stop):
+        for span_start, data in list(self._spans):
+            if span_start <= start and stop <= span_start + len(data):
+                return data[start - span_start:stop - span_start]
+        return None
+
+    def _fetch(self, start, stop, readahead=True):
+        stop = min(self._size, max(stop, start + self.readahead) if readahead else stop)
+        r = http_session().get(self.url, headers={"Range": f"bytes={start}-{stop - 1}"}, timeout=self.timeout)
+        r.raise_for_status()
+        with self._lock:
+            self.requests += 1
+            self.bytes_fetched += len(r.content)
+            if r.status_code != 206:
+                self._spans = [(0, r.content)]
+                return
+            # drop spans the new one covers so lookups stay cheap
+            self._spans = [(s, d) for s, d in self._spans if s < start or s + len(d) > stop]
+            self._spans.append((start, r.content))
+
+    def prefetch(self, ranges, gap=COALESCE_GAP):
+        # fetches (start, stop) byte ranges up front, merging neighbours into one request each
+        merged = []
+        for start, stop in sorted(ranges):
+            if merged and start - merged[-1][1] <= gap:
+                merged[-1][1] = max(merged[-1][1], stop)
+            else:
+                merged.append([start, stop])
+        missing = [(start, stop) for start, stop in merged if self._cached(start, stop) is None]
+        if len(missing) == 1:
+            self._fetch(*missing[0], readahead=False)
+        elif missing:
+            # row groups are laid out one after another, so a column subset is many small ranges:
+            # fetch them concurrently (each worker thread has its own pooled session)
+            with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+                list(pool.map(lambda r: self._fetch(*r, readahead=False), missing))
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            n = self._size - self._pos
+        start, stop = self._pos, min(self._size, self._pos + max(0, n))
+        if stop <= start:
+            return b""
+        data = self._cached(start, stop)
+        if data is None:
+            self._fetch(start, stop)
+            data = self._cached(start, stop)
+        self._pos = stop
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def chunk_ranges(metadata, groups, columns):
+    # byte ranges of the column chunks pyarrow will read for these row groups and columns
+    names = metadata.schema.to_arrow_schema().names
+    ranges = []
+    for i in groups:
+        group = metadata.row_group(i)
+        for name in columns:
+            chunk = group.column(names.index(name))
+            start = chunk.data_page_offset
+            if chunk.has_dictionary_page and chunk.dictionary_page_offset is not None:
+                start = min(start, chunk.dictionary_page_offset)
+            ranges.append((start, start + chunk.total_compressed_size))
+    return ranges
+
+
+def row_groups_for(metadata, column, values):
+    # row groups whose min/max statistics for `column` can contain any of `values`
+    index = metadata.schema.to_arrow_schema().get_field_index(column)
+    if index < 0:
+        return list(range(metadata.num_row_groups))
+    keep = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(index).statistics
+        if stats is None or not stats.has_min_max or any(stats.min <= v <= stats.max for v in values):
+            keep.append(i)
+    return keep
+
+
+def parquet_columns(url, size=None):
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(HttpRangeFile(url, size)).schema_arrow.names
+
+
+def read_parquet(url, size=None, columns=None, states=None):
+    """(frame, stats) reading only `columns` and the row groups that may hold `states`."""
+    import pyarrow.parquet as pq
+
+    source = HttpRangeFile(url, size)
+    parquet = pq.ParquetFile(source)
+    names = parquet.schema_arrow.names
+    columns = [c for c in columns if c in names] if columns else names
+    groups = row_groups_for(parquet.metadata, "STATE", states) if states else list(range(parquet.metadata.num_row_groups))
+    source.prefetch(chunk_ranges(parquet.metadata, groups, columns))
+    table = parquet.read_row_groups(groups, columns=columns)
+    df = table.to_pandas()
+    if states and "STATE" in df.columns:
+        df = df[df["STATE"].isin(states)].reset_index(drop=True)
+    stats = {
+        "layout": "parquet",
+        "bytes_fetched": source.bytes_fetched,
+        "requests": source.requests,
+        "file_size": source.size(),
+        "row_groups": f"{len(groups)} of {parquet.metadata.num_row_groups}",
+    }
+    return df, stats
+
+
+def load_year(entry, columns=None, states=None):
+    """(frame, stats) for one year; `entry` comes from remote_year_files()."""
+    if "parquet" in entry:
+        item = entry["parquet"]
+        return read_parquet(raw_url(item["path"]), item["size"], columns, states)
+    item = entry["csv"]
+    path = fetch_file(item["path"], item["sha"])
+    df = pd.read_csv(path, low_memory=False)
+    if states and "STATE" in df.columns:
+        df = df[df["STATE"].isin(states)].reset_index(drop=True)
+    if columns:
+        df = df[[c for c in columns if c in df.columns]]
+    return df, {"layout": "csv", "file_size": path.stat().st_size}
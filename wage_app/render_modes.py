@@ -0,0 +1,117 @@
+"""Adaptive rendering for charts that can carry many points.
+
+SVG markers get sluggish past roughly a thousand points, so charts go through these helpers:
+
+- up to WEBGL_THRESHOLD points: a normal SVG scatter
+- up to MAX_WEBGL_POINTS: the same scatter drawn with WebGL (Scattergl)
+- beyond that: numeric scatters are aggregated into a fixed grid of density bins, so the payload
+  stays bounded however large the data grows
+
+zoom_controls() lets the user narrow the x/y window; once a window holds few enough points the
+raw markers come back. Ordered series (lines) are thinned with LTTB instead.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+WEBGL_THRESHOLD = 1000
+MAX_WEBGL_POINTS = 20000
+DENSITY_BINS = (80, 60)
+
+
+def render_mode_for(n_points, numeric=True):
+    if n_points <= WEBGL_THRESHOLD:
+        return "svg"
+    if n_points <= MAX_WEBGL_POINTS or not numeric:
+        return "webgl"
+    return "density"
+
+
+def lttb(x, y, n_out):
+    # Largest-Triangle-Three-Buckets: keeps the points that preserve the visual shape of a series
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev]) - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(area))
+        keep[i + 1] = prev
+    return keep
+
+
+def density_frame(df, x, y, bins=DENSITY_BINS, weight=None):
+    # collapses points into an x/y grid; returns one row per non-empty cell
+    xs = df[x].to_numpy(dtype=float)
+    ys = df[y].to_numpy(dtype=float)
+    w = None if weight is None else df[weight].to_numpy(dtype=float)
+    ok = np.isfinite(xs) & np.isfinite(ys)
+    counts, x_edges, y_edges = np.histogram2d(xs[ok], ys[ok], bins=bins, weights=None if w is None else np.nan_to_num(w[ok]))
+    ix, iy = np.nonzero(counts)
+    return pd.DataFrame(
+        {
+            x: (x_edges[ix] + x_edges[ix + 1]) / 2,
+            y: (y_edges[iy] + y_edges[iy + 1]) / 2,
+            "points" if weight is None else weight: counts[ix, iy],
+        }
+    )
+
+
+def adaptive_scatter(df, x, y, title=None, **px_kwargs):
+    numeric = pd.api.types.is_numeric_dtype(df[x]) and pd.api.types.is_numeric_dtype(df[y])
+    mode = render_mode_for(len(df), numeric=numeric)
+    if mode == "density":
+        binned = density_frame(df, x, y)
+        fig = px.scatter(
+            binned, x=x, y=y, size="points", color="points", render_mode="webgl",
+            color_continuous_scale="Viridis", title=title,
+            labels={"points": "Rows in bin"},
+        )
+    else:
+        fig = px.scatter(df, x=x, y=y, title=title, render_mode=mode, **px_kwargs)
+    return fig, mode
+
+
+def adaptive_line(df, x, y, max_points=WEBGL_THRESHOLD, title=None, **px_kwargs):
+    ordered = df.sort_values(x)
+    if len(ordered) > max_points:
+        ordered = ordered.iloc[lttb(ordered[x].to_numpy(), ordered[y].to_numpy(), max_points)]
+    return px.line(ordered, x=x, y=y, title=title, render_mode="webgl" if len(ordered) > WEBGL_THRESHOLD else "svg", **px_kwargs)
+
+
+def zoom_controls(df, x, y, key):
+    # range sliders acting as zoom: narrowing them drills down from bins to the raw points
+    data = df[[x, y]].dropna()
+    if data.empty:
+        return df
+    windows = {}
+    cols = st.columns(2)
+    for col, name in zip(cols, (x, y)):
+        low, high = float(data[name].min()), float(data[name].max())
+        if low == high:
+            windows[name] = (low, high)
+            continue
+        with col:
+            windows[name] = st.slider(f"{name} range", low, high, (low, high), key=f"{key}_{name}")
+    mask = df[x].between(*windows[x]) & df[y].between(*windows[y])
+    return df[mask]
+
+
+def mode_caption(mode, shown, total):
+    if mode == "density":
+        return f"{shown:,} of {total:,} rows aggregated into density bins; narrow the ranges to see individual points."
+    if mode == "webgl":
+        return f"{shown:,} of {total:,} rows drawn with WebGL."
+    return f"{shown:,} of {total:,} rows."
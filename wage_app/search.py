@@ -0,0 +1,158 @@
+"""Prebuilt occupation/state search over the cleaned year x state x occupation panel.
+
+The index is built once per data version:
+
+- a sorted vocabulary of normalized titles, title words, SOC codes and state names answers
+  prefix queries with two bisects
+- a character-trigram inverted index answers fuzzy queries ("sofware develpers") by counting
+  shared trigrams per entry with one np.bincount over the posting lists
+- the panel is sorted by (OCC_CODE, STATE, year) once, and (code, state) keys map to row ranges,
+  so a result is a slice of that frame rather than a row-by-row filter
+
+Free-text queries such as "Software Developers in Texas" are split on the last " in "; a query
+that is only a state name lists that state's occupations.
+"""
+import bisect
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+RESULT_COLUMNS = [
+    "year", "STATE", "OCC_CODE", "OCC_TITLE", "TOT_EMP",
+    "A_MEAN", "A_PCT10", "A_PCT25", "A_MEDIAN", "A_PCT75", "A_PCT90", "H_MEAN", "H_MEDIAN", "FLAGS",
+]
+_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text):
+    return " ".join(_SPLIT.split(str(text).lower())).strip()
+
+
+def trigrams(text):
+    padded = f"  {normalize(text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _EntryIndex:
+    # prefix + trigram lookup over a small list of (key, label) entries
+    def __init__(self, entries):
+        self.keys = [key for key, _ in entries]
+        self.labels = [label for _, label in entries]
+        vocab = []
+        postings = defaultdict(list)
+        for i, (key, label) in enumerate(entries):
+            norm = normalize(label)
+            vocab.append((norm, i))
+            for word in norm.split():
+                vocab.append((word, i))
+            if key != label:
+                vocab.append((normalize(key), i))
+            for gram in trigrams(label):
+                postings[gram].append(i)
+        vocab.sort()
+        self._vocab_terms = [term for term, _ in vocab]
+        self._vocab_ids = [i for _, i in vocab]
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._gram_counts = np.asarray([len(trigrams(label)) for label in self.labels], dtype=np.int32)
+
+    def prefix(self, query):
+        lo = bisect.bisect_left(self._vocab_terms, query)
+        hi = bisect.bisect_left(self._vocab_terms, query + "\uffff")
+        return dict.fromkeys(self._vocab_ids[lo:hi])
+
+    def fuzzy(self, query, min_score=0.3):
+        grams = trigrams(query)
+        lists = [self._postings[g] for g in grams if g in self._postings]
+        if not lists:
+            return []
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.labels))
+        # Dice coefficient on trigram sets
+        scores = 2 * shared / (len(grams) + self._gram_counts)
+        hits = np.nonzero(scores >= min_score)[0]
+        return sorted(zip(scores[hits].tolist(), hits.tolist()), reverse=True)
+
+    def search(self, query, limit=10):
+        query = normalize(query)
+        if not query:
+            return []
+        ranked = [(1.0 + 1.0 / (1 + len(self.labels[i])), i) for i in self.prefix(query)]
+        seen = {i for _, i in ranked}
+        ranked.sort(reverse=True)
+        if len(ranked) < limit:
+            ranked += [(score, i) for score, i in self.fuzzy(query) if i not in seen]
+        return [(self.keys[i], self.labels[i], round(score, 3)) for score, i in ranked[:limit]]
+
+
+class SearchIndex:
+    def __init__(self, panel):
+        cols = [c for c in RESULT_COLUMNS if c in panel.columns]
+        data = panel[cols].dropna(subset=["OCC_CODE", "STATE"])
+        data = data.sort_values(["OCC_CODE", "STATE", "year"], kind="mergesort").reset_index(drop=True)
+        self.data = data
+
+        codes = data["OCC_CODE"].to_numpy()
+        states = data["STATE"].to_numpy()
+        # row ranges for every (code, state) run and every code run in the sorted frame
+        pair_change = np.ones(len(data), dtype=bool)
+        pair_change[1:] = (codes[1:] != codes[:-1]) | (states[1:] != states[:-1])
+        starts = np.flatnonzero(pair_change)
+        stops = np.append(starts[1:], len(data))
+        self._pairs = {(codes[a], states[a]): (a, b) for a, b in zip(starts.tolist(), stops.tolist())}
+        code_starts = np.flatnonzero(np.append(True, codes[1:] != codes[:-1]))
+        code_stops = np.append(code_starts[1:], len(data))
+        self._codes = {codes[a]: (a, b) for a, b in zip(code_starts.tolist(), code_stops.tolist())}
+
+        # the most recent title is the display label for a code; older titles stay searchable
+        latest = data.sort_values("year").drop_duplicates("OCC_CODE", keep="last")
+        self.titles = dict(zip(latest["OCC_CODE"], latest["OCC_TITLE"]))
+        entries = [(code, title) for code, title in sorted(self.titles.items())]
+        older = data.drop_duplicates(["OCC_CODE", "OCC_TITLE"])
+        entries += [
+            (code, title) for code, title in zip(older["OCC_CODE"], older["OCC_TITLE"])
+            if isinstance(title, str) and self.titles.get(code) != title
+        ]
+        self.occupations = _EntryIndex(entries)
+        self.states = _EntryIndex([(s, s) for s in sorted(pd.unique(states).tolist())])
+
+    def search_occupations(self, query, limit=10):
+        results, seen = [], set()
+        for code, label, score in self.occupations.search(query, limit=limit * 2):
+            if code not in seen:
+                seen.add(code)
+                results.append((code, self.titles.get(code, label), score))
+        return results[:limit]
+
+    def search_states(self, query, limit=5):
+        return self.states.search(query, limit=limit)
+
+    def parse(self, query, limit=10):
+        # "Software Developers in Texas" -> occupation matches, state matches
+        occ_part, state_part = query, ""
+        lowered = query.lower()
+        if " in " in lowered:
+            cut = lowered.rindex(" in ")
+            candidate = query[cut + 4:]
+            if self.search_states(candidate, limit=1):
+                occ_part, state_part = query[:cut], candidate
+        occupations = self.search_occupations(occ_part, limit=limit)
+        states = self.search_states(state_part, limit=1) if state_part else []
+        if not state_part and not occupations:
+            # a bare state name ("Texas") matches no occupation
+            states = self.search_states(query, limit=1)
+        return occupations, [s for s, _, _ in states]
+
+    def occupations_in(self, state):
+        # (code, title, score) for every occupation published in a state, by title
+        codes = pd.unique(self.data.loc[self.data["STATE"].to_numpy() == state, "OCC_CODE"])
+        return sorted(((code, self.titles.get(code, code), 1.0) for code in codes), key=lambda r: str(r[1]))
+
+    def rows(self, code, state=None):
+        if state is None:
+            span = self._codes.get(code)
+        else:
+            span = self._pairs.get((code, state))
+        if span is None:
+            return self.data.iloc[0:0]
+        return self.data.iloc[span[0]:span[1]]
@@ -0,0 +1,334 @@
+"""Host-wide cache shared by every Streamlit worker running on the same machine.
+
+st.cache_data keeps a pickled copy per process, so N replicas parse every cleaned_data year and
+fetch every GitHub asset N times. The backends here sit underneath the Streamlit caches:
+
+- "host": DataFrames are written once as Arrow IPC files and memory-mapped by every worker, so
+  the pages live in the OS page cache once per host (NaN-free numeric columns attach zero-copy).
+  Small objects (JSON listings, raw bytes, text) go to a SQLite key-value file.
+- "process": plain in-memory dicts, the old per-process behaviour (used when pyarrow is missing).
+
+Pick one with WAGE_CACHE_BACKEND=host|process and place the host cache with WAGE_CACHE_DIR.
+Keys embed file mtimes and data versions, so superseded entries are never read again: the host
+cache removes its least recently used frames and objects once it passes WAGE_CACHE_BUDGET_MB
+(default 4096).
+"""
+import abc
+import hashlib
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to per-process locking only
+    fcntl = None
+
+
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "wage_analysis_cache"
+DEFAULT_BUDGET_MB = 4096
+ARROW_BACKED_KEY = b"pandas_arrow_dtype"
+# reads refresh an entry's last-used time at most this often; writes check the budget at most this often
+TOUCH_SECONDS = 60
+EVICT_SECONDS = 30
+
+
+def _digest(key):
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(abc.ABC):
+    @abc.abstractmethod
+    def get_frame(self, key):
+        """The stored DataFrame, or None."""
+
+    @abc.abstractmethod
+    def put_frame(self, key, df):
+        pass
+
+    @abc.abstractmethod
+    def get_object(self, key):
+        """The stored picklable value, or None."""
+
+    @abc.abstractmethod
+    def put_object(self, key, value):
+        pass
+
+    @abc.abstractmethod
+    def clear(self):
+        pass
+
+    @abc.abstractmethod
+    def lock(self, key):
+        """Context manager held by one thread (and, for the host backend, one process) per key."""
+
+    def frame(self, key, loader):
+        # get-or-compute; the lock makes sure only one worker on the host pays for the load
+        df = self.get_frame(key)
+        if df is not None:
+            return df
+        with self.lock(key):
+            df = self.get_frame(key)
+            if df is None:
+                df = loader()
+                self.put_frame(key, df)
+                df = self.get_frame(key)
+        return df
+
+    def obj(self, key, loader):
+        value = self.get_object(key)
+        if value is not None:
+            return value
+        with self.lock(key):
+            value = self.get_object(key)
+            if value is None:
+                value = loader()
+                self.put_object(key, value)
+        return value
+
+
+class ProcessCacheBackend(CacheBackend):
+    def __init__(self):
+        self._frames = {}
+        self._objects = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def get_frame(self, key):
+        return self._frames.get(key)
+
+    def put_frame(self, key, df):
+        self._frames[key] = df
+
+    def get_object(self, key):
+        return self._objects.get(key)
+
+    def put_object(self, key, value):
+        self._objects[key] = value
+
+    def clear(self):
+        self._frames.clear()
+        self._objects.clear()
+
+    @contextmanager
+    def lock(self, key):
+        with self._guard:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+
+class HostCacheBackend(CacheBackend):
+    def __init__(self, root=DEFAULT_CACHE_DIR, budget_bytes=DEFAULT_BUDGET_MB * 1024 ** 2):
+        self.root = Path(root)
+        self.budget_bytes = budget_bytes
+        self._last_evict = None
+        self.frames_dir = self.root / "frames"
+        self.locks_dir = self.root / "locks"
+        self.frames_dir.mkdir(parents=True, exist_ok=True)
+        self.locks_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / "objects.sqlite"
+        self._local = threading.local()
+        self._thread_locks = ProcessCacheBackend()
+        with self._db() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB, created REAL, used REAL)")
+            # caches written before eviction existed have no last-used column
+            if "used" not in {row[1] for row in db.execute("PRAGMA table_info(kv)")}:
+                db.execute("ALTER TABLE kv ADD COLUMN used REAL")
+                db.execute("UPDATE kv SET used = created")
+
+    def _db(self):
+        # one connection per thread; WAL lets readers in other workers proceed during a write
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _frame_path(self, key):
+        return self.frames_dir / f"{_digest(key)}.arrow"
+
+    def get_frame(self, key):
+        import pyarrow as pa
+
+        path = self._frame_path(key)
+        try:
+            self._touch(path)
+        except FileNotFoundError:
+            # frames Arrow could not represent are kept pickled in the object store
+            return self.get_object(f"frame:{key}")
+        source = pa.memory_map(str(path), "r")
+        table = pa.ipc.open_file(source).read_all()
+        df = table.to_pandas(split_blocks=True)
+        # pyarrow-backed pandas columns (e.g. bit-packed booleans) are wrapped again without a copy
+        arrow_backed = [f.name for f in table.schema if f.metadata and f.metadata.get(ARROW_BACKED_KEY)]
+        if arrow_backed:
+            import pandas as pd
+
+            df = df.assign(**{name: pd.arrays.ArrowExtensionArray(table.column(name)) for name in arrow_backed})
+        return df
+
+    def put_frame(self, key, df):
+        import pyarrow as pa
+
+        try:
+            table = _frame_to_table(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+            self.put_object(f"frame:{key}", df)
+            return
+        path = self._frame_path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.frames_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self._maybe_evict(keep=path.name)
+
+    def get_object(self, key):
+        row = self._db().execute("SELECT value, used FROM kv WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if row[1] is None or now - row[1] > TOUCH_SECONDS:
+            with self._db() as db:
+                db.execute("UPDATE kv SET used = ? WHERE key = ?", (now, key))
+        return pickle.loads(row[0])
+
+    def put_object(self, key, value):
+        now = time.time()
+        with self._db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO kv (key, value, created, used) VALUES (?, ?, ?, ?)",
+                (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), now, now),
+            )
+        self._maybe_evict(keep=key)
+
+    def _touch(self, path):
+        # the mtime of a frame file is its last-used time
+        now = time.time()
+        if now - path.stat().st_mtime > TOUCH_SECONDS:
+            os.utime(path, (now, now))
+
+    def entries(self):
+        # [(last_used, bytes, kind, name)] oldest first; kind is "frame" (file name) or "object" (key)
+        entries = []
+        for path in self.frames_dir.glob("*.arrow"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, "frame", path.name))
+        rows = self._db().execute("SELECT key, LENGTH(value), COALESCE(used, created, 0) FROM kv")
+        entries += [(used, size, "object", key) for key, size, used in rows]
+        return sorted(entries)
+
+    def size(self):
+        return sum(n for _, n, _, _ in self.entries())
+
+    def _maybe_evict(self, keep):
+        now = time.monotonic()
+        if self._last_evict is None or now - self._last_evict >= EVICT_SECONDS:
+            self._last_evict = now
+            self.evict(keep=keep)
+
+    def evict(self, keep=None):
+        # removes least recently used entries until the cache fits its budget; one worker at a time
+        with self.lock("cache:evict"):
+            entries = self.entries()
+            total = sum(n for _, n, _, _ in entries)
+            stale = []
+            for _, n, kind, name in entries:
+                if total <= self.budget_bytes:
+                    break
+                if name == keep:
+                    continue
+                stale.append((kind, name))
+                total -= n
+            for kind, name in stale:
+                if kind == "frame":
+                    # unlinking is safe for workers that still have the frame mapped
+                    (self.frames_dir / name).unlink(missing_ok=True)
+            with self._db() as db:
+                db.executemany("DELETE FROM kv WHERE key = ?", [(name,) for kind, name in stale if kind == "object"])
+
+    def clear(self):
+        # unlinking is safe for workers that still have a frame mapped
+        for path in self.frames_dir.glob("*.arrow"):
+            path.unlink(missing_ok=True)
+        with self._db() as db:
+            db.execute("DELETE FROM kv")
+
+    @contextmanager
+    def lock(self, key):
+        with self._thread_locks.lock(key):
+            if fcntl is None:
+                yield
+                return
+            with open(self.locks_dir / f"{_digest(key)}.lock", "w") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _frame_to_table(df):
+    import pyarrow as pa
+
+    import pandas as pd
+
+    # keep NaN as a float value instead of an Arrow null so numeric columns map back zero-copy
+    arrays, fields = [], []
+    for name in df.columns:
+        col = df[name]
+        if col.dtype.kind == "f":
+            array = pa.array(col.to_numpy(), from_pandas=False)
+        else:
+            array = pa.array(col, from_pandas=True)
+        metadata = {ARROW_BACKED_KEY: b"1"} if isinstance(col.dtype, pd.ArrowDtype) else None
+        arrays.append(array)
+        fields.append(pa.field(str(name), array.type, metadata=metadata))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _pyarrow_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            kind = os.environ.get("WAGE_CACHE_BACKEND", "host" if _pyarrow_available() else "process")
+            if kind == "host":
+                budget = float(os.environ.get("WAGE_CACHE_BUDGET_MB", DEFAULT_BUDGET_MB))
+                _backend = HostCacheBackend(os.environ.get("WAGE_CACHE_DIR", DEFAULT_CACHE_DIR), int(budget * 1024 ** 2))
+            elif kind == "process":
+                _backend = ProcessCacheBackend()
+            else:
+                raise ValueError(f"Unknown WAGE_CACHE_BACKEND: {kind!r} (expected 'host' or 'process')")
+        return _backend
+
+
+def file_key(prefix, path):
+    # keys for local files change whenever the file is rewritten
+    stat = Path(path).stat()
+    return f"{prefix}:{Path(path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
@@ -0,0 +1,232 @@
+"""Precomputed SOC hierarchy roll-up cube (major -> minor -> broad -> detailed).
+
+Only detailed occupations are aggregated, so no employment is counted twice. Rows are
+identified by the GROUP column where the release has one and by the SOC code pattern otherwise
+(XX-0000 major, XX-YY00 minor, XX-YYY0 broad, anything else detailed). A few minor groups only
+use one digit (29-1000 covers 29-1141); those are taken from the release's own minor-group rows.
+
+The cube is built in one sorted pass: detailed cells are sorted by (year, STATE, OCC_CODE) once,
+and since truncating a code to its parent keeps that order, each coarser level is a
+np.add.reduceat over the level below it. Employment and employment-weighted means are additive
+and roll up that way; percentiles come from wage_app.percentiles, which combines the detailed
+cells' wage distributions for every group of a level in one batch. Drilling up or down reads
+precomputed rows and never goes back to the raw panel. An "All states" slice is rolled up the
+same way.
+"""
+import numpy as np
+import pandas as pd
+
+from wage_app.percentiles import combine_percentiles, percentile_columns
+
+# bump when the cube's contents change so cached cubes are rebuilt
+ROLLUP_VERSION = 3
+LEVELS = ("major", "minor", "broad", "detailed")
+ALL_STATES = "All states"
+MEAN_COLUMNS = ["A_MEAN", "H_MEAN"]
+WAGE_COLUMNS = ["A_MEAN"] + percentile_columns("A_") + ["H_MEAN"] + percentile_columns("H_")
+SOC_PATTERN = r"^\d{2}-\d{4}$"
+
+# 2018 SOC major group titles, used when a release has no major-group rows of its own
+MAJOR_GROUPS = {
+    "11-0000": "Management Occupations",
+    "13-0000": "Business and Financial Operations Occupations",
+    "15-0000": "Computer and Mathematical Occupations",
+    "17-0000": "Architecture and Engineering Occupations",
+    "19-0000": "Life, Physical, and Social Science Occupations",
+    "21-0000": "Community and Social Service Occupations",
+    "23-0000": "Legal Occupations",
+    "25-0000": "Educational Instruction and Library Occupations",
+    "27-0000": "Arts, Design, Entertainment, Sports, and Media Occupations",
+    "29-0000": "Healthcare Practitioners and Technical Occupations",
+    "31-0000": "Healthcare Support Occupations",
+    "33-0000": "Protective Service Occupations",
+    "35-0000": "Food Preparation and Serving Related Occupations",
+    "37-0000": "Building and Grounds Cleaning and Maintenance Occupations",
+    "39-0000": "Personal Care and Service Occupations",
+    "41-0000": "Sales and Related Occupations",
+    "43-0000": "Office and Administrative Support Occupations",
+    "45-0000": "Farming, Fishing, and Forestry Occupations",
+    "47-0000": "Construction and Extraction Occupations",
+    "49-0000": "Installation, Maintenance, and Repair Occupations",
+    "51-0000": "Production Occupations",
+    "53-0000": "Transportation and Material Moving Occupations",
+}
+
+
+def level_code(codes, level, minors=()):
+    # minors: minor-group codes the release publishes, to place codes under an XX-Y000 group
+    codes = pd.Series(codes, dtype="string")
+    if level == "major":
+        return codes.str[:2] + "-0000"
+    if level == "minor":
+        minor = codes.str[:5] + "00"
+        wide = codes.str[:4] + "000"
+        use_wide = ~minor.isin(minors) & wide.isin(minors)
+        return minor.where(~use_wide, wide)
+    if level == "broad":
+        return codes.str[:6] + "0"
+    return codes
+
+
+def parent_level(level):
+    idx = LEVELS.index(level)
+    return LEVELS[idx - 1] if idx > 0 else None
+
+
+def child_level(level):
+    idx = LEVELS.index(level)
+    return LEVELS[idx + 1] if idx + 1 < len(LEVELS) else None
+
+
+def soc_levels(panel):
+    codes = panel["OCC_CODE"].astype("string").str.strip()
+    guessed = pd.Series(
+        np.select(
+            [codes.str.endswith("0000"), codes.str.endswith("00"), codes.str.endswith("0")],
+            ["major", "minor", "broad"],
+            "detailed",
+        ),
+        index=panel.index,
+    )
+    if "GROUP" in panel.columns:
+        group = panel["GROUP"].astype("string").str.strip().str.lower().replace({"detail": "detailed"})
+        guessed = group.where(group.isin(LEVELS), guessed)
+    return guessed.where(codes.str.match(SOC_PATTERN).fillna(False).astype(bool))
+
+
+def detailed_cells(panel):
+    levels = soc_levels(panel)
+    emp = pd.to_numeric(panel["TOT_EMP"], errors="coerce")
+    cells = panel.loc[(levels == "detailed") & (emp > 0)]
+    cols = ["year", "STATE", "OCC_CODE", "TOT_EMP"] + [c for c in WAGE_COLUMNS if c in cells.columns]
+    cells = cells[cols].copy()
+    cells["OCC_CODE"] = cells["OCC_CODE"].astype("string").str.strip()
+    cells["TOT_EMP"] = pd.to_numeric(cells["TOT_EMP"], errors="coerce")
+    return cells
+
+
+def _sorted_cells(cells):
+    # detailed cells plus their national copies, sorted once by (year, STATE, OCC_CODE)
+    national = cells.assign(STATE=ALL_STATES)
+    cells = pd.concat([cells, national], ignore_index=True)
+    return cells.sort_values(["year", "STATE", "OCC_CODE"], kind="mergesort").reset_index(drop=True)
+
+
+def _cell_sums(cells, mean_cols):
+    # additive per-cell sums; means are rolled up as employment-weighted sums
+    emp = cells["TOT_EMP"].to_numpy(dtype=float)
+    sums = {"TOT_EMP": emp, "cells": np.ones(len(cells))}
+    for col in mean_cols:
+        values = cells[col].to_numpy(dtype=float)
+        ok = np.isfinite(values)
+        sums[f"{col}__w"] = np.where(ok, emp, 0.0)
+        sums[f"{col}__wx"] = np.where(ok, emp * values, 0.0)
+    return sums
+
+
+def _reduce(keys, sums, level, minors=()):
+    # returns the reduced keys and sums, plus the reduced row each input row went into
+    code = level_code(keys["OCC_CODE"], level, minors).to_numpy()
+    year = keys["year"].to_numpy()
+    state = keys["STATE"].to_numpy()
+    change = np.ones(len(keys), dtype=bool)
+    change[1:] = (code[1:] != code[:-1]) | (state[1:] != state[:-1]) | (year[1:] != year[:-1])
+    starts = np.flatnonzero(change)
+    reduced_keys = pd.DataFrame({"year": year[starts], "STATE": state[starts], "OCC_CODE": code[starts]})
+    reduced = {name: np.add.reduceat(values, starts) for name, values in sums.items()}
+    return reduced_keys, reduced, np.cumsum(change) - 1
+
+
+def _titles(panel):
+    latest = panel.dropna(subset=["OCC_CODE"]).sort_values("year", kind="mergesort")
+    latest = latest.drop_duplicates("OCC_CODE", keep="last")
+    titles = dict(MAJOR_GROUPS)
+    titles.update(zip(latest["OCC_CODE"].astype(str).str.strip(), latest["OCC_TITLE"]))
+    return titles
+
+
+def build_rollup(panel):
+    if panel.empty or "OCC_CODE" not in panel.columns:
+        return pd.DataFrame()
+    cells = _sorted_cells(detailed_cells(panel))
+    wage_cols = [c for c in WAGE_COLUMNS if c in cells.columns]
+    mean_cols = [c for c in MEAN_COLUMNS if c in cells.columns]
+    prefixes = [p for p in ("A_", "H_") if all(c in cells.columns for c in percentile_columns(p))]
+    emp = cells["TOT_EMP"].to_numpy(dtype=float)
+    pcts = {p: cells[percentile_columns(p)].to_numpy(dtype=float) for p in prefixes}
+    keys, sums = cells[["year", "STATE", "OCC_CODE"]], _cell_sums(cells, mean_cols)
+    cell_group = np.arange(len(cells))
+    codes = panel["OCC_CODE"].astype("string").str.strip()
+    minors = set(codes[soc_levels(panel) == "minor"].dropna())
+
+    frames = []
+    for level in reversed(LEVELS):
+        # sums are reduced from the level below, never from the raw rows
+        keys, sums, groups = _reduce(keys, sums, level, minors)
+        cell_group = groups[cell_group]
+        frame = keys.assign(level=level, **sums)
+        # percentiles are not additive: each level combines its detailed cells' distributions
+        for p in prefixes:
+            values = combine_percentiles(pcts[p], emp, cell_group, n_groups=len(keys))
+            frame[percentile_columns(p)] = values
+        parent = parent_level(level)
+        frame["parent"] = level_code(frame["OCC_CODE"], parent, minors).to_numpy() if parent else pd.NA
+        frames.append(frame)
+
+    cube = pd.concat(frames, ignore_index=True)
+    cube["OCC_TITLE"] = cube["OCC_CODE"].map(_titles(panel)).fillna(cube["OCC_CODE"])
+    cube["parent"] = cube["parent"].astype("string")
+    cube["cells"] = cube["cells"].astype("int64")
+    for col in mean_cols:
+        weight = cube.pop(f"{col}__w")
+        weighted = cube.pop(f"{col}__wx")
+        cube[col] = (weighted / weight).where(weight > 0)
+    cube["level"] = pd.Categorical(cube["level"], categories=LEVELS, ordered=True)
+    cube = cube.sort_values(["year", "STATE", "level", "OCC_CODE"], kind="mergesort").reset_index(drop=True)
+    cols = ["year", "STATE", "level", "OCC_CODE", "OCC_TITLE", "parent", "cells", "TOT_EMP"] + wage_cols
+    return cube[cols]
+
+
+class RollupCube:
+    # row-range lookups into the sorted cube frame
+    def __init__(self, cube):
+        self.frame = cube
+        self._spans = {}
+        if cube.empty:
+            return
+        year = cube["year"].to_numpy()
+        state = cube["STATE"].to_numpy()
+        level = cube["level"].cat.codes.to_numpy()
+        change = np.ones(len(cube), dtype=bool)
+        change[1:] = (year[1:] != year[:-1]) | (state[1:] != state[:-1]) | (level[1:] != level[:-1])
+        starts = np.flatnonzero(change)
+        stops = np.append(starts[1:], len(cube))
+        for a, b in zip(starts.tolist(), stops.tolist()):
+            self._spans[(int(year[a]), state[a], LEVELS[level[a]])] = (a, b)
+
+    @property
+    def years(self):
+        return sorted({year for year, _, _ in self._spans})
+
+    @property
+    def states(self):
+        return sorted({state for _, state, _ in self._spans} - {ALL_STATES})
+
+    def level(self, level, year, state=ALL_STATES):
+        span = self._spans.get((int(year), state, level))
+        if span is None:
+            return self.frame.iloc[0:0]
+        return self.frame.iloc[span[0]:span[1]]
+
+    def children(self, code, level, year, state=ALL_STATES):
+        below = child_level(level)
+        if below is None:
+            return self.frame.iloc[0:0]
+        rows = self.level(below, year, state)
+        return rows[rows["parent"] == code]
+
+    def series(self, code, level, state=ALL_STATES):
+        # one code across every year, e.g. for a trend of a major group
+        parts = [self.level(level, year, state) for year in self.years]
+        rows = pd.concat(parts, ignore_index=True) if parts else self.frame.iloc[0:0]
+        return rows[rows["OCC_CODE"] == code]
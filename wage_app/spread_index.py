@@ -0,0 +1,117 @@
+"""Cross-state pay spread for every occupation and year (research question 3).
+
+Built per cleaned year, from that year's A_MEDIAN across the states that publish it:
+
+- ranks: one row per (year, OCC_CODE, STATE) with the state's rank (1 = highest median) and its
+  gap to the occupation's median across states
+- summary: one row per (year, OCC_CODE) with the number of states, lowest and highest paying
+  state, mean, coefficient of variation (std / mean) and the max / min ratio
+
+Each year is an independent partition in the shared cache, keyed by that year's file, so adding
+or re-cleaning a year only builds that year. SpreadIndex concatenates the partitions and maps
+every occupation to its row positions once, so a lookup is a slice instead of a scan.
+"""
+import numpy as np
+import pandas as pd
+
+# bump when the partition columns change so cached partitions are rebuilt
+SPREAD_VERSION = 1
+VALUE = "A_MEDIAN"
+
+
+def state_cells(df):
+    # one A_MEDIAN per (OCC_CODE, STATE); duplicate rows are averaged
+    if df.empty or not {"STATE", "OCC_CODE", VALUE}.issubset(df.columns):
+        return pd.DataFrame(columns=["OCC_CODE", "STATE", "OCC_TITLE", VALUE])
+    data = pd.DataFrame({
+        "OCC_CODE": df["OCC_CODE"].astype("string").str.strip(),
+        "STATE": df["STATE"].astype("string").str.strip(),
+        "OCC_TITLE": df["OCC_TITLE"].astype("string") if "OCC_TITLE" in df.columns else pd.NA,
+        VALUE: pd.to_numeric(df[VALUE], errors="coerce"),
+    }).dropna(subset=["OCC_CODE", "STATE", VALUE])
+    return (
+        data.groupby(["OCC_CODE", "STATE"], sort=False)
+        .agg(OCC_TITLE=("OCC_TITLE", "first"), **{VALUE: (VALUE, "mean")})
+        .reset_index()
+    )
+
+
+def year_ranks(df, year):
+    cells = state_cells(df).sort_values(["OCC_CODE", VALUE], ascending=[True, False], kind="mergesort")
+    by = cells.groupby("OCC_CODE", sort=False)[VALUE]
+    cells["rank"] = by.rank(ascending=False, method="min").astype("int32")
+    cells["n_states"] = by.transform("size").astype("int32")
+    cells["vs_median_pct"] = (cells[VALUE] / by.transform("median") - 1) * 100
+    cells.insert(0, "year", int(year))
+    return cells.reset_index(drop=True)
+
+
+def year_summary(ranks):
+    if ranks.empty:
+        return pd.DataFrame()
+    by = ranks.groupby("OCC_CODE", sort=False)
+    values = by[VALUE]
+    # ranks are sorted by value within each occupation: first row = highest, last = lowest
+    top, bottom = by.head(1).set_index("OCC_CODE"), by.tail(1).set_index("OCC_CODE")
+    summary = pd.DataFrame({
+        "year": ranks["year"].iloc[0],
+        "OCC_TITLE": top["OCC_TITLE"],
+        "n_states": values.size(),
+        "min_state": bottom["STATE"],
+        "min_value": bottom[VALUE],
+        "max_state": top["STATE"],
+        "max_value": top[VALUE],
+        "median": values.median(),
+        "mean": values.mean(),
+        "std": values.std(ddof=0),
+    })
+    summary["cv"] = summary["std"] / summary["mean"]
+    summary["max_min_ratio"] = summary["max_value"] / summary["min_value"]
+    return summary.reset_index()
+
+
+class SpreadIndex:
+    def __init__(self, ranks, summary):
+        self.ranks = ranks.sort_values(["OCC_CODE", "year", "rank"], kind="mergesort").reset_index(drop=True)
+        self.summary = summary.sort_values(["OCC_CODE", "year"], kind="mergesort").reset_index(drop=True)
+        self.years = sorted(int(y) for y in self.summary["year"].unique()) if not summary.empty else []
+        self._rank_rows = self._spans(self.ranks)
+        self._summary_rows = self._spans(self.summary)
+        latest = self.summary.drop_duplicates("OCC_CODE", keep="last")
+        self.titles = dict(zip(latest["OCC_CODE"], latest["OCC_TITLE"].fillna(latest["OCC_CODE"])))
+
+    @staticmethod
+    def _spans(frame):
+        # OCC_CODE -> (start, stop) row range in a frame sorted by OCC_CODE
+        if frame.empty:
+            return {}
+        codes = frame["OCC_CODE"].to_numpy()
+        starts = np.flatnonzero(np.append(True, codes[1:] != codes[:-1]))
+        stops = np.append(starts[1:], len(codes))
+        return {codes[a]: (a, b) for a, b in zip(starts.tolist(), stops.tolist())}
+
+    def history(self, code):
+        # summary rows of one occupation, one per year
+        a, b = self._summary_rows.get(code, (0, 0))
+        return self.summary.iloc[a:b]
+
+    def states(self, code, year=None):
+        # every state's median and rank for one occupation (optionally one year)
+        a, b = self._rank_rows.get(code, (0, 0))
+        rows = self.ranks.iloc[a:b]
+        return rows[rows["year"].to_numpy() == int(year)] if year is not None else rows
+
+    def widest(self, year, n=20, min_states=10):
+        rows = self.summary[(self.summary["year"] == int(year)) & (self.summary["n_states"] >= min_states)]
+        return rows.nlargest(n, "cv")
+
+    def compare(self, code, home, target):
+        # what-if: target state's median against the home state's, per year where both publish
+        rows = self.states(code)
+        cols = ["year", VALUE, "rank", "n_states"]
+        out = rows.loc[rows["STATE"] == home, cols].merge(
+            rows.loc[rows["STATE"] == target, cols[:3]], on="year", suffixes=("_home", "_target")
+        )
+        out["difference"] = out[f"{VALUE}_target"] - out[f"{VALUE}_home"]
+        out["difference_pct"] = (out[f"{VALUE}_target"] / out[f"{VALUE}_home"] - 1) * 100
+        return out.reset_index(drop=True)
@@ -0,0 +1,19 @@
+"""One module per sidebar tab; app.py imports a tab's module only when it is selected."""
+
+TAB_MODULES = {
+    "Introduction": "wage_app.tabs.introduction",
+    "Proposal Overview": "wage_app.tabs.proposal",
+    "PDF Overview": "wage_app.tabs.pdf_overview",
+    "Uncleaned Data overview": "wage_app.tabs.uncleaned_data",
+    "Data Exploration": "wage_app.tabs.data_exploration",
+    "Occupation Search": "wage_app.tabs.search",
+    "Occupation Groups": "wage_app.tabs.occupation_groups",
+    "State Comparison": "wage_app.tabs.state_comparison",
+    "Forecasts": "wage_app.tabs.forecasts",
+    "Export": "wage_app.tabs.export",
+    "Memory Footprint": "wage_app.tabs.memory_footprint",
+    "Models Implemented": "wage_app.tabs.models",
+    "Inspection and reflection": "wage_app.tabs.inspection",
+    "Conclusion": "wage_app.tabs.conclusion",
+    "Team": "wage_app.tabs.team",
+}
@@ -0,0 +1,364 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from wage_app import remote
+from wage_app.anomalies import FLAG_NAMES, flag_counts, mask_for
+from wage_app.engine import Query, default_engine
+from wage_app.engine import corr as engine_corr
+from wage_app.etl import COLUMN_ALIAS
+from wage_app.loaders import (
+    cleaned_year_files, data_version, load_csv_local, load_remote_year, neighbour_years, remote_years, year_flags,
+    year_prefetcher,
+)
+from wage_app.render_modes import adaptive_scatter, mode_caption, render_mode_for, zoom_controls
+
+# columns the charts below use; with the Parquet layout only these are fetched by default
+REMOTE_COLUMNS = ["STATE", "OCC_CODE", "OCC_TITLE", "GROUP", "TOT_EMP", "H_MEAN", "H_MEDIAN", "A_MEAN", "A_MEDIAN"]
+
+
+def _field_descriptions(cleaned_dir=None):
+    # local file if present (resolving its LFS pointer), otherwise the GitHub copy
+    st.markdown("### Field descriptions")
+    field_desc_local = cleaned_dir / "field_descriptions.csv" if cleaned_dir else None
+    if field_desc_local and field_desc_local.exists():
+        try:
+            if remote.is_lfs_pointer(field_desc_local):
+                field_desc_local = remote.resolve_pointer(field_desc_local)
+            fdesc = pd.read_csv(field_desc_local)
+            st.dataframe(fdesc, use_container_width=True)
+        except Exception as e:
+            st.warning(f"Could not read local field_descriptions.csv: {e}")
+    else:
+        try:
+            fdesc = pd.read_csv(remote.fetch_file(f"{remote.REMOTE_CLEANED_DIR}/field_descriptions.csv"))
+            st.dataframe(fdesc, use_container_width=True)
+            st.markdown(f"[Open field_descriptions.csv on GitHub]({remote.raw_url(remote.REMOTE_CLEANED_DIR + '/field_descriptions.csv')})")
+        except Exception:
+            st.info("field_descriptions.csv not found locally or on GitHub.")
+
+
+def _explore(df, selected_year, available_years, load_year):
+    # summary statistics, similarity to the previous year and charts for one loaded year;
+    # load_year(year) returns the frame for another year (or an exception)
+    st.markdown("## Summary statistics")
+    num = df.select_dtypes(include=[np.number])
+    if not num.empty:
+        stats = pd.DataFrame({
+            "mean": num.mean(),
+            "median": num.median(),
+            "variance": num.var(),
+            "std": num.std(),
+            "skewness": num.skew(),
+            "count": num.count()
+        })
+        st.dataframe(stats.round(4), use_container_width=True)
+    else:
+        st.info("No numeric columns available for summary statistics.")
+
+    st.markdown("## Data similarity & integration")
+    # if there are other available cleaned years, compare to the previous year if present
+    similarity_msg = "No comparison data available."
+    if available_years and selected_year in available_years:
+        idx = available_years.index(selected_year)
+        if idx < len(available_years) - 1:
+            prev_year = available_years[idx + 1]
+            prev_df = None
+            try:
+                prev_df = load_year(prev_year)
+            except Exception:
+                prev_df = None
+            if isinstance(prev_df, pd.DataFrame):
+                # compare numeric column means (intersection)
+                n1 = df.select_dtypes(include=[np.number])
+                n2 = prev_df.select_dtypes(include=[np.number])
+                common = n1.columns.intersection(n2.columns)
+                if len(common) >= 1:
+                    v1 = n1[common].mean().fillna(0)
+                    v2 = n2[common].mean().fillna(0)
+                    # Pearson correlation between mean vectors
+                    corr = v1.corr(v2)
+                    jaccard = len(set(df.columns).intersection(set(prev_df.columns))) / len(set(df.columns).union(set(prev_df.columns)))
+                    st.write(f"Compared to previous available year: {prev_year}")
+                    st.write(f"- Pearson correlation of numeric-column means: {corr:.4f}")
+                    st.write(f"- Column-name Jaccard similarity: {jaccard:.4f}")
+                else:
+                    st.info("No common numeric columns to compare with previous year.")
+            else:
+                st.info("Previous year file could not be loaded for comparison.")
+        else:
+            st.info("No earlier cleaned year available for comparison.")
+    else:
+        st.info(similarity_msg)
+
+    st.markdown("---")
+    st.markdown("## Visualizations")
+    engine = default_engine()
+    st.caption(f"Aggregations run on the {engine} engine.")
+
+    # 1) Heatmap of correlations
+    try:
+        if not num.empty:
+            corr = engine_corr(num, engine)
+            fig = px.imshow(
+                corr,
+                text_auto=True,
+                color_continuous_scale="RdBu_r",
+                title="Feature Correlation Heatmap"
+            )
+            fig.update_layout(height=800, margin=dict(l=40, r=40, t=80, b=40))
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No numeric columns to compute correlations.")
+    except Exception as e:
+        st.warning(f"Could not create correlation heatmap: {e}")
+
+    # 2) Pie chart for STATE vs number of rows
+    try:
+        if "STATE" in df.columns:
+            state_counts = (
+                Query(df).fill_null("STATE", "Unknown").group_by("STATE").agg(count=("size",)).sort("count").collect(engine)
+            )
+            fig = px.pie(
+                names=state_counts["STATE"],
+                values=state_counts["count"],
+                title="Distribution of rows by STATE"
+            )
+            fig.update_traces(textposition="inside", textinfo="percent+label")
+            fig.update_layout(height=700, margin=dict(l=40, r=40, t=80, b=40))
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Column 'STATE' not found for pie chart.")
+    except Exception as e:
+        st.warning(f"Could not create state pie chart: {e}")
+
+    # 3) Stacked bar chart of OCC_TITLE vs count stacked by STATE (top N OCC_TITLE)
+    try:
+        if "OCC_TITLE" in df.columns and "STATE" in df.columns:
+            top_n = 10
+            occ_counts = Query(df).group_by("OCC_TITLE").agg(count=("size",)).sort("count").head(top_n).collect(engine)
+            top_occs = occ_counts["OCC_TITLE"].tolist()
+            pivot = (
+                Query(df)
+                .where("OCC_TITLE", "in", top_occs)
+                .group_by("OCC_TITLE", "STATE")
+                .agg(count=("size",))
+                .collect(engine)
+            )
+            fig = px.bar(
+                pivot,
+                x="OCC_TITLE",
+                y="count",
+                color="STATE",
+                title=f"Top {top_n} OCC_TITLE counts stacked by STATE"
+            )
+            fig.update_layout(barmode="stack", xaxis={'categoryorder': 'total descending'}, height=800, margin=dict(l=60, r=40, t=80, b=200))
+            fig.update_xaxes(tickangle=-45)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Columns 'OCC_TITLE' and/or 'STATE' missing for stacked bar.")
+    except Exception as e:
+        st.warning(f"Could not create stacked bar chart: {e}")
+
+    # 4) Bubble chart (updated): OCC_TITLE on x, STATE on y, bubble size = TOT_EMP, color = H_MEDIAN
+    try:
+        needed = {"OCC_TITLE", "STATE", "TOT_EMP", "H_MEDIAN"}
+        if needed.issubset(set(df.columns)):
+            # limit to top occupations by total employment to avoid clutter
+            top = Query(df).group_by("OCC_TITLE").agg(TOT_EMP=("TOT_EMP", "sum")).sort("TOT_EMP").head(30).collect(engine)
+            top_occs = top["OCC_TITLE"].tolist()
+
+            # aggregate by occupation + state
+            agg = (
+                Query(df)
+                .where("OCC_TITLE", "in", top_occs)
+                .group_by("OCC_TITLE", "STATE")
+                .agg(TOT_EMP=("TOT_EMP", "sum"), H_MEDIAN=("H_MEDIAN", "mean"))
+                .collect(engine)
+            )
+
+            fig = px.scatter(
+                agg,
+                x="OCC_TITLE",
+                y="STATE",
+                size="TOT_EMP",
+                color="H_MEDIAN",
+                hover_name="OCC_TITLE",
+                title="OCC_TITLE vs STATE — bubble size = TOT_EMP, color = H_MEDIAN",
+                size_max=120,
+                render_mode=render_mode_for(len(agg), numeric=False),
+            )
+            fig.update_layout(height=1300, margin=dict(l=60, r=40, t=80, b=200))
+            fig.update_xaxes(tickangle=-45, automargin=True)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Columns 'OCC_TITLE', 'STATE', 'TOT_EMP', and 'H_MEDIAN' are required for this bubble chart.")
+    except Exception as e:
+        st.warning(f"Could not create bubble chart: {e}")
+
+    # 5) Employment vs annual mean wage over every row of the year (adaptive SVG / WebGL / density bins)
+    try:
+        if {"TOT_EMP", "A_MEAN"}.issubset(set(df.columns)):
+            st.markdown("### Employment vs annual mean wage (all rows)")
+            window = zoom_controls(df, "TOT_EMP", "A_MEAN", key=f"emp_wage_{selected_year}")
+            hover = {"hover_name": "OCC_TITLE"} if "OCC_TITLE" in df.columns else {}
+            fig, mode = adaptive_scatter(
+                window, "TOT_EMP", "A_MEAN",
+                title=f"TOT_EMP vs A_MEAN — {selected_year}",
+                opacity=0.5, **hover,
+            )
+            fig.update_layout(height=600, margin=dict(l=60, r=40, t=80, b=60))
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption(mode_caption(mode, len(window), len(df)))
+        else:
+            st.info("Columns 'TOT_EMP' and 'A_MEAN' are required for the employment vs wage scatter.")
+    except Exception as e:
+        st.warning(f"Could not create employment vs wage scatter: {e}")
+    st.markdown("---")
+
+
+def _remote_sha(entry):
+    return entry["parquet"]["sha"] if "parquet" in entry else entry["csv"]["sha"]
+
+
+def _fetch_caption(stats):
+    if not stats:
+        return "Served from this host's cache."
+    if stats["layout"] == "csv":
+        return f"LFS object ({stats['file_size'] / 1e6:.1f} MB) downloaded once and cached on disk."
+    return (
+        f"Fetched {stats['bytes_fetched'] / 1e3:,.0f} KB of {stats['file_size'] / 1e3:,.0f} KB in "
+        f"{stats['requests']} range requests ({stats['row_groups']} row groups)."
+    )
+
+
+def _github_source():
+    try:
+        year_entries = remote_years()
+    except Exception as e:
+        st.error(f"Could not list cleaned_data on GitHub: {e}")
+        return
+    if not year_entries:
+        st.info("No data_<year> files found in cleaned_data/ on GitHub.")
+        return
+    years = sorted(year_entries, reverse=True)
+    selected_year = st.selectbox("Select year", years, index=0, key="github_year")
+    entry = year_entries[selected_year]
+    sha = _remote_sha(entry)
+
+    columns = states = None
+    try:
+        if "parquet" in entry:
+            st.caption("This year is published as Parquet: only the chosen columns and states are downloaded.")
+            columns = tuple(st.multiselect("Columns to fetch", list(COLUMN_ALIAS), default=REMOTE_COLUMNS))
+            # the STATE column alone is a few KB and gives the state choices
+            state_df, _ = load_remote_year(selected_year, sha, ("STATE",))
+            states = tuple(st.multiselect("States (empty = all)", sorted(state_df["STATE"].dropna().unique())))
+        else:
+            st.caption("Only the Git LFS CSV is published for this year; it is downloaded once and cached on disk.")
+        df, stats = load_remote_year(selected_year, sha, columns or None, states or None)
+    except Exception as e:
+        st.error(f"Error fetching {selected_year} from GitHub: {e}")
+        return
+    st.caption(_fetch_caption(stats))
+    st.write(f"Rows: {df.shape[0]} — Columns: {df.shape[1]}")
+    st.dataframe(df, use_container_width=True)
+    item = entry.get("csv") or entry["parquet"]
+    st.markdown(f"[Open {item['path']} on GitHub]({remote.media_url(item['path'])})")
+
+    _field_descriptions()
+    _explore(df, selected_year, years, lambda y: load_remote_year(y, _remote_sha(year_entries[y]), columns or None, states or None)[0])
+
+
+def render():
+    st.title("Data Exploration (Source - https://www.bls.gov/oes/tables.htm )")
+
+    source = st.selectbox("Data source", ["Local", "GitHub"], index=0)
+    owner = "Soorej30"
+    repo = "wage_analysis"
+    branch = "main"
+
+    # Local listing
+    if source == "Local":
+        cleaned_dir = Path("cleaned_data")
+        if not cleaned_dir.exists():
+            st.warning(f"cleaned_data folder not found: {cleaned_dir.resolve()}")
+        else:
+            year_files = cleaned_year_files(cleaned_dir)
+
+            if not year_files:
+                st.info("No data_<year>.csv files found in cleaned_data/.")
+            else:
+                years = sorted(year_files.keys(), reverse=True)
+                selected_year = st.selectbox("Select year", years, index=0)
+                chosen_path = year_files[selected_year]
+                st.write(f"Showing cleaned data for year {selected_year} — {chosen_path.name}")
+
+                # warm the previous-year comparison and adjacent years in the background
+                year_prefetcher().schedule([year_files[y] for y in neighbour_years(years, selected_year)])
+
+                df = None
+                df_or_err = load_csv_local(chosen_path)
+                if isinstance(df_or_err, Exception):
+                    st.error(f"Error reading CSV file: {df_or_err}")
+                else:
+                    df = df_or_err
+                    if st.checkbox("Filter rows by data quality flags", value=False):
+                        flags = year_flags(data_version(cleaned_dir), selected_year, len(df))
+                        if flags is None:
+                            st.info("Quality flags are not available for this year.")
+                        else:
+                            st.dataframe(flag_counts(flags), use_container_width=True)
+                            hide = st.multiselect("Hide rows flagged as", list(FLAG_NAMES.values()))
+                            if hide:
+                                df = df[(flags & mask_for(hide)) == 0]
+                    st.write(f"Rows: {df.shape[0]} — Columns: {df.shape[1]}")
+                    st.dataframe(df, use_container_width=True)
+                    download_path = remote.resolve_pointer(chosen_path) if remote.is_lfs_pointer(chosen_path) else chosen_path
+                    with open(download_path, "rb") as f:
+                        st.download_button("Download this CSV file", f.read(), file_name=chosen_path.name)
+
+                _field_descriptions(cleaned_dir)
+                if df is not None:
+                    _explore(df, selected_year, years, lambda y: load_csv_local(year_files[y]))
+    else:
+        _github_source()
+
+    st.markdown("## Additional Graphs")
+    st.markdown("The following figures are from `images/Graphs` and provide extra perspective on employment and wage patterns.")
+
+    graph_entries = [
+        ("Emp_cnt_vs_year.png", "It looks like the number of jobs have steadily increased except for the drop in 2009 (Probably because of the great recession) and the next drop in 2020 (Probably during Covid 19 time)."),
+        ("occ_Vs_emp_cnt.png", "Office and Administrative support has the most number of employees, followed by Food preparation and serving related occupations."),
+        ("heatmap.png", "The correlation heatmap is as expected. The regions with high correlation is expected since the percentile values are usually correlated."),
+        ("state_vs_emp_cnt.png", "California and New York are highest employees, as expected since they have the most jobs."),
+        ("wage_box_plot.png", "The Hourly median wage is slightly higher for detailed group compared to major group."),
+
+        ("emp_vs_year.png", "The Total employees in detailed group increased after 2011."),
+        ("stateVsEmp_tree.png", "This shows the different occupation counts across different states and different sizes showing different population count. This shows the trend we observed earlier. California usually has the highest population count in most categories."),
+        ("wageVsEmp_Scatter.png", "Scatter plot of wage versus employment to inspect relationships between pay levels and job volume. We can see the trend of increasing median hourly salary as the year increases."),
+        ("wageVsState_Violin.png", "Violin plot of wage distributions by state, capturing spread and density of pay values.The wage distribution for each state is similar as expected."),
+        ("meadian_hourly_QQ.png", "Q-Q plot for median hourly wages to assess how closely wages follow a normal distribution. Both the Q-Q plots show skeweness."),
+    ]
+
+    graphs_dir = Path("images/Graphs")
+    for image_name, explanation in graph_entries:
+        local_image_path = graphs_dir / image_name
+        github_image_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/images/Graphs/{image_name}"
+        st.image(str(local_image_path) if local_image_path.exists() else github_image_url, caption=image_name, use_container_width=True)
+        st.write(explanation)
+        st.markdown("")
+
+
+    st.info("""
+        Reflection: The occupational wage dataset appears to have wide variation in column availability across years and many missing values for some categorical indicators (e.g., GROUP, ANNUAL, HOURLY). \n
+        Duplicated OCC_CODE rows are present in many files but titles are largely consistent where duplicates occur. \n
+        Numeric distributions differ between years for some variables (see numeric_similarity).\n
+        Small sample sizes in some cells reduce reliability of distributional comparisons. \n
+        Potential biases include - undercoverage of small occupations or geographic areas, reporting artifacts due to changes in survey design or coding across years, and rounding conventions. \n
+        These limitations mean downstream analyses (e.g., trend estimation or pay-gap studies) should carefully filter for comparable fields/years, consider sample sizes, and propagate uncertainty. \n
+        Sensitive use: avoid overinterpreting small subgroups and be transparent about missingness and cleaning steps.    \n
+    """)
@@ -0,0 +1,71 @@
+import os
+
+import streamlit as st
+
+from wage_app.anomalies import FLAG_NAMES, mask_for
+from wage_app.export import FORMATS, SpooledExport, export_filename, spool_export
+from wage_app.loaders import data_version, panel_store, search_index
+
+# st.download_button reads the whole file into memory, so larger exports go through the API
+MAX_DOWNLOAD_BYTES = 200_000_000
+
+
+def render():
+    st.title("Export Data")
+    st.write(
+        "Download any slice of the cleaned data across years. Exports are generated in chunks, "
+        "so even all years at once stay light on memory. CSV is gzip-compressed; Parquet is smaller and keeps column types."
+    )
+
+    version = data_version()
+    store = panel_store(version)
+    if store.panel.empty:
+        st.info("No data_<year>.csv files found in cleaned_data/.")
+        return
+
+    years = st.multiselect("Years (empty = all)", store.years)
+    states = st.multiselect("States (empty = all)", sorted(store.states.tolist()))
+    titles = search_index(version).titles
+    occ_codes = st.multiselect(
+        "Occupations (empty = all)", sorted(titles, key=lambda c: str(titles[c])),
+        format_func=lambda c: f"{titles[c]} ({c})",
+    )
+    columns = st.multiselect("Columns (empty = all)", store.columns)
+    hide = st.multiselect("Leave out rows flagged as", list(FLAG_NAMES.values()))
+    fmt = st.radio("Format", list(FORMATS), horizontal=True)
+
+    # a prepared file is only offered for the filters it was made from
+    filters = (version, tuple(years), tuple(states), tuple(occ_codes), tuple(columns), tuple(hide), fmt)
+    prepared = st.session_state.get("export_file")
+    if prepared is not None and prepared.filters != filters:
+        prepared.discard()
+        del st.session_state["export_file"]
+
+    rows = store.rows(
+        years=years or None, states=states or None, occ_codes=occ_codes or None, exclude_flags=mask_for(hide),
+    )
+    st.caption(f"{len(rows):,} rows × {len(columns or store.columns)} columns selected")
+    if not len(rows):
+        return
+
+    if st.button("Prepare download"):
+        previous = st.session_state.pop("export_file", None)
+        if previous is not None:
+            previous.discard()
+        with st.spinner("Writing export..."):
+            path, size = spool_export(store, rows, columns or None, fmt)
+        prepared = SpooledExport(path, size, export_filename(fmt, years), FORMATS[fmt][0], filters)
+        if size > MAX_DOWNLOAD_BYTES:
+            prepared.discard()
+            st.warning(
+                f"This export is {size / 1e6:,.0f} MB, more than the {MAX_DOWNLOAD_BYTES / 1e6:,.0f} MB the download "
+                "button can hold. Narrow the filters, or stream it from the query API's /export endpoint."
+            )
+        else:
+            st.session_state["export_file"] = prepared
+
+    prepared = st.session_state.get("export_file")
+    if prepared is not None and os.path.exists(prepared.path):
+        st.write(f"{prepared.name} — {prepared.size / 1e6:.1f} MB")
+        with open(prepared.path, "rb") as f:
+            st.download_button("Download export", f, file_name=prepared.name, mime=prepared.mime)
@@ -0,0 +1,59 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from wage_app.loaders import data_version, forecasts, search_index
+
+
+def render():
+    st.title("Wage Forecasts")
+    st.write(
+        "Next-year mean annual wage (A_MEAN) for every state and occupation, from a damped-trend "
+        "model fitted to each series' full history. Shaded bands are 80% and 95% prediction intervals."
+    )
+
+    version = data_version()
+    frame, check = forecasts(version)
+    if frame.empty:
+        st.info("Not enough cleaned years to forecast.")
+        return
+
+    if check:
+        st.caption(
+            f"Backtest on {check['year']} ({check['series']:,} series): median error "
+            f"{check['model_mdape']:.1f}% vs {check['naive_mdape']:.1f}% for last year's value; "
+            f"{check['coverage_80']:.0f}% of actuals inside the 80% interval."
+        )
+
+    occupations = frame.drop_duplicates("OCC_CODE").sort_values("OCC_TITLE")
+    labels = dict(zip(occupations["OCC_CODE"], occupations["OCC_TITLE"].fillna(occupations["OCC_CODE"])))
+    col1, col2 = st.columns(2)
+    with col1:
+        code = st.selectbox("Occupation", list(labels), format_func=lambda c: f"{labels[c]} ({c})")
+    rows = frame[frame["OCC_CODE"] == code]
+    with col2:
+        state = st.selectbox("State", sorted(rows["STATE"].unique()))
+    row = rows[rows["STATE"] == state].iloc[0]
+
+    history = search_index(version).rows(code, state)
+    history = history.dropna(subset=["A_MEAN"]) if "A_MEAN" in history.columns else history.iloc[0:0]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=history["year"], y=history["A_MEAN"], mode="lines+markers", name="A_MEAN"))
+    year = int(row["forecast_year"])
+    for low, high, name in (("lower_95", "upper_95", "95% interval"), ("lower_80", "upper_80", "80% interval")):
+        fig.add_trace(go.Scatter(
+            x=[year, year], y=[row[low], row[high]], mode="lines", name=name,
+            line=dict(width=14 if name.startswith("80") else 6),
+        ))
+    fig.add_trace(go.Scatter(x=[year], y=[row["forecast"]], mode="markers", name="Forecast", marker=dict(size=12, symbol="diamond")))
+    fig.update_layout(title=f"{labels[code]} in {state}", xaxis_title="Year", yaxis_title="Mean annual wage ($)")
+    st.plotly_chart(fig, use_container_width=True)
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric(f"{year} forecast", f"${row['forecast']:,.0f}", f"{row['growth_pct']:+.1f}%")
+    c2.metric("80% interval", f"${row['lower_80']:,.0f} – ${row['upper_80']:,.0f}")
+    c3.metric("Model", f"α={row['alpha']:.1f} β={row['beta']:.1f} φ={row['phi']:.2f}")
+
+    st.subheader(f"Largest projected changes in {state}")
+    in_state = frame[frame["STATE"] == state]
+    cols = ["OCC_CODE", "OCC_TITLE", "last_year", "last_value", "forecast", "lower_80", "upper_80", "growth_pct"]
+    st.dataframe(in_state.reindex(in_state["growth_pct"].abs().sort_values(ascending=False).index)[cols].head(20), use_container_width=True)
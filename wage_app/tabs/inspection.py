@@ -0,0 +1,119 @@
+import json
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from wage_app import remote
+from wage_app.loaders import fetch_url_bytes
+
+
+def render():
+    st.title("Inspection & Reflection")
+
+    reports_base = remote.raw_url("cleaned_data/reports")
+
+    @st.cache_data(show_spinner=False)
+    def load_json_github(raw_url):
+        return json.loads(fetch_url_bytes(raw_url, timeout=15))
+
+    @st.cache_data(show_spinner=False)
+    def load_text_github(raw_url):
+        return fetch_url_bytes(raw_url, timeout=15).decode("utf-8")
+
+    inspection = None
+    reflection_text = None
+
+    # Load inspection JSON from GitHub
+    try:
+        inspection = load_json_github(f"{reports_base}/consolidated_inspection.json")
+    except Exception as e:
+        st.error(f"Could not load consolidated_inspection.json from GitHub: {e}")
+        st.stop()
+
+    # Try JSON reflection first, fallback to TXT
+    try:
+        reflection_json = load_json_github(f"{reports_base}/consolidated_reflection.json")
+        reflection_text = json.dumps(reflection_json, indent=2)
+    except Exception:
+        try:
+            reflection_text = load_text_github(f"{reports_base}/consolidated_reflection.txt")
+        except Exception:
+            reflection_text = None
+
+    # years available
+    years = sorted(inspection.get("per_year", {}).keys(), reverse=True)
+    if not years:
+        st.info("No per_year data found in consolidated_inspection.json")
+        st.stop()
+
+    st.sidebar.markdown("## Inspection controls")
+    selected_years = st.sidebar.multiselect("Select 1 or 2 years to inspect / compare", years, default=[years[0]])
+    if not selected_years:
+        st.info("Choose at least one year from the sidebar.")
+        st.stop()
+
+    with st.expander("Raw consolidated_inspection.json (preview)"):
+        st.json(inspection)
+
+    if reflection_text:
+        with st.expander("Reflection / notes"):
+            st.text(reflection_text)
+
+    def numeric_means_for_year(year):
+        ny = inspection["per_year"].get(year, {})
+        ns = ny.get("numeric_summary", {})
+        means = {}
+        for col, stats in ns.items():
+            m = stats.get("mean")
+            if m is not None:
+                try:
+                    means[col] = float(m)
+                except Exception:
+                    continue
+        return pd.Series(means, name=year)
+
+    if len(selected_years) == 1:
+        y = selected_years[0]
+        st.subheader(f"Summary for {y}")
+        per = inspection["per_year"].get(y, {})
+        st.write(f"Rows: {per.get('n_rows')} — Columns: {per.get('n_cols')}")
+        st.markdown("### Missingness (top keys)")
+        missing = per.get("missing_pct", {})
+        if missing:
+            miss_df = pd.Series(missing, name="missing_pct").sort_values(ascending=False).head(20)
+            st.dataframe(miss_df.to_frame(), use_container_width=True)
+        st.markdown("### Numeric means (top 20 by mean)")
+        s = numeric_means_for_year(y)
+        if not s.empty:
+            s_sorted = s.sort_values(ascending=False).head(20).to_frame("mean").round(3)
+            st.dataframe(s_sorted, use_container_width=True)
+            fig = px.bar(s_sorted.reset_index(), x="index", y="mean", title=f"Top numeric means — {y}")
+            fig.update_layout(height=500, xaxis_tickangle=-45)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No numeric summary for selected year.")
+
+    elif len(selected_years) == 2:
+        y1, y2 = selected_years
+        st.subheader(f"Comparison: {y1} vs {y2}")
+        s1 = numeric_means_for_year(y1)
+        s2 = numeric_means_for_year(y2)
+        common = s1.index.intersection(s2.index)
+        if len(common) == 0:
+            st.info("No common numeric columns to compare between the two years.")
+        else:
+            comp_df = pd.DataFrame({y1: s1[common], y2: s2[common]}).dropna()
+            st.markdown("### Means for common numeric columns (sample)")
+            st.dataframe(comp_df.round(3).sort_values(by=y1, ascending=False).head(50), use_container_width=True)
+
+            long = comp_df.reset_index().melt(id_vars="index", value_vars=[y1, y2], var_name="year", value_name="mean")
+            fig = px.bar(long, x="index", y="mean", color="year", barmode="group", title=f"Mean comparison — {y1} vs {y2}")
+            fig.update_layout(height=700, xaxis_tickangle=-45)
+            st.plotly_chart(fig, use_container_width=True)
+
+            try:
+                corr = comp_df[y1].corr(comp_df[y2])
+                st.write(f"Pearson correlation between mean vectors: {corr:.4f}")
+            except Exception:
+                st.info("Could not compute correlation between mean vectors.")
@@ -0,0 +1,59 @@
+import plotly.express as px
+import streamlit as st
+
+from wage_app.loaders import cleaned_year_files, data_version, panel_memory_report, year_memory_report
+from wage_app.memory import totals
+
+# the app should hold every cleaned year in RAM on a container of this size
+MEMORY_BUDGET = 1024 ** 3
+
+
+def _mb(n):
+    return f"{n / 1024 ** 2:,.1f} MB"
+
+
+def render():
+    st.title("Memory Footprint")
+    st.write(
+        "Cleaned years are kept in a compact layout: whole-number columns are downcast, repeated strings "
+        "(states, occupation codes and titles, groups) become categoricals, and the mostly empty ANNUAL / "
+        "HOURLY flags become bitmasks. Bytes before and after, per column."
+    )
+
+    files = cleaned_year_files()
+    if not files:
+        st.info("No data_<year>.csv files found in cleaned_data/.")
+        return
+
+    reports = {year: year_memory_report(path) for year, path in sorted(files.items())}
+    for year, report in reports.items():
+        if isinstance(report, Exception):
+            st.warning(f"Could not read {files[year].name}: {report}")
+    reports = {year: report for year, report in reports.items() if not isinstance(report, Exception)}
+    if not reports:
+        return
+
+    panel = panel_memory_report(data_version())
+    total = totals(panel)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("All years, as read", _mb(total["bytes_before"]))
+    c2.metric("All years, compact", _mb(total["bytes_after"]), f"-{total['saved_pct']:.0f}%", delta_color="inverse")
+    c3.metric("Share of a 1 GB container", f"{total['bytes_after'] / MEMORY_BUDGET * 100:.1f}%")
+    if total["bytes_after"] > MEMORY_BUDGET:
+        st.warning("The compact panel alone is larger than the 1 GB budget.")
+
+    st.subheader(f"Panel ({len(reports)} years stacked)")
+    st.dataframe(panel.sort_values("bytes_before", ascending=False), use_container_width=True)
+
+    per_year = []
+    for year, report in reports.items():
+        t = totals(report)
+        per_year.append({"year": year, "as read": t["bytes_before"] / 1024 ** 2, "compact": t["bytes_after"] / 1024 ** 2})
+    fig = px.bar(
+        per_year, x="year", y=["as read", "compact"], barmode="group",
+        labels={"value": "MB", "year": "Year", "variable": ""}, title="Memory per cleaned year",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    year = st.selectbox("Year", sorted(reports, reverse=True))
+    st.dataframe(reports[year], use_container_width=True)
@@ -0,0 +1,72 @@
+import plotly.express as px
+import streamlit as st
+
+from wage_app.loaders import data_version, rollup_cube
+from wage_app.soc_rollup import ALL_STATES, LEVELS, child_level
+
+MEASURES = {
+    "Mean annual wage": "A_MEAN",
+    "Median annual wage": "A_MEDIAN",
+    "Entry-level annual wage (10th percentile)": "A_PCT10",
+    "Top annual wage (90th percentile)": "A_PCT90",
+    "Mean hourly wage": "H_MEAN",
+    "Employment": "TOT_EMP",
+}
+
+
+def render():
+    st.title("Occupation Groups")
+    st.write(
+        "Employment-weighted wages rolled up the SOC hierarchy (major → minor → broad → detailed) "
+        "for every year and state. Pick a group to drill down into the groups it contains."
+    )
+
+    cube = rollup_cube(data_version())
+    if cube.frame.empty:
+        st.info("No data_<year>.csv files found in cleaned_data/.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        year = st.selectbox("Year", cube.years, index=len(cube.years) - 1)
+    with col2:
+        state = st.selectbox("State", [ALL_STATES] + cube.states)
+    with col3:
+        label = st.selectbox("Measure", list(MEASURES))
+    measure = MEASURES[label]
+
+    # drill-down path kept in session state: a list of (level, code) from major downwards
+    path = st.session_state.setdefault("soc_drill_path", [])
+    if path and st.button("Back up one level"):
+        path.pop()
+
+    if path:
+        level, code = path[-1]
+        rows = cube.children(code, level, year, state)
+        st.caption(" → ".join(f"{c} ({lvl})" for lvl, c in path))
+        shown_level = child_level(level)
+    else:
+        shown_level = LEVELS[0]
+        rows = cube.level(shown_level, year, state)
+
+    if rows.empty:
+        st.info("No groups at this level for the selected year and state.")
+        return
+
+    ordered = rows.sort_values(measure, ascending=True)
+    fig = px.bar(
+        ordered, x=measure, y="OCC_TITLE", orientation="h",
+        hover_data=["OCC_CODE", "TOT_EMP", "cells"],
+        labels={measure: label, "OCC_TITLE": f"{shown_level.title()} group"},
+        title=f"{label} by {shown_level} group — {state}, {year}",
+    )
+    fig.update_layout(height=max(350, 28 * len(ordered)))
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(rows.drop(columns=["year", "STATE"]), use_container_width=True)
+
+    if child_level(shown_level) is not None:
+        options = {code: f"{title} ({code})" for code, title in zip(rows["OCC_CODE"], rows["OCC_TITLE"])}
+        pick = st.selectbox("Drill into", [""] + list(options), format_func=lambda c: options.get(c, "—"))
+        if pick and st.button("Drill down"):
+            path.append((shown_level, pick))
+            st.rerun()
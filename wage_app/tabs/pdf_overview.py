@@ -0,0 +1,62 @@
+import urllib.parse
+
+import streamlit as st
+
+from wage_app import documents
+
+
+@st.cache_resource(show_spinner=False)
+def _document(file_version):
+    return documents.document_bytes()
+
+
+@st.cache_resource(show_spinner="Rendering page previews...")
+def _pages(doc_digest, scale, pages, _data):
+    return documents.page_images(_data, scale, pages)
+
+
+def _viewer():
+    viewer_url = f"https://docs.google.com/gview?url={urllib.parse.quote_plus(documents.PROPOSAL_PDF_URL)}&embedded=true"
+    st.components.v1.iframe(viewer_url, height=820)
+
+
+def render():
+    st.title("Our project overview")
+
+    local = documents.PROPOSAL_PDF
+    file_version = documents.shared_cache.file_key("pdf", local) if local.exists() else documents.PROPOSAL_PDF_URL
+    try:
+        pdf_bytes, source = _document(file_version)
+    except Exception as e:
+        st.error(f"Could not fetch PDF: {e}")
+        st.info("Place the proposal PDF in files/ or check that the GitHub copy is reachable.")
+        return
+
+    st.download_button("Download PDF", pdf_bytes, file_name=local.name, mime="application/pdf")
+    st.markdown(f"[Open PDF in a new tab]({documents.PROPOSAL_PDF_URL}) · served from the {source}")
+
+    if not documents.renderer_available():
+        _viewer()
+        return
+
+    import pypdfium2 as pdfium
+
+    doc_digest = documents.digest(pdf_bytes)
+    try:
+        thumbnails = _pages(doc_digest, documents.THUMBNAIL_SCALE, None, pdf_bytes)
+    except pdfium.PdfiumError as e:
+        # e.g. a Git LFS pointer checked out in place of the PDF
+        st.warning(f"Could not render page previews: {e}")
+        _viewer()
+        return
+    cols = st.columns(min(4, len(thumbnails)) or 1)
+    for index, png in enumerate(thumbnails):
+        with cols[index % len(cols)]:
+            st.image(png, caption=f"Page {index + 1}")
+
+    if len(thumbnails) > 1:
+        page = st.select_slider("Page", options=list(range(1, len(thumbnails) + 1)))
+    else:
+        page = 1
+    large = _pages(doc_digest, documents.PAGE_SCALE, (page - 1,), pdf_bytes)
+    st.image(large[0], caption=f"Page {page} of {len(thumbnails)}", use_container_width=True)
@@ -0,0 +1,37 @@
+import streamlit as st
+
+
+def render():
+    st.title("Project Scope & Research Questions")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.header("Scope Summary")
+        st.write("- **Goal:** Predict and explain wage variation using ML.")
+        st.write("- **Data:** ~800 occupations from the US BLS.")
+        st.write("- **Key Variables:** Industry Code, Location, and Wage Percentiles.")
+        st.write("- **Techniques:** Regression, Clustering, and EDA.")
+
+    with col2:
+        st.image("https://raw.githubusercontent.com/Soorej30/wage_analysis/aa3deedbafcedc549c97d4bfc18ff36b7840f2f2/images/flowchart.png", 
+                 caption="Project Methodology Workflow")
+
+    st.divider()
+    
+    st.header("Research Questions")
+    questions = [
+        "1. Does the total number of people working in a field have a correlation with the mean annual wage occupation-wise?",
+        "2. If we look at the data right now which five industries are paying the best median wage for people in entry level roles?",
+        "3. Do we see a massive swing in pay for the exact same job title just by looking at different state data?",
+        "4. Is there a statistically significant wage gap between 'Management' and 'Technical' roles within the same industry? ",
+        "5. Can we accurately predict the 90th percentile wage of an occupation based on its 10th percentile and industry code? ",
+        "6. Which geographic regions exhibit the highest 'wage-to-cost-of-living' ratio? ",
+        "7. Can clustering identify groups of occupations that are underpaid relative to their required education levels?",
+        "8. How has the wage gap between the 10th and 90th percentiles changed across the top 10 industries? ",
+        "9. To what extent does 'Industry Aggregation' obscure wage differences in specialized sub-roles?  ",
+        "10. Can we predict if an occupation belongs to a 'High Growth' category based solely on its current wage percentiles? "
+    ]
+
+    for q in questions:
+        st.write(q)
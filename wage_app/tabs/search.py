@@ -0,0 +1,54 @@
+import time
+
+import streamlit as st
+
+from wage_app.loaders import data_version, load_panel, search_index
+from wage_app.render_modes import adaptive_line
+
+
+def render():
+    st.title("Occupation Search")
+    st.write(
+        "Search every cleaned year at once by occupation title, SOC code or state, "
+        "e.g. *Software Developers in Texas* or *15-1252*. Misspellings are matched approximately."
+    )
+
+    version = data_version()
+    # a checkout with only LFS pointers loads no year at all offline: there are no columns to index
+    index = None if load_panel(version).empty else search_index(version)
+    if index is None or index.data.empty:
+        st.info("No data_<year>.csv files found in cleaned_data/.")
+        return
+
+    query = st.text_input("Search occupations", value="", placeholder="Software Developers in Texas")
+    if not query.strip():
+        return
+
+    started = time.perf_counter()
+    occupations, states = index.parse(query)
+    lookup_ms = (time.perf_counter() - started) * 1000
+    if not occupations and states:
+        occupations = index.occupations_in(states[0])
+        st.caption(f"{len(occupations)} occupations published in {states[0]} ({lookup_ms:.2f} ms)")
+    else:
+        st.caption(f"{len(occupations)} occupation matches in {lookup_ms:.2f} ms")
+    if not occupations:
+        st.info("No matching occupations.")
+        return
+
+    labels = {code: f"{title} ({code})" for code, title, _ in occupations}
+    code = st.selectbox("Occupation", list(labels), format_func=labels.get)
+    state_options = ["All states"] + sorted(index.rows(code)["STATE"].unique().tolist())
+    default_state = states[0] if states and states[0] in state_options else "All states"
+    state = st.selectbox("State", state_options, index=state_options.index(default_state))
+
+    rows = index.rows(code, None if state == "All states" else state)
+    years = sorted(rows["year"].unique().tolist())
+    if years:
+        st.caption(f"{len(rows):,} rows across {years[0]}–{years[-1]}")
+    st.dataframe(rows, use_container_width=True)
+
+    if state != "All states" and "A_MEAN" in rows.columns:
+        trend = rows.melt(id_vars="year", value_vars=[c for c in ("A_MEAN", "A_MEDIAN") if c in rows.columns], var_name="Measure", value_name="Annual wage")
+        fig = adaptive_line(trend, "year", "Annual wage", color="Measure", markers=True, title=f"{labels[code]} in {state}")
+        st.plotly_chart(fig, use_container_width=True)
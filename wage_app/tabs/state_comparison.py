@@ -0,0 +1,78 @@
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from wage_app.loaders import data_version, spread_index
+from wage_app.spread_index import VALUE
+
+
+def render():
+    st.title("State Comparison")
+    st.write(
+        "Does pay for the same job swing a lot across states? Median annual wage (A_MEDIAN) by state "
+        "for one occupation, read from a spread index precomputed for every occupation and year."
+    )
+
+    index = spread_index(data_version())
+    if not index.years:
+        st.info("No data_<year>.csv files with A_MEDIAN found in cleaned_data/.")
+        return
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        codes = sorted(index.titles, key=lambda c: str(index.titles[c]))
+        code = st.selectbox("Occupation", codes, format_func=lambda c: f"{index.titles[c]} ({c})")
+    history = index.history(code)
+    with col2:
+        year = st.selectbox("Year", history["year"].tolist()[::-1])
+    row = history[history["year"] == year].iloc[0]
+    states = index.states(code, year)
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("States reporting", int(row["n_states"]))
+    c2.metric("Lowest", f"${row['min_value']:,.0f}", row["min_state"], delta_color="off")
+    c3.metric("Highest", f"${row['max_value']:,.0f}", row["max_state"], delta_color="off")
+    c4.metric("Coefficient of variation", f"{row['cv'] * 100:.1f}%", f"{row['max_min_ratio']:.2f}× high / low", delta_color="off")
+
+    ordered = states.sort_values(VALUE)
+    fig = px.bar(
+        ordered, x=VALUE, y="STATE", orientation="h",
+        hover_data={"rank": True, "vs_median_pct": ":.1f"},
+        labels={VALUE: "Median annual wage ($)", "STATE": "State", "vs_median_pct": "% vs median state"},
+        title=f"{index.titles[code]} — {year}",
+    )
+    fig.add_vline(x=row["median"], line_dash="dash", annotation_text="median state")
+    fig.update_layout(height=max(400, 18 * len(ordered)), margin=dict(l=60, r=40, t=80, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+    fig = px.line(history, x="year", y="cv", markers=True, labels={"cv": "Coefficient of variation", "year": "Year"})
+    fig.update_layout(title="Spread across states over time", yaxis_tickformat=".0%")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("What if: the same job in another state")
+    names = ordered["STATE"].tolist()[::-1]
+    col1, col2 = st.columns(2)
+    with col1:
+        home = st.selectbox("Home state", names, index=len(names) - 1)
+    with col2:
+        target = st.selectbox("Compare with", names, index=0)
+    if home == target:
+        st.info("Pick two different states to compare.")
+    else:
+        pair = index.compare(code, home, target)
+        current = pair[pair["year"] == year]
+        if not current.empty:
+            r = current.iloc[0]
+            m1, m2, m3 = st.columns(3)
+            m1.metric(home, f"${r[f'{VALUE}_home']:,.0f}", f"rank {int(r['rank_home'])} of {int(r['n_states'])}", delta_color="off")
+            m2.metric(target, f"${r[f'{VALUE}_target']:,.0f}", f"rank {int(r['rank_target'])} of {int(r['n_states'])}", delta_color="off")
+            m3.metric("Difference", f"${r['difference']:+,.0f}", f"{r['difference_pct']:+.1f}%")
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=pair["year"], y=pair[f"{VALUE}_home"], mode="lines+markers", name=home))
+        fig.add_trace(go.Scatter(x=pair["year"], y=pair[f"{VALUE}_target"], mode="lines+markers", name=target))
+        fig.update_layout(title=f"{index.titles[code]}: {home} vs {target}", xaxis_title="Year", yaxis_title="Median annual wage ($)")
+        st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader(f"Occupations with the widest spread across states in {year}")
+    cols = ["OCC_CODE", "OCC_TITLE", "n_states", "min_state", "min_value", "max_state", "max_value", "cv", "max_min_ratio"]
+    st.dataframe(index.widest(year)[cols], use_container_width=True)
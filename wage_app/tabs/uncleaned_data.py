@@ -0,0 +1,78 @@
+import json
+import re
+
+import streamlit as st
+
+from wage_app import remote
+from wage_app.loaders import BRANCH, fetch_url_bytes, load_excel_github
+
+
+def render():
+    st.title("Our data overview")
+
+
+    base_path = "data"
+
+    @st.cache_data(show_spinner=False)
+    def github_list(path):
+        url = f"{remote.api_base()}/contents/{path}?ref={BRANCH}"
+        return json.loads(fetch_url_bytes(url, timeout=10))
+
+    try:
+        root = github_list(base_path)
+    except Exception as e:
+        st.error(f"Could not list GitHub data/ folder: {e}")
+        st.info("Check repo/branch and network access.")
+        root = []
+
+    year_files = {}
+    for item in root:
+        if item.get("type") != "dir":
+            continue
+        name = item.get("name", "")
+        m = re.search(r'oesm(\d+)st', name, re.IGNORECASE)
+        if not m:
+            continue
+        digits = m.group(1)
+        year = int(digits) if len(digits) > 2 else 2000 + int(digits)
+        try:
+            dir_contents = github_list(f"{base_path}/{name}")
+        except Exception:
+            dir_contents = []
+        files = [
+            {"name": f["name"], "path": f["path"]}
+            for f in dir_contents
+            if f.get("type") == "file"
+            and f["name"].lower().startswith("state_")
+            and f["name"].lower().endswith((".xls", ".xlsx"))
+        ]
+        if files:
+            year_files[str(year)] = sorted(files, key=lambda x: x["name"])
+
+    if not year_files:
+        st.info("No matching `oesm<number>st` subfolders with `state_*.xls*` files found on GitHub under data/.")
+    else:
+        years = sorted(year_files.keys(), reverse=True)
+        selected_year = st.selectbox("Select year (GitHub)", years, index=0)
+        files_for_year = year_files[selected_year]
+
+        if len(files_for_year) > 1:
+            names = [f["name"] for f in files_for_year]
+            chosen_name = st.selectbox("Choose file", names, index=0)
+            file_obj = next(f for f in files_for_year if f["name"] == chosen_name)
+        else:
+            file_obj = files_for_year[0]
+
+        raw_url = remote.raw_url(file_obj["path"])
+        st.write(f"Showing GitHub file for year {selected_year} — {file_obj['name']}")
+        st.markdown(f"[Open raw file in new tab]({raw_url})")
+
+        try:
+            df = load_excel_github(raw_url)
+            st.write(f"Rows: {df.shape[0]} — Columns: {df.shape[1]}")
+            st.dataframe(df, use_container_width=True)
+            # provide download button for convenience
+            st.download_button("Download this XLS file", fetch_url_bytes(raw_url, timeout=20), file_name=file_obj["name"])
+        except Exception as e:
+            st.error(f"Could not load Excel from GitHub: {e}")
+            st.info("You can open the raw file link above.")
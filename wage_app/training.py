@@ -0,0 +1,249 @@
+"""Fits the model grids of notebooks/models.ipynb on the cleaned panel, through the artifact store.
+
+build_features() rebuilds the notebook's modelling table:
+- wage gaps are filled with the state mean, then the occupation mean
+- five yearly lags of every numeric column are joined per (STATE, OCC_CODE)
+- rows without a complete history are dropped
+- text columns are label-encoded
+- a fixed 120,000-row sample is drawn
+
+Each model family has a fit function that takes one parameter set and returns (model, metrics),
+using the metric names of the Models tab.
+
+train() walks the grid listed on the Models tab and skips every fit whose artifact key is already
+stored. The features are built only when something is missing. scikit-learn and mlxtend are
+optional: families whose library is missing are skipped, and the tab still shows whatever was
+fitted elsewhere.
+
+    python -m wage_app.training            # fit whatever is missing for the current cleaned_data
+"""
+import argparse
+import importlib.util
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from wage_app import artifacts, loaders
+
+TARGET = "A_MEAN"
+WAGE_COLUMNS = [
+    "H_MEAN", "H_PCT10", "H_PCT25", "H_MEDIAN", "H_PCT75", "H_PCT90",
+    "A_MEAN", "A_PCT10", "A_PCT25", "A_MEDIAN", "A_PCT75", "A_PCT90",
+]
+LAG_COLUMNS = [
+    "A_MEAN", "A_MEDIAN", "A_PCT10", "A_PCT25", "A_PCT75", "A_PCT90", "EMP_PRSE",
+    "H_MEAN", "H_MEDIAN", "H_PCT10", "H_PCT25", "H_PCT75", "H_PCT90", "MEAN_PRSE", "TOT_EMP",
+]
+LAGS = 5
+KEYS = ["STATE", "OCC_CODE", "year"]
+CODED = ["AREA", "ST", "OCC_CODE", "GROUP"]
+MODEL_PARAMETERS = CODED + [f"{col}_prev_{lag}y" for col in LAG_COLUMNS for lag in range(1, LAGS + 1)]
+FEATURES = MODEL_PARAMETERS + ["year"]
+CLUSTER_FEATURES = ["A_MEAN_prev_1y", "A_MEAN_prev_2y", "H_MEAN_prev_1y", "TOT_EMP_prev_1y", "EMP_PRSE_prev_1y", "MEAN_PRSE_prev_1y"]
+SAMPLE_ROWS = 120_000
+CLUSTER_ROWS = 25_000
+SEED = 42
+TEST_SIZE = 0.2
+BANDS = ["low", "mid_low", "mid_high", "high"]
+
+
+def build_features(panel):
+    cols = list(dict.fromkeys(c for c in CODED + KEYS + WAGE_COLUMNS + LAG_COLUMNS if c in panel.columns))
+    df = panel[cols].copy()
+    df["STATE"] = df["STATE"].astype(str).str.strip()
+    df["OCC_CODE"] = df["OCC_CODE"].astype(str).str.strip()
+    df["year"] = df["year"].astype("int64")
+    for col in WAGE_COLUMNS + LAG_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64") if col in df.columns else np.nan
+    for col in WAGE_COLUMNS:
+        df[col] = df[col].fillna(df.groupby("STATE")[col].transform("mean"))
+        df[col] = df[col].fillna(df.groupby("OCC_CODE")[col].transform("mean"))
+    df = df.dropna(subset=[c for c in CODED if c in df.columns])
+
+    # one history row per key (the notebook's merge would repeat rows for duplicated keys);
+    # lags are joined one year at a time and incomplete rows dropped early to keep the table small
+    history = df.drop_duplicates(KEYS).set_index(KEYS)[LAG_COLUMNS].astype("float32")
+    for lag in range(1, LAGS + 1):
+        index = pd.MultiIndex.from_arrays([df["STATE"], df["OCC_CODE"], df["year"] - lag])
+        lagged = history.reindex(index)
+        lagged.columns = [f"{col}_prev_{lag}y" for col in LAG_COLUMNS]
+        lagged.index = df.index
+        df = pd.concat([df, lagged], axis=1).dropna(subset=list(lagged.columns))
+
+    for col in CODED:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            # LabelEncoder order: sorted distinct values
+            df[col] = pd.factorize(df[col].astype(str), sort=True)[0]
+    model_df = df[FEATURES + [TARGET]].dropna()
+    return model_df.sample(min(SAMPLE_ROWS, len(model_df)), random_state=SEED).reset_index(drop=True)
+
+
+def fit_random_forest(sample, params):
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import mean_squared_error, r2_score
+    from sklearn.model_selection import train_test_split
+
+    X_train, X_test, y_train, y_test = train_test_split(sample[FEATURES], sample[TARGET], test_size=TEST_SIZE, random_state=SEED)
+    model = RandomForestRegressor(random_state=SEED, n_jobs=-1, **params).fit(X_train, y_train)
+    preds = model.predict(X_test)
+    mse = mean_squared_error(y_test, preds)
+    return model, {"RMSE": float(np.sqrt(mse)), "MSE": float(mse), "R2": float(r2_score(y_test, preds))}
+
+
+def fit_decision_tree(sample, params):
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, roc_auc_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import label_binarize
+    from sklearn.tree import DecisionTreeClassifier
+
+    y_band = pd.qcut(sample[TARGET], q=4, labels=BANDS, duplicates="drop")
+    X_train, X_test, y_train, y_test = train_test_split(
+        sample[FEATURES], y_band, test_size=TEST_SIZE, random_state=SEED, stratify=y_band
+    )
+    model = DecisionTreeClassifier(random_state=SEED, **params).fit(X_train, y_train)
+    preds = model.predict(X_test)
+    proba = pd.DataFrame(model.predict_proba(X_test), columns=model.classes_)[BANDS].to_numpy()
+    return model, {
+        "Accuracy": float(accuracy_score(y_test, preds)),
+        "Precision": float(precision_score(y_test, preds, average="weighted", zero_division=0)),
+        "Recall": float(recall_score(y_test, preds, average="weighted", zero_division=0)),
+        "F1-score": float(f1_score(y_test, preds, average="weighted", zero_division=0)),
+        "ROC-AUC": float(roc_auc_score(label_binarize(y_test, classes=BANDS), proba, average="weighted", multi_class="ovr")),
+    }
+
+
+def fit_kmeans(sample, params):
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import davies_bouldin_score, silhouette_score
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    data = sample[CLUSTER_FEATURES + [TARGET]].dropna()
+    data = data.sample(min(CLUSTER_ROWS, len(data)), random_state=SEED)
+    model = make_pipeline(StandardScaler(), KMeans(**params))
+    labels = model.fit_predict(data[CLUSTER_FEATURES])
+    scaled = model[0].transform(data[CLUSTER_FEATURES])
+    return model, {
+        "Silhouette Score": float(silhouette_score(scaled, labels)),
+        "Davies-Bouldin Index": float(davies_bouldin_score(scaled, labels)),
+        "Average Target Std": float(data[TARGET].groupby(labels).mean().std()),
+    }
+
+
+def fit_fpgrowth(sample, params):
+    from mlxtend.frequent_patterns import association_rules, fpgrowth
+
+    data = sample[["ST", "GROUP", TARGET, "TOT_EMP_prev_1y", "H_MEAN_prev_1y"]].dropna()
+    basket = pd.DataFrame({
+        "high_pay": pd.qcut(data[TARGET], q=4, labels=False, duplicates="drop").eq(3),
+        "large_emp": pd.qcut(data["TOT_EMP_prev_1y"], q=4, labels=False, duplicates="drop").eq(3),
+        "high_hist_hourly": pd.qcut(data["H_MEAN_prev_1y"], q=4, labels=False, duplicates="drop").eq(3),
+    })
+    for state in data["ST"].value_counts().head(8).index:
+        basket[f"STATE_{state}"] = data["ST"].eq(state)
+    for group in data["GROUP"].value_counts().head(5).index:
+        basket[f"GROUP_{group}"] = data["GROUP"].eq(group)
+
+    itemsets = fpgrowth(basket.astype(bool), min_support=params["min_support"], use_colnames=True)
+    rules = association_rules(itemsets, metric=params["metric"], min_threshold=params["min_threshold"])
+    rules = rules[rules["consequents"].apply(lambda s: "high_pay" in s)].sort_values(["lift", "confidence"], ascending=False)
+    rules = rules[["antecedents", "consequents", "support", "confidence", "lift"]].reset_index(drop=True)
+    best = rules.iloc[0] if len(rules) else None
+    return rules, {
+        "Support": float(best["support"]) if best is not None else None,
+        "Confidence": float(best["confidence"]) if best is not None else None,
+        "Lift": float(best["lift"]) if best is not None else None,
+        "Rule Count": int(len(rules)),
+    }
+
+
+# model name on the Models tab -> (fit function, library it needs)
+FAMILIES = {
+    "Random Forest Regressor": (fit_random_forest, "sklearn"),
+    "Decision Tree Classifier": (fit_decision_tree, "sklearn"),
+    "K-Means": (fit_kmeans, "sklearn"),
+    "FP-Growth": (fit_fpgrowth, "mlxtend"),
+}
+
+
+PACKAGES = {"sklearn": "scikit-learn", "mlxtend": "mlxtend"}
+
+
+def missing_libraries():
+    # pip names of the libraries that are not installed
+    return sorted({PACKAGES[lib] for _, lib in FAMILIES.values() if importlib.util.find_spec(lib) is None})
+
+
+def feature_code():
+    # the feature code and every setting it reads, so editing either re-keys all fits
+    settings = json.dumps([TARGET, WAGE_COLUMNS, LAG_COLUMNS, LAGS, FEATURES, SAMPLE_ROWS, CLUSTER_ROWS, SEED, TEST_SIZE, BANDS])
+    return artifacts.code_hash(build_features) + settings
+
+
+def model_grid():
+    from wage_app.tabs.models import MODELS_IMPLEMENTED
+
+    return [(m["name"], params) for m in MODELS_IMPLEMENTED if m["name"] in FAMILIES for params in m["parameters"]["candidate_grid"]]
+
+
+def plan(cleaned_dir=loaders.CLEANED_DIR):
+    """One run per (model, parameter set) with the artifact key for the current cleaned files."""
+    partitions = {year: artifacts.partition_hash(path) for year, path in sorted(loaders.cleaned_year_files(cleaned_dir).items())}
+    features = feature_code()
+    runs = []
+    for name, params in model_grid():
+        fit, _ = FAMILIES[name]
+        code = [features, artifacts.code_hash(fit)]
+        runs.append({"model": name, "params": params, "key": artifacts.artifact_key(name, params, partitions, code), "partitions": partitions})
+    return runs
+
+
+def train(runs=None, store=None, progress=None):
+    """Fits every run whose key is not stored yet; returns {"fitted": n, "reused": n, "skipped": [model names]}."""
+    runs = plan() if runs is None else runs
+    store = store or artifacts.get_store()
+    missing = {lib for lib in PACKAGES if importlib.util.find_spec(lib) is None}
+    summary = {"fitted": 0, "reused": 0, "skipped": []}
+    sample = None
+
+    for i, run in enumerate(runs):
+        fit, lib = FAMILIES[run["model"]]
+        if lib in missing:
+            summary["skipped"].append(run["model"])
+            continue
+
+        def build(run=run, fit=fit):
+            nonlocal sample
+            if sample is None:
+                sample = build_features(loaders.load_panel(loaders.data_version()))
+            start = time.perf_counter()
+            model, metrics = fit(sample, run["params"])
+            return model, {
+                "model": run["model"], "params": run["params"], "metrics": metrics,
+                "partitions": run["partitions"], "rows": len(sample),
+                "fit_seconds": round(time.perf_counter() - start, 3), "fitted_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+        _, fitted = store.fit(run["key"], build)
+        summary["fitted" if fitted else "reused"] += 1
+        if progress:
+            progress(i + 1, len(runs), run, fitted)
+    return summary
+
+
+def main(argv=None):
+    argparse.ArgumentParser(description="Fit the Models tab grids that are not in the artifact store yet.").parse_args(argv)
+
+    def report(done, total, run, fitted):
+        print(f"[{done}/{total}] {run['model']} {json.dumps(run['params'])}: {'fitted' if fitted else 'unchanged, reused'}")
+
+    summary = train(progress=report)
+    if summary["skipped"]:
+        print(f"skipped {len(summary['skipped'])} runs; install {', '.join(missing_libraries())} to fit them")
+    print(f"{summary['fitted']} fitted, {summary['reused']} reused")
+
+
+if __name__ == "__main__":
+    main()